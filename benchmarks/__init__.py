@@ -0,0 +1,8 @@
+'''
+Benchmarks of the client hot paths.
+
+benchmarks.suite runs scenarios over the synthetic venues of benchmarks.venue, served by the in-process
+openreview.fake_server, and writes their throughput, peak RSS and request counts to a JSON file that can be
+compared with the results of another version. The scripts edges.py, subdomains.py and conflicts.py are
+standalone micro-benchmarks.
+'''
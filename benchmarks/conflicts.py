@@ -0,0 +1,120 @@
+'''
+Benchmark of the conflict detection used by Matching._build_note_conflicts.
+
+Builds a synthetic venue with N submissions and M committee members and compares the pairwise
+set intersection loop with the inverted index in openreview.tools.ConflictIndex. The pairwise loop is
+timed on a sample of the submissions and extrapolated, running it on the whole venue takes hours.
+
+Usage:
+
+    python benchmarks/conflicts.py --submissions 10000 --reviewers 10000 --workers 4
+'''
+
+import argparse
+import random
+import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openreview
+
+def build_profile(profile_id, rng, n_institutions, n_publications):
+    institution = rng.randrange(n_institutions)
+    return openreview.Profile(
+        id=profile_id,
+        content={
+            'emails': [f'{profile_id[1:].lower()}@cs.university{institution}.edu', f'{profile_id[1:].lower()}@gmail.com'],
+            'history': [{
+                'position': 'Professor',
+                'start': 2015,
+                'end': None,
+                'institution': { 'domain': f'university{institution}.edu' }
+            }],
+            'relations': [{ 'username': f'~Relation_Person{rng.randrange(100000)}', 'relation': 'Coauthor', 'end': None } for _ in range(rng.randrange(4))],
+            'publications': [openreview.api.Note(id=f'paper{rng.randrange(n_publications)}', pdate=1600000000000) for _ in range(rng.randrange(12))]
+        }
+    )
+
+def build_venue(n_submissions, n_reviewers, seed=1234):
+    rng = random.Random(seed)
+    n_institutions = 3000
+    n_publications = 500000
+    reviewers = [build_profile(f'~Reviewer_Person{i}', rng, n_institutions, n_publications) for i in range(n_reviewers)]
+    authors = [build_profile(f'~Author_Person{i}', rng, n_institutions, n_publications) for i in range(n_submissions * 2)]
+    submissions = [[author.id for author in rng.sample(authors, 4)] for _ in range(n_submissions)]
+    return submissions, reviewers, { author.id: author for author in authors }
+
+def pairwise_conflicts(authors_info, users_info):
+    author_ids = set()
+    author_domains = set()
+    author_emails = set()
+    author_relations = set()
+    author_publications = set()
+    for author_info in authors_info:
+        author_ids.add(author_info['id'])
+        author_domains.update(author_info['domains'])
+        author_emails.update(author_info['emails'])
+        author_relations.update(author_info['relations'])
+        author_publications.update(author_info['publications'])
+
+    conflicted = []
+    for user_info in users_info:
+        conflicts = set()
+        conflicts.update(author_domains.intersection(user_info['domains']))
+        conflicts.update(author_relations.intersection(user_info['emails']))
+        conflicts.update(author_relations.intersection([user_info['id']]))
+        conflicts.update(author_emails.intersection(user_info['relations']))
+        conflicts.update(author_ids.intersection(user_info['relations']))
+        conflicts.update(author_emails.intersection(user_info['emails']))
+        conflicts.update(author_publications.intersection(user_info['publications']))
+        if conflicts:
+            conflicted.append(user_info['id'])
+    return conflicted
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--submissions', type=int, default=10000)
+    parser.add_argument('--reviewers', type=int, default=10000)
+    parser.add_argument('--sample', type=int, default=100, help='Number of submissions used to time the pairwise loop')
+    parser.add_argument('--workers', type=int, default=None, help='Number of processes used by tools.search_conflicts')
+    args = parser.parse_args()
+
+    submissions, reviewers, author_by_id = build_venue(args.submissions, args.reviewers)
+    info_function = openreview.tools.info_function_builder(openreview.tools.get_profile_info)
+    users_info = [info_function(p) for p in reviewers]
+    author_info_by_id = { author_id: info_function(profile) for author_id, profile in author_by_id.items() }
+
+    start = time.perf_counter()
+    index = openreview.tools.ConflictIndex(users_info)
+    index_build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index_edges = []
+    for authorids in submissions:
+        index_edges.append([info['id'] for info in index.find([author_info_by_id[a] for a in authorids])])
+    index_time = time.perf_counter() - start
+
+    sample = min(args.sample, len(submissions))
+    start = time.perf_counter()
+    for position, authorids in enumerate(submissions[:sample]):
+        expected = pairwise_conflicts([author_info_by_id[a] for a in authorids], users_info)
+        assert expected == index_edges[position], f'Conflicts differ for submission {position}'
+    pairwise_time = (time.perf_counter() - start) * len(submissions) / sample
+
+    print(f'submissions: {len(submissions)}, reviewers: {len(users_info)}, conflict edges: {sum(len(e) for e in index_edges)}')
+    print(f'pairwise loop (extrapolated from {sample} submissions): {pairwise_time:.1f}s')
+    print(f'inverted index: build {index_build:.2f}s, search {index_time:.2f}s')
+    print(f'speedup: {pairwise_time / (index_build + index_time):.0f}x')
+
+    if args.workers:
+        authors_info_list = [[author_info_by_id[a] for a in authorids] for authorids in submissions]
+        start = time.perf_counter()
+        positions = openreview.tools.search_conflicts(users_info, authors_info_list, workers=args.workers)
+        workers_time = time.perf_counter() - start
+        assert [[users_info[p]['id'] for p in submission_positions] for submission_positions in positions] == index_edges
+        print(f'search_conflicts with {args.workers} workers: {workers_time:.2f}s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+'''
+Memory benchmark of the edges built by Matching._build_note_scores.
+
+Builds the score edges of a synthetic venue with the dict-backed Edge used before, the __slots__
+openreview.api.Edge and the columnar openreview.api.EdgeBatch, and measures the memory allocated
+for each one with tracemalloc. Building 10M Edge objects needs more memory than most machines have,
+so the Edge objects are measured on a sample and extrapolated, the EdgeBatch is built with all the edges.
+
+Usage:
+
+    python benchmarks/edges.py --edges 10000000 --sample 500000
+'''
+
+import argparse
+import time
+import tracemalloc
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openreview
+
+class LegacyEdge(object):
+    def __init__(self, head, tail, invitation, domain=None, readers=None, writers=None, signatures=None, id=None, weight=None, label=None, cdate=None, ddate=None, nonreaders=None, tcdate=None, tmdate=None, tddate=None, tauthor=None):
+        self.id = id
+        self.invitation = invitation
+        self.domain = domain
+        self.head = head
+        self.tail = tail
+        self.weight = weight
+        self.label = label
+        self.cdate = cdate
+        self.ddate = ddate
+        self.readers = readers
+        self.nonreaders = nonreaders
+        self.writers = writers
+        self.signatures = signatures
+        self.tcdate = tcdate
+        self.tmdate = tmdate
+        self.tddate = tddate
+        self.tauthor = tauthor
+
+def score_rows(n_edges, n_reviewers=20000):
+    papers = [f'paper{i:07d}' for i in range(n_edges // n_reviewers + 1)]
+    reviewers = [f'~Reviewer_Person{i}' for i in range(n_reviewers)]
+    for i in range(n_edges):
+        yield papers[i // n_reviewers], reviewers[i % n_reviewers], (i % 1000) / 1000
+
+def measure(build, n_edges):
+    tracemalloc.start()
+    start = time.perf_counter()
+    edges = build(n_edges)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return edges, current, elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--edges', type=int, default=10000000)
+    parser.add_argument('--sample', type=int, default=500000, help='Number of Edge objects measured and extrapolated to --edges')
+    args = parser.parse_args()
+
+    venue_id = 'Venue.cc/2025/Conference'
+    invitation_id = f'{venue_id}/Reviewers/-/Affinity_Score'
+    readers = [venue_id, f'{venue_id}/Senior_Area_Chairs', f'{venue_id}/Area_Chairs']
+
+    def build_edges(edge_class):
+        return lambda n_edges: [edge_class(invitation=invitation_id, head=head, tail=tail, weight=weight, readers=readers + [tail], writers=[venue_id], signatures=[venue_id]) for head, tail, weight in score_rows(n_edges)]
+
+    def build_batch(n_edges):
+        batch = openreview.api.EdgeBatch(invitation=invitation_id, readers=readers + [openreview.api.EdgeBatch.TAIL], writers=[venue_id], signatures=[venue_id])
+        for head, tail, weight in score_rows(n_edges):
+            batch.append(head, tail, weight=weight)
+        return batch
+
+    sample = min(args.sample, args.edges)
+    scale = args.edges / sample
+    print(f'edges: {args.edges}, Edge objects measured on {sample} edges')
+
+    legacy_edges, legacy_memory, legacy_time = measure(build_edges(LegacyEdge), sample)
+    del legacy_edges
+    print(f'dict Edge:  {legacy_memory * scale / 2**20:9.0f} MiB, {legacy_time * scale:6.1f}s')
+
+    edges, slots_memory, slots_time = measure(build_edges(openreview.api.Edge), sample)
+    print(f'slots Edge: {slots_memory * scale / 2**20:9.0f} MiB, {slots_time * scale:6.1f}s')
+
+    batch, batch_memory, batch_time = measure(build_batch, args.edges)
+    print(f'EdgeBatch:  {batch_memory / 2**20:9.0f} MiB, {batch_time:6.1f}s')
+    print(f'memory reduction: slots {legacy_memory / slots_memory:.1f}x, EdgeBatch {legacy_memory * scale / batch_memory:.1f}x')
+
+    start = time.perf_counter()
+    expected = [edge.to_json() for edge in edges[:50000]]
+    edges_serialization = time.perf_counter() - start
+    start = time.perf_counter()
+    payload = batch[:50000].to_json()
+    batch_serialization = time.perf_counter() - start
+    assert payload == expected
+    print(f'bulk payload of 50000 edges: Edge.to_json {edges_serialization:.2f}s, EdgeBatch.to_json {batch_serialization:.2f}s')
+
+if __name__ == '__main__':
+    main()
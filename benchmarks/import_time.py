@@ -0,0 +1,84 @@
+'''
+Benchmark of the time taken by `import openreview`.
+
+Every sample imports openreview in a new interpreter. The time of importing the third party packages that openreview.openreview
+and openreview.tools always need (requests, jwt and tqdm) is measured the same way and subtracted, so the overhead of openreview
+itself can be compared across machines. The benchmark fails if the median overhead is above --max-overhead-ms or if
+`import openreview` loads a module that should only be imported when it is used.
+
+Usage:
+
+    python benchmarks/import_time.py --samples 20 --max-overhead-ms 60
+'''
+
+import argparse
+import json
+import statistics
+import subprocess
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+## Modules that are imported the first time one of their names is used
+LAZY_MODULES = [
+    'openreview.api',
+    'openreview.arr',
+    'openreview.conference',
+    'openreview.journal',
+    'openreview.profile',
+    'openreview.stages',
+    'openreview.venue',
+    'openreview.venue_request',
+    'openreview.agora',
+    'pylatexenc',
+    'tld',
+    'Crypto'
+]
+
+SAMPLE = '''
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {modules}
+elapsed = time.perf_counter() - start
+print(json.dumps({{ 'seconds': elapsed, 'modules': sorted(sys.modules) }}))
+'''
+
+def sample(modules):
+    output = subprocess.run([sys.executable, '-c', SAMPLE.format(root=ROOT, modules=modules)], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--samples', type=int, default=10)
+    parser.add_argument('--max-overhead-ms', type=float, default=60, help='Max median time of import openreview minus the time of its required packages')
+    args = parser.parse_args()
+
+    ## The first sample of each import writes the bytecode caches
+    sample('requests, jwt, tqdm')
+    sample('openreview')
+
+    ## The samples are interleaved so a change of the load of the machine affects both imports
+    dependencies_samples = []
+    openreview_samples = []
+    for _ in range(args.samples):
+        dependencies_samples.append(sample('requests, jwt, tqdm'))
+        openreview_samples.append(sample('openreview'))
+
+    dependencies_ms = statistics.median(result['seconds'] for result in dependencies_samples) * 1000
+    openreview_ms = statistics.median(result['seconds'] for result in openreview_samples) * 1000
+    overhead_ms = openreview_ms - dependencies_ms
+    modules = openreview_samples[-1]['modules']
+
+    print(f'import requests, jwt, tqdm: {dependencies_ms:.1f}ms')
+    print(f'import openreview: {openreview_ms:.1f}ms, overhead {overhead_ms:.1f}ms (max {args.max_overhead_ms:.1f}ms)')
+
+    loaded = [module for module in LAZY_MODULES if module in modules]
+    if loaded:
+        print(f'import openreview loaded modules that should be lazy: {", ".join(loaded)}')
+    if loaded or overhead_ms > args.max_overhead_ms:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+'''
+Benchmark of the requests made to load the publications of the profiles of a venue.
+
+Loads the publications of the reviewers of a synthetic venue with openreview.tools.get_publications and with the request
+pattern used before, where get_all_notes was called for every profile in one pass over API v1 and then one pass over API v2,
+and every call followed the cursor until it got an empty page. Every request has the same latency, so the difference of
+time comes from the number of requests and how many of them are in flight.
+
+The notes can't be requested for several profiles at once: the content filters of GET /notes match a single value, a
+request with content.authorids=~A1,~B1 looks for the author id "~A1,~B1". Each profile needs at least one request per API.
+
+Usage:
+
+    python benchmarks/publications.py --reviewers 2000 --latency 0.02
+'''
+
+import argparse
+import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openreview
+from benchmarks.venue import SyntheticVenue
+
+def legacy_get_publications(client, profile_ids, batch_size=1000):
+    baseurl_v1, baseurl_v2 = openreview.tools.get_base_urls(client)
+    client_v1 = openreview.Client(baseurl=baseurl_v1, token=client.token)
+    client_v2 = openreview.api.OpenReviewClient(baseurl=baseurl_v2, token=client.token)
+
+    def get_all_notes(get_notes, profile_id):
+        publications = []
+        page = get_notes(content={ 'authorids': profile_id }, sort='id', limit=batch_size)
+        while page:
+            publications.extend(page)
+            page = get_notes(content={ 'authorids': profile_id }, sort='id', limit=batch_size, after=page[-1].id)
+        return publications
+
+    publications_by_id = {}
+    for get_notes in [client_v1.get_notes, client_v2.get_notes]:
+        results = openreview.tools.concurrent_requests(lambda profile_id: get_all_notes(get_notes, profile_id), profile_ids, desc='Loading publications')
+        for profile_id, publications in zip(profile_ids, results):
+            publications_by_id[profile_id] = publications_by_id.get(profile_id, []) + publications
+    return publications_by_id
+
+def measure(venue, client, get_publications):
+    venue.reset_counts()
+    start = time.perf_counter()
+    publications_by_id = get_publications(client, venue.reviewer_ids)
+    elapsed = time.perf_counter() - start
+    return publications_by_id, elapsed, sum(venue.request_counts().values())
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--submissions', type=int, default=500)
+    parser.add_argument('--reviewers', type=int, default=2000)
+    parser.add_argument('--latency', type=float, default=0.02, help='Seconds added to every request')
+    args = parser.parse_args()
+
+    venue = SyntheticVenue(args.submissions, args.reviewers, latency=args.latency)
+    with venue.serve() as client:
+        legacy, legacy_seconds, legacy_requests = measure(venue, client, legacy_get_publications)
+        current, current_seconds, current_requests = measure(venue, client, openreview.tools.get_publications)
+
+    assert { profile_id: [note.id for note in notes] for profile_id, notes in legacy.items() } == { profile_id: [note.id for note in notes] for profile_id, notes in current.items() }
+    print(f'profiles: {len(venue.reviewer_ids)}, publications: {sum(len(notes) for notes in current.values())}, latency: {args.latency * 1000:.0f}ms')
+    print(f'get_all_notes per profile: {legacy_seconds:8.2f}s {legacy_requests:>7} requests')
+    print(f'tools.get_publications:    {current_seconds:8.2f}s {current_requests:>7} requests ({legacy_seconds / current_seconds:.2f}x)')
+
+if __name__ == '__main__':
+    main()
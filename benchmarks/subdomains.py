@@ -0,0 +1,83 @@
+'''
+Micro-benchmark of openreview.tools.subdomains over the e-mail domains of a large committee.
+
+Generates institutional e-mail addresses from the institutions listed in duplicate_domains.json, with
+department subdomains and a share of webmail providers, and expands every domain with and without
+the domain table.
+
+Usage:
+
+    python benchmarks/subdomains.py --emails 100000
+'''
+
+import argparse
+import random
+import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openreview
+import tld
+
+def legacy_subdomains(domain):
+    duplicate_domains = openreview.tools.load_duplicate_domains()
+    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
+    domains = ['.'.join(domain_components[index:len(domain_components)]) for index, path in enumerate(domain_components)]
+    valid_domains = set()
+    for d in domains:
+        if not tld.is_tld(d):
+            valid_domains.add(duplicate_domains.get(d, d))
+    return sorted(valid_domains)
+
+def build_emails(n_emails, seed=1234):
+    rng = random.Random(seed)
+    institutions = sorted(set(openreview.tools.load_duplicate_domains().values()))
+    departments = ['cs', 'eecs', 'math', 'stat', 'ece', 'mail', 'students', 'robots', 'seas', 'andrew']
+    webmail = ['gmail.com', 'qq.com', '163.com', 'outlook.com', 'hotmail.com', 'yahoo.com']
+    emails = []
+    for i in range(n_emails):
+        draw = rng.random()
+        if draw < 0.2:
+            domain = rng.choice(webmail)
+        elif draw < 0.6:
+            domain = rng.choice(institutions)
+        else:
+            domain = f'{rng.choice(departments)}.{rng.choice(institutions)}'
+        emails.append(f'user{i}@{domain}')
+    return emails
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--emails', type=int, default=100000)
+    args = parser.parse_args()
+
+    emails = build_emails(args.emails)
+    domains = [email.split('@')[1] for email in emails]
+    openreview.tools.load_duplicate_domains()
+
+    start = time.perf_counter()
+    expected = [legacy_subdomains(domain) for domain in domains]
+    uncached_time = time.perf_counter() - start
+
+    openreview.tools.clear_subdomains_cache()
+    start = time.perf_counter()
+    results = [openreview.tools.subdomains(domain) for domain in domains]
+    cold_time = time.perf_counter() - start
+    cold_stats = openreview.tools.subdomains_cache_info()
+
+    start = time.perf_counter()
+    results = [openreview.tools.subdomains(domain) for domain in domains]
+    warm_time = time.perf_counter() - start
+
+    assert results == expected
+
+    print(f'emails: {len(emails)}, distinct domains: {len(set(domains))}')
+    print(f'without table: {uncached_time:.2f}s')
+    print(f'cold table: {cold_time:.2f}s, {cold_stats}')
+    print(f'warm table: {warm_time:.2f}s, {openreview.tools.subdomains_cache_info()}')
+    print(f'speedup: cold {uncached_time / cold_time:.1f}x, warm {uncached_time / warm_time:.1f}x')
+
+if __name__ == '__main__':
+    main()
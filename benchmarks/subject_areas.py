@@ -0,0 +1,62 @@
+'''
+Benchmark of the subject area scores built by conference Matching._build_subject_area_scores.
+
+Draws 1 to 3 subject areas per paper and per user from a list of areas and compares the pairwise loop over
+_jaccard_similarity with the sparse product of openreview.conference.matching._subject_area_scores, with all the pairs
+and with threshold=0. The pairwise loop is timed on a sample of the papers and extrapolated.
+
+Usage:
+
+    python benchmarks/subject_areas.py --papers 10000 --users 10000 --areas 60
+'''
+
+import argparse
+import random
+import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openreview.conference.matching import _jaccard_similarity, _subject_area_scores
+
+def build_subject_areas(n_rows, n_areas, rng):
+    areas = [f'Area {i}' for i in range(n_areas)]
+    return [rng.sample(areas, rng.randint(1, 3)) for _ in range(n_rows)]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--papers', type=int, default=10000)
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--areas', type=int, default=60)
+    parser.add_argument('--sample', type=int, default=200, help='Number of papers used to time the pairwise loop')
+    args = parser.parse_args()
+
+    rng = random.Random(1234)
+    papers = build_subject_areas(args.papers, args.areas, rng)
+    users = build_subject_areas(args.users, args.areas, rng)
+
+    sample = min(args.sample, len(papers))
+    start = time.perf_counter()
+    expected = [(p, u, _jaccard_similarity(papers[p], users[u])) for p in range(sample) for u in range(len(users))]
+    pairwise_time = (time.perf_counter() - start) * len(papers) / sample
+
+    start = time.perf_counter()
+    all_pairs = 0
+    for position, score in enumerate(_subject_area_scores(papers, users)):
+        if position < len(expected):
+            assert score == expected[position]
+        all_pairs += 1
+    sparse_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    nonzero_pairs = sum(1 for _ in _subject_area_scores(papers, users, threshold=0))
+    threshold_time = time.perf_counter() - start
+
+    print(f'papers: {len(papers)}, users: {len(users)}, areas: {args.areas}, pairs: {all_pairs}, pairs with common areas: {nonzero_pairs}')
+    print(f'pairwise _jaccard_similarity (extrapolated from {sample} papers): {pairwise_time:.1f}s')
+    print(f'sparse product, all pairs: {sparse_time:.1f}s, speedup {pairwise_time / sparse_time:.1f}x')
+    print(f'sparse product, threshold=0: {threshold_time:.1f}s, speedup {pairwise_time / threshold_time:.1f}x')
+
+if __name__ == '__main__':
+    main()
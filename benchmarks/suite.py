@@ -0,0 +1,207 @@
+'''
+Benchmark suite of the client hot paths.
+
+Every scenario runs in its own process against a synthetic venue served by openreview.fake_server, so the peak RSS
+of a scenario doesn't include the memory of the previous ones. The setup of a scenario, for example loading the profiles
+that are passed to Matching._build_note_conflicts, is not timed. For each scenario and venue the suite reports the time,
+the throughput in objects per second, the peak RSS before and after the timed part and the number of requests by route,
+and writes them to a JSON file. Pass the JSON of a previous run with --compare to print the change of every result.
+
+Usage:
+
+    python -m benchmarks.suite --venues small medium --latency 0.005 --output results.json
+    python -m benchmarks.suite --venues 2000x3000 --scenarios get_profiles build_note_conflicts --compare results.json
+'''
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import platform
+import queue
+import subprocess
+import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openreview
+from benchmarks.venue import SyntheticVenue, VENUE_SIZES
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+## Each scenario receives the venue and a client, does the untimed setup and returns the function that is timed.
+## The timed function returns the number of objects it processed.
+
+def concurrent_get(venue, client):
+    return lambda: len(openreview.tools.concurrent_get(client, client.get_notes, invitation=venue.submission_id))
+
+def efficient_iterget(venue, client):
+    return lambda: sum(1 for _ in openreview.tools.efficient_iterget(client.get_notes, invitation=venue.submission_id))
+
+def get_all_notes(venue, client):
+    return lambda: len(client.get_all_notes(invitation=venue.submission_id))
+
+def get_profiles(venue, client):
+    ids_or_emails = venue.reviewer_ids[::2] + venue.reviewer_emails[1::2]
+    return lambda: len(openreview.tools.get_profiles(client, ids_or_emails))
+
+def from_json(venue, client):
+    notes = list(venue.server.notes.values())
+    edges = venue.affinity_edges().to_json()
+
+    def run():
+        for note in notes:
+            openreview.api.Note.from_json(note)
+        for edge in edges:
+            openreview.api.Edge.from_json(edge)
+        return len(notes) + len(edges)
+    return run
+
+def post_bulk_edges(venue, client):
+    edges = venue.affinity_edges()
+    return lambda: len(openreview.tools.post_bulk_edges(client, edges))
+
+def build_note_conflicts(venue, client):
+    from openreview.venue.matching import Matching
+    conference = openreview.venue.Venue(client, 'Venue.cc/2025/Conference', 'openreview.net/Support')
+    conference.submission_stage = openreview.stages.SubmissionStage()
+    matching = Matching(conference, client.get_group(venue.reviewers_id))
+    submissions = client.get_all_notes(invitation=venue.submission_id)
+    reviewer_profiles = openreview.tools.get_profiles(client, venue.reviewer_ids, with_publications=True, with_relations=True)
+
+    def run():
+        matching._build_note_conflicts(submissions, reviewer_profiles, openreview.tools.get_profile_info, None)
+        return len(submissions)
+    return run
+
+SCENARIOS = {
+    'concurrent_get': concurrent_get,
+    'efficient_iterget': efficient_iterget,
+    'get_all_notes': get_all_notes,
+    'get_profiles': get_profiles,
+    'from_json': from_json,
+    'post_bulk_edges': post_bulk_edges,
+    'build_note_conflicts': build_note_conflicts
+}
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    ## ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return maxrss / 2**20 if sys.platform == 'darwin' else maxrss / 2**10
+
+def run_scenario(scenario, n_submissions, n_reviewers, latency, results):
+    venue = SyntheticVenue(n_submissions, n_reviewers, latency=latency)
+    with venue.serve() as client:
+        run = SCENARIOS[scenario](venue, client)
+        venue.reset_counts()
+        setup_rss = peak_rss_mb()
+        start = time.perf_counter()
+        items = run()
+        elapsed = time.perf_counter() - start
+    request_counts = venue.request_counts()
+    results.put({
+        'scenario': scenario,
+        'submissions': n_submissions,
+        'reviewers': n_reviewers,
+        'seconds': elapsed,
+        'items': items,
+        'throughput': items / elapsed if elapsed else None,
+        'setup_peak_rss_mb': setup_rss,
+        'peak_rss_mb': peak_rss_mb(),
+        'requests': sum(request_counts.values()),
+        'request_counts': request_counts
+    })
+
+def run_isolated(scenario, n_submissions, n_reviewers, latency):
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=run_scenario, args=(scenario, n_submissions, n_reviewers, latency, results))
+    process.start()
+    while process.is_alive() or not results.empty():
+        try:
+            result = results.get(timeout=1)
+            process.join()
+            return result
+        except queue.Empty:
+            pass
+    raise RuntimeError(f'Scenario {scenario} failed with exit code {process.exitcode}')
+
+def parse_venue(venue):
+    if venue in VENUE_SIZES:
+        return VENUE_SIZES[venue]
+    submissions, _, reviewers = venue.partition('x')
+    return int(submissions), int(reviewers)
+
+def get_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def get_version():
+    try:
+        from importlib.metadata import version
+        return version('openreview-py')
+    except Exception:
+        return None
+
+def compare(results, previous):
+    previous_by_key = { (r['scenario'], r['submissions'], r['reviewers']): r for r in previous['results'] }
+    print(f'\ncompared with {previous.get("commit") or previous.get("version")} ({previous.get("date")})')
+    for result in results:
+        old = previous_by_key.get((result['scenario'], result['submissions'], result['reviewers']))
+        if not old:
+            continue
+        print(f'{result["scenario"]:22} {result["submissions"]:>6}x{result["reviewers"]:<6} '
+            f'time {old["seconds"]:8.2f}s -> {result["seconds"]:8.2f}s ({old["seconds"] / result["seconds"]:5.2f}x)  '
+            f'requests {old["requests"]:>7} -> {result["requests"]:<7} '
+            f'peak RSS {old["peak_rss_mb"] or 0:7.0f} -> {result["peak_rss_mb"] or 0:7.0f} MiB')
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--venues', nargs='+', default=['small', 'medium'], help=f'Venue sizes: {", ".join(VENUE_SIZES)} or SUBMISSIONSxREVIEWERS')
+    parser.add_argument('--scenarios', nargs='+', default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument('--latency', type=float, default=0, help='Seconds added to every request')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', help='JSON results of a previous run')
+    args = parser.parse_args()
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+
+    results = []
+    for venue in args.venues:
+        n_submissions, n_reviewers = parse_venue(venue)
+        for scenario in args.scenarios:
+            result = run_isolated(scenario, n_submissions, n_reviewers, args.latency)
+            results.append(result)
+            print(f'{scenario:22} {n_submissions:>6}x{n_reviewers:<6} {result["seconds"]:8.2f}s {result["throughput"] or 0:10.0f}/s '
+                f'{result["requests"]:>7} requests, peak RSS {result["peak_rss_mb"] or 0:.0f} MiB', flush=True)
+
+    output = {
+        'version': get_version(),
+        'commit': get_commit(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'latency': args.latency,
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=2)
+    print(f'results written to {args.output}')
+
+    if previous:
+        compare(results, previous)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+'''
+Synthetic venues served by openreview.fake_server.
+
+A venue has N submissions with four authors each, a pool of 2N author profiles, M reviewer profiles and the
+publications of all the profiles. The profiles have institutional and personal e-mails, a position and a few
+relations to other profiles of the venue, so the conflict detection finds domain, relation and coauthorship conflicts.
+The data is generated with a fixed seed, two venues of the same size are identical.
+'''
+
+import contextlib
+import random
+
+import openreview
+from openreview.fake_server import FakeOpenReviewServer
+
+VENUE_ID = 'Venue.cc/2025/Conference'
+
+VENUE_SIZES = {
+    'small': (1000, 5000),
+    'medium': (10000, 20000),
+    'large': (50000, 20000)
+}
+
+class SyntheticVenue(object):
+    """
+    Venue loaded in an API v2 fake server on http://localhost:3001 and an empty API v1 fake server on http://localhost:3000,
+    the baseurls that :func:`openreview.tools.get_base_urls` returns for a local client.
+
+    :param n_submissions: Number of submissions
+    :type n_submissions: int
+    :param n_reviewers: Number of reviewers
+    :type n_reviewers: int
+    :param latency: Seconds added to every request, see :class:`openreview.fake_server.FakeOpenReviewServer`
+    :type latency: float, optional
+    :param seed: Seed of the generated data
+    :type seed: int, optional
+    """
+    def __init__(self, n_submissions, n_reviewers, latency=0, seed=1234):
+        self.n_submissions = n_submissions
+        self.n_reviewers = n_reviewers
+        self.server = FakeOpenReviewServer(baseurl='http://localhost:3001', latency=latency)
+        self.server_v1 = FakeOpenReviewServer(baseurl='http://localhost:3000', latency=latency)
+        self.submission_id = f'{VENUE_ID}/-/Submission'
+        self.reviewers_id = f'{VENUE_ID}/Reviewers'
+
+        rng = random.Random(seed)
+        self.reviewer_ids = [f'~Reviewer_Person{i}' for i in range(n_reviewers)]
+        self.author_ids = [f'~Author_Person{i}' for i in range(n_submissions * 2)]
+        profile_ids = self.reviewer_ids + self.author_ids
+        profiles = [self.build_profile(profile_id, profile_ids, rng) for profile_id in profile_ids]
+        self.reviewer_emails = [profile['content']['preferredEmail'] for profile in profiles[:n_reviewers]]
+        self.server.add_profiles(profiles)
+
+        self.server.add_notes({
+            'id': f'publication{i:08d}',
+            'invitations': ['DBLP.org/-/Record'],
+            'readers': ['everyone'],
+            'pdate': 1600000000000 + i * 1000,
+            'content': {
+                'title': { 'value': f'Publication {i}' },
+                'authorids': { 'value': rng.sample(profile_ids, rng.randint(1, 4)) }
+            }
+        } for i in range(len(profile_ids) * 2))
+
+        self.server.add_notes({
+            'id': f'submission{number:08d}',
+            'number': number,
+            'invitations': [self.submission_id],
+            'readers': [VENUE_ID, f'{VENUE_ID}/Submission{number}/Authors'],
+            'content': {
+                'title': { 'value': f'Submission {number}' },
+                'authorids': { 'value': rng.sample(self.author_ids, 4) },
+                'venueid': { 'value': f'{VENUE_ID}/Submission' }
+            }
+        } for number in range(1, n_submissions + 1))
+
+        self.server.add_groups([
+            { 'id': VENUE_ID, 'members': [f'{VENUE_ID}/Program_Chairs'] },
+            { 'id': f'{VENUE_ID}/Program_Chairs', 'members': ['~Program_Chair1'] },
+            { 'id': self.reviewers_id, 'members': self.reviewer_ids }
+        ])
+        self.server.add_invitations([
+            { 'id': self.submission_id, 'edit': { 'note': {} } },
+            { 'id': f'{self.reviewers_id}/-/Affinity_Score', 'edge': {} }
+        ])
+
+    def build_profile(self, profile_id, profile_ids, rng):
+        name = profile_id[1:-1].lower()
+        institution = rng.randrange(3000)
+        emails = [f'{name}@cs.university{institution}.edu', f'{name}@gmail.com']
+        return {
+            'id': profile_id,
+            'content': {
+                'names': [{ 'fullname': profile_id[1:-1].replace('_', ' '), 'username': profile_id, 'preferred': True }],
+                'emails': emails,
+                'emailsConfirmed': emails,
+                'preferredEmail': emails[0],
+                'history': [{
+                    'position': 'Professor',
+                    'start': 2015,
+                    'end': None,
+                    'institution': { 'domain': f'university{institution}.edu' }
+                }],
+                'relations': [{ 'username': rng.choice(profile_ids), 'relation': 'Coauthor', 'end': None } for _ in range(rng.randrange(4))]
+            }
+        }
+
+    def affinity_edges(self, per_submission=20, seed=1234):
+        """
+        Returns the affinity scores of per_submission reviewers for every submission.
+
+        :return: Edges of the Affinity_Score invitation
+        :rtype: openreview.api.EdgeBatch
+        """
+        rng = random.Random(seed)
+        batch = openreview.api.EdgeBatch(
+            invitation=f'{self.reviewers_id}/-/Affinity_Score',
+            readers=[VENUE_ID, openreview.api.EdgeBatch.TAIL],
+            writers=[VENUE_ID],
+            signatures=[VENUE_ID]
+        )
+        for number in range(1, self.n_submissions + 1):
+            for reviewer_id in rng.sample(self.reviewer_ids, min(per_submission, self.n_reviewers)):
+                batch.append(f'submission{number:08d}', reviewer_id, weight=round(rng.random(), 3))
+        return batch
+
+    @contextlib.contextmanager
+    def serve(self):
+        """
+        Serves the venue to the clients created inside the context.
+
+        :return: Client authenticated as the Program Chair
+        :rtype: openreview.api.OpenReviewClient
+        """
+        with self.server_v1.intercept(), self.server.intercept():
+            yield self.server.client(user='~Program_Chair1')
+
+    def request_counts(self):
+        """
+        Returns the number of requests by route, the routes of API v1 start with v1.
+        """
+        counts = dict(self.server.request_counts)
+        counts.update({ f'v1 {route}': count for route, count in self.server_v1.request_counts.items() })
+        return counts
+
+    def reset_counts(self):
+        self.server.reset_counts()
+        self.server_v1.reset_counts()
@@ -1,10 +1,50 @@
 from .openreview import *
 from . import tools
-from .conference import *
-from .agora import *
-from .venue_request import *
-from .profile import *
-from . import journal
-from . import venue
-from . import stages
-from . import arr
+
+import importlib
+import sys
+
+## The subpackages import the package with `from .. import openreview`, which resolves this attribute. It used to be
+## replaced by the package when the subpackages were imported here, keep it that way so they can use openreview.api.
+openreview = sys.modules[__name__]
+
+## The subpackages are imported the first time one of their names is used, so a script that only needs
+## openreview.Client or openreview.api doesn't load the venue, journal and conference builders.
+_LAZY_SUBMODULES = ['api', 'arr', 'conference', 'journal', 'profile', 'stages', 'venue']
+
+_LAZY_ATTRIBUTES = {
+    'openreview.conference': [
+        'Conference', 'ConferenceBuilder', 'WebfieldBuilder', 'builder', 'helpers', 'invitation', 'matching', 'webfield',
+        'get_bid_stages', 'get_comment_stage', 'get_conference', 'get_conference_builder', 'get_decision_heading_map', 'get_decision_stage',
+        'get_ethics_review_stage', 'get_identity_readers', 'get_meta_review_stage', 'get_rebuttal_stage', 'get_registration_stages',
+        'get_review_rating_stage', 'get_review_stage', 'get_submission_revision_stage', 'get_submission_stage', 'set_homepage_options'
+    ],
+    'openreview.agora': ['Agora', 'agora'],
+    'openreview.venue_request': ['VenueRequest', 'VenueStages', 'venue_request'],
+    'openreview.profile': ['ProfileManagement', 'management'],
+    'openreview.stages': [
+        'AuthorReorder', 'BidStage', 'CommentStage', 'CustomStage', 'DecisionStage', 'EthicsReviewStage', 'ExpertiseSelectionStage',
+        'IdentityReaders', 'MetaReviewRevisionStage', 'MetaReviewStage', 'RegistrationStage', 'ReviewRatingStage', 'ReviewRebuttalStage',
+        'ReviewRevisionStage', 'ReviewStage', 'SHORT_BUFFER_MIN', 'SubmissionRevisionStage', 'SubmissionStage', 'default_content', 'venue_stages'
+    ]
+}
+
+_LAZY_ATTRIBUTE_MODULES = { name: module for module, names in _LAZY_ATTRIBUTES.items() for name in names }
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTE_MODULES:
+        module_name = _LAZY_ATTRIBUTE_MODULES[name]
+        module = importlib.import_module(module_name)
+        ## Importing openreview.agora or openreview.venue_request binds the subpackage to this attribute, the star imports
+        ## of the package used to replace it with the inner module of the same name, so all the names of the module are set here
+        globals().update({ attribute: getattr(module, attribute) for attribute in _LAZY_ATTRIBUTES[module_name] })
+        return globals()[name]
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f'{__name__}.{name}')
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES) | set(_LAZY_ATTRIBUTE_MODULES))
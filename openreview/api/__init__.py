@@ -3,4 +3,6 @@ from .client import Edit
 from .client import Note
 from .client import Invitation
 from .client import Edge
+from .client import EdgeBatch
+from .client import MessageBatch
 from .client import Group
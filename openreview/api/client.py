@@ -12,11 +12,14 @@ import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import pprint
+import math
+from array import array
 import os
 import re
 import time
 import jwt
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from openreview import Profile
 from openreview import OpenReviewException
 from .. import tools
@@ -54,8 +57,10 @@ class OpenReviewClient(object):
     :type token: str, optional
     :param expiresIn: Time in seconds before the token expires. If none is set the value will be set automatically to one hour. The max value that it can be set to is 1 week.
     :type expiresIn: number, optional
+    :param profile_cache: Local cache used by search_profiles to avoid requesting profiles that were loaded recently, see :class:`openreview.tools.ProfileCache`
+    :type profile_cache: ProfileCache, optional
     """
-    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None):
+    def __init__(self, baseurl = None, username = None, password = None, token= None, tokenExpiresIn=None, profile_cache=None):
 
         self.baseurl = baseurl
         if not self.baseurl:
@@ -94,6 +99,7 @@ class OpenReviewClient(object):
         self.limit = 1000
         self.token = token.replace('Bearer ', '') if token else None
         self.profile = None
+        self.profile_cache = profile_cache
         self.headers = {
             'User-Agent': self.user_agent,
             'Accept': 'application/json'
@@ -150,7 +156,7 @@ class OpenReviewClient(object):
                     'name': 'Error',
                     'message': response.reason
                 }
-            raise OpenReviewException(error)
+            raise OpenReviewException(error, status_code=response.status_code)
 
     ## PUBLIC FUNCTIONS
     def impersonate(self, group_id):
@@ -444,6 +450,8 @@ class OpenReviewClient(object):
 
         :return: List of profiles, if emails is present then a dictionary of { email: profiles } is returned. If confirmedEmails is present then a dictionary of { email: profile } is returned
         :rtype: list[Profile]
+
+        If the client has a profile_cache, the profiles searched by ids or confirmedEmails are read from the cache and only the missing or stale ones are requested.
         """
 
         def batches(items, batch_size=1000):
@@ -483,27 +491,60 @@ class OpenReviewClient(object):
             return profiles_by_email
 
         if confirmedEmails:
+            profiles_by_email = {}
+            if self.profile_cache:
+                for email, profile in self.profile_cache.get_profiles(confirmedEmails, scope=tools.ProfileCache.get_scope(self)).items():
+                    if email in profile.content['emailsConfirmed']:
+                        profiles_by_email[email] = profile
+                confirmedEmails = [email for email in confirmedEmails if email not in profiles_by_email]
+
             full_response = []
             for email_batch in batches(confirmedEmails):
                 response = self.session.post(self.profiles_search_url, json = {'emails': email_batch}, headers = self.headers)
                 response = self.__handle_response(response)
                 full_response.extend(response.json()['profiles'])
 
-            profiles_by_email = {}
+            fetched_profiles = []
             for p in full_response:
                 profile = Profile.from_json(p)
+                fetched_profiles.append(profile)
                 if p['email'] in profile.content['emailsConfirmed']:
                     profiles_by_email[p['email']] = profile
+            if self.profile_cache and fetched_profiles:
+                self.profile_cache.put_profiles(fetched_profiles, scope=tools.ProfileCache.get_scope(self))
             return profiles_by_email
 
         if ids:
+            requested_ids = ids
+            profiles_by_key = {}
+            if self.profile_cache:
+                profiles_by_key = self.profile_cache.get_profiles(ids, scope=tools.ProfileCache.get_scope(self))
+                ids = [profile_id for profile_id in ids if profile_id not in profiles_by_key]
+
             full_response = []
             for id_batch in batches(ids):
                 response = self.session.post(self.profiles_search_url, json = {'ids': id_batch}, headers = self.headers)
                 response = self.__handle_response(response)
                 full_response.extend(response.json()['profiles'])
 
-            return [Profile.from_json(p) for p in full_response]
+            profiles = [Profile.from_json(p) for p in full_response]
+            if self.profile_cache and profiles:
+                self.profile_cache.put_profiles(profiles, scope=tools.ProfileCache.get_scope(self))
+            if not self.profile_cache:
+                return profiles
+
+            ## The cached and the fetched profiles are returned in the order of the requested ids, a profile can be requested by any of its usernames
+            for profile in profiles:
+                for name in profile.content.get('names', []):
+                    if name.get('username'):
+                        profiles_by_key.setdefault(name['username'], profile)
+                profiles_by_key.setdefault(profile.id, profile)
+            ordered_profiles = {}
+            for profile_id in requested_ids:
+                profile = profiles_by_key.get(profile_id)
+                if profile:
+                    ordered_profiles.setdefault(profile.id, profile)
+            return list(ordered_profiles.values())
 
         if first or middle or last:
             response = self.session.get(self.profiles_url, params = {'first': first, 'middle': middle, 'last': last, 'es': 'true' if use_ES else 'false'}, headers = self.headers)
@@ -714,7 +755,7 @@ class OpenReviewClient(object):
         return Profile.from_json(response.json())    
 
 
-    def get_groups(self, id=None, prefix=None, member=None, signatory=None, web=None, limit=None, offset=None, after=None, stream=None, sort=None, with_count=False):
+    def get_groups(self, id=None, parent=None, prefix=None, member=None, domain=None, signatory=None, web=None, limit=None, offset=None, after=None, stream=None, sort=None, with_count=False, invitation=None):
         """
         Gets list of Group objects based on the filters provided. The Groups that will be returned match all the criteria passed in the parameters.
 
@@ -732,6 +773,8 @@ class OpenReviewClient(object):
         :type limit: int, optional
         :param offset: Indicates the position to start retrieving Groups. For example, if there are 10 Groups and you want to obtain the last 3, then the offset would need to be 7.
         :type offset: int, optional
+        :param invitation: Groups edited with this Invitation
+        :type invitation: str, optional
 
         :return: List of Groups
         :rtype: list[Group]
@@ -739,10 +782,14 @@ class OpenReviewClient(object):
         params = {}
         if id is not None:
             params['id'] = id
+        if parent is not None:
+            params['parent'] = parent
         if prefix is not None:
             params['prefix'] = prefix
         if member is not None:
             params['member'] = member
+        if domain is not None:
+            params['domain'] = domain
         if signatory is not None:
             params['signatory'] = signatory
         if sort is not None:
@@ -757,6 +804,8 @@ class OpenReviewClient(object):
             params['after'] = after
         if stream is not None:
             params['stream'] = stream
+        if invitation is not None:
+            params['invitation'] = invitation
 
         response = self.session.get(self.groups_url, params=tools.format_params(params), headers = self.headers)
         response = self.__handle_response(response)
@@ -767,7 +816,7 @@ class OpenReviewClient(object):
 
         return groups
 
-    def get_all_groups(self, id=None, parent=None, prefix=None, member=None, domain=None, signatory=None, web=None, sort=None, with_count=False):
+    def get_all_groups(self, id=None, parent=None, prefix=None, member=None, domain=None, signatory=None, web=None, sort=None, with_count=False, invitation=None):
         """
         Gets list of Group objects based on the filters provided. The Groups that will be returned match all the criteria passed in the parameters.
 
@@ -787,12 +836,13 @@ class OpenReviewClient(object):
         :type limit: int, optional
         :param offset: Indicates the position to start retrieving Groups. For example, if there are 10 Groups and you want to obtain the last 3, then the offset would need to be 7.
         :type offset: int, optional
-        :param after: Group id to start getting the list of groups from.
-        :type after: str, optional
+        :param invitation: Groups edited with this Invitation
+        :type invitation: str, optional
 
         :return: List of Groups
         :rtype: list[Group]
         """
+        ## The API returns every Group in a single streamed response
         params = {
             'stream': True
         }
@@ -812,11 +862,28 @@ class OpenReviewClient(object):
             params['web'] = web
         if sort is not None:
             params['sort'] = sort
-        if with_count is not None:
+        if invitation is not None:
+            params['invitation'] = invitation
+
+        if with_count:
             params['with_count'] = with_count
 
         return self.get_groups(**params)
 
+    def iter_all_groups(self, id=None, parent=None, prefix=None, member=None, domain=None, signatory=None, web=None, sort=None, prefetch=False):
+        """
+        Returns an iterator over the Groups that match the filters provided, requesting them page by page. See :meth:`openreview.api.OpenReviewClient.get_all_groups` for the filters.
+
+        :param prefetch: If true, the next page is requested in a background thread while the current page is processed
+        :type prefetch: bool, optional
+
+        :return: Iterator over Groups
+        :rtype: generator
+        """
+        params = { 'id': id, 'parent': parent, 'prefix': prefix, 'member': member, 'domain': domain, 'signatory': signatory, 'web': web, 'sort': sort }
+
+        return tools.iter_all(self.get_groups, prefetch=prefetch, **{ key: value for key, value in params.items() if value is not None })
+
     def get_invitations(self,
         id = None,
         ids = None,
@@ -957,7 +1024,8 @@ class OpenReviewClient(object):
         sort = None,
         type = None,
         with_count=False,
-        invitation = None
+        invitation = None,
+        workers = None
     ):
         """
         Gets list of Invitation objects based on the filters provided. The Invitations that will be returned match all the criteria passed in the parameters.
@@ -992,6 +1060,8 @@ class OpenReviewClient(object):
         :type details: dict, optional
         :param expired: If true, retrieves the Invitations that have expired, otherwise, the ones that have not expired
         :type expired: bool, optional
+        :param workers: Max number of concurrent requests, see :func:`tools.parallel_get`
+        :type workers: int, optional
 
         :return: List of Invitations
         :rtype: list[Invitation]
@@ -1037,7 +1107,23 @@ class OpenReviewClient(object):
         if invitation is not None:
             params['invitation'] = invitation
 
-        return list(tools.efficient_iterget(self.get_invitations, desc='Getting V2 Invitations', **params))
+        return tools.parallel_get(self.get_invitations, desc='Getting V2 Invitations', workers=workers, **params)
+
+    def iter_all_invitations(self, id=None, ids=None, invitee=None, replytoNote=None, replyForum=None, signature=None, note=None, prefix=None, tags=None, minduedate=None, duedate=None,
+        pastdue=None, replyto=None, details=None, expired=None, sort=None, type=None, invitation=None, prefetch=False):
+        """
+        Returns an iterator over the Invitations that match the filters provided, requesting them page by page. See :meth:`openreview.api.OpenReviewClient.get_all_invitations` for the filters.
+
+        :param prefetch: If true, the next page is requested in a background thread while the current page is processed
+        :type prefetch: bool, optional
+
+        :return: Iterator over Invitations
+        :rtype: generator
+        """
+        params = { 'id': id, 'ids': ids, 'invitee': invitee, 'replytoNote': replytoNote, 'replyForum': replyForum, 'signature': signature, 'note': note, 'prefix': prefix, 'tags': tags,
+            'minduedate': minduedate, 'duedate': duedate, 'pastdue': pastdue, 'replyto': replyto, 'details': details, 'expired': expired, 'sort': sort, 'type': type, 'invitation': invitation }
+
+        return tools.iter_all(self.get_invitations, prefetch=prefetch, **{ key: value for key, value in params.items() if value is not None })
 
     def get_invitation_edit(self, id):
         """
@@ -1216,7 +1302,8 @@ class OpenReviewClient(object):
             details = None,
             select = None,
             sort = None,
-            with_count=False
+            with_count=False,
+            workers=None
             ):
         """
         Gets list of Note objects based on the filters provided. The Notes that will be returned match all the criteria passed in the parameters.
@@ -1257,6 +1344,8 @@ class OpenReviewClient(object):
         :type details: optional
         :param sort: Sorts the output by field depending on the string passed. Possible values: number, cdate, ddate, tcdate, tmdate, replyCount (Invitation id needed in the invitation field).
         :type sort: str, optional
+        :param workers: Max number of concurrent requests, see :func:`tools.parallel_get`
+        :type workers: int, optional
 
         :return: List of Notes
         :rtype: list[Note]
@@ -1298,7 +1387,25 @@ class OpenReviewClient(object):
         if with_count:
             params['with_count'] = with_count
 
-        return list(tools.efficient_iterget(self.get_notes, desc='Getting V2 Notes', **params))
+        return tools.parallel_get(self.get_notes, desc='Getting V2 Notes', workers=workers, **params)
+
+    def iter_all_notes(self, id=None, paperhash=None, forum=None, invitation=None, replyto=None, signature=None, transitive_members=None, signatures=None, writer=None, trash=None,
+        number=None, content=None, mintcdate=None, details=None, select=None, sort=None, prefetch=False):
+        """
+        Returns an iterator over the Notes that match the filters provided, requesting them page by page. See :meth:`openreview.api.OpenReviewClient.get_all_notes` for the filters.
+
+        :param prefetch: If true, the next page is requested in a background thread while the current page is processed
+        :type prefetch: bool, optional
+
+        :return: Iterator over Notes
+        :rtype: generator
+        """
+        params = { 'id': id, 'paperhash': paperhash, 'forum': forum, 'invitation': invitation, 'replyto': replyto, 'signature': signature, 'transitive_members': transitive_members,
+            'signatures': signatures, 'writer': writer, 'number': number, 'content': content, 'mintcdate': mintcdate, 'details': details, 'select': select or None, 'sort': sort }
+        if trash == True:
+            params['trash'] = True
+
+        return tools.iter_all(self.get_notes, prefetch=prefetch, **{ key: value for key, value in params.items() if value is not None })
 
     def get_note_edit(self, id, trash=None):
         """
@@ -1454,7 +1561,7 @@ class OpenReviewClient(object):
 
         return edges
 
-    def get_all_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=False, trash=None):
+    def get_all_edges(self, id = None, invitation = None, head = None, tail = None, label = None, limit = None, offset = None, with_count=False, trash=None, workers=None):
         """
         Returns a list of Edge objects based on the filters provided.
 
@@ -1463,6 +1570,7 @@ class OpenReviewClient(object):
         :arg head: Profile ID of the Profile that is connected to the Note ID in tail
         :arg tail: Note ID of the Note that is connected to the Profile ID in head
         :arg label: Label ID of the match
+        :arg workers: Max number of concurrent requests, see :func:`tools.parallel_get`
         """
         params = {
             'id': id,
@@ -1476,7 +1584,19 @@ class OpenReviewClient(object):
             'trash': trash
         }
 
-        return tools.concurrent_get(self, self.get_edges, **params)
+        return tools.parallel_get(self.get_edges, desc='Getting V2 Edges', workers=workers, **params)
+
+    def iter_all_edges(self, id=None, invitation=None, head=None, tail=None, label=None, trash=None, prefetch=False):
+        """
+        Returns an iterator over the Edges that match the filters provided, requesting them page by page. See :meth:`openreview.api.OpenReviewClient.get_all_edges` for the filters.
+
+        :param prefetch: If true, the next page is requested in a background thread while the current page is processed
+        :type prefetch: bool, optional
+
+        :return: Iterator over Edges
+        :rtype: generator
+        """
+        return tools.iter_all(self.get_edges, prefetch=prefetch, id=id, invitation=invitation, head=head, tail=tail, label=label, trash=trash)
 
     def get_edges_count(self, id = None, invitation = None, head = None, tail = None, label = None):
         """
@@ -1542,9 +1662,9 @@ class OpenReviewClient(object):
 
     def post_edges (self, edges):
         '''
-        Posts the list of Edges.   Returns a list Edge objects updated with their ids.
+        Posts the list of Edges, edges can also be an :class:`EdgeBatch`.   Returns a list Edge objects updated with their ids.
         '''
-        send_json = [edge.to_json() for edge in edges]
+        send_json = edges.to_json() if isinstance(edges, EdgeBatch) else [edge.to_json() for edge in edges]
         response = self.session.post(self.bulk_edges_url, json = send_json, headers = self.headers)
         response = self.__handle_response(response)
         received_json_array = response.json()
@@ -1715,6 +1835,23 @@ class OpenReviewClient(object):
 
         return response.json()
 
+    def message_batch(self, max_workers=6):
+        """
+        Returns a :class:`MessageBatch` that collects messages and posts them concurrently
+
+        Example:
+
+        >>> with client.message_batch() as messages:
+        ...     messages.add(subject='Subject', recipients=['~User_One1'], message='Message')
+
+        :param max_workers: Maximum number of messages posted at the same time
+        :type max_workers: int, optional
+
+        :return: Empty MessageBatch
+        :rtype: MessageBatch
+        """
+        return MessageBatch(self, max_workers=max_workers)
+
     def post_direct_message(self, subject, recipients, message, sender=None):
         """
         Posts a message to the recipients and consequently sends them emails
@@ -2686,6 +2823,8 @@ class Invitation(object):
         return invitation
 
 class Edge(object):
+    __slots__ = ('id', 'invitation', 'domain', 'head', 'tail', 'weight', 'label', 'cdate', 'ddate', 'readers', 'nonreaders', 'writers', 'signatures', 'tcdate', 'tmdate', 'tddate', 'tauthor')
+
     def __init__(self, head, tail, invitation, domain=None, readers=None, writers=None, signatures=None, id=None, weight=None, label=None, cdate=None, ddate=None, nonreaders=None, tcdate=None, tmdate=None, tddate=None, tauthor=None):
         self.id = id
         self.invitation = invitation
@@ -2764,12 +2903,232 @@ class Edge(object):
         return edge
 
     def __repr__(self):
-        content = ','.join([("%s = %r" % (attr, value)) for attr, value in vars(self).items()])
+        content = ','.join([("%s = %r" % (attr, getattr(self, attr))) for attr in self.__slots__])
         return 'Edge(' + content + ')'
 
     def __str__(self):
         pp = pprint.PrettyPrinter()
-        return pp.pformat(vars(self))
+        return pp.pformat({ attr: getattr(self, attr) for attr in self.__slots__ })
+
+class MessageBatch(object):
+    """
+    Collects messages and posts them concurrently with :meth:`OpenReviewClient.post_message`. Messages with the same subject, message, ignored recipients,
+    sender, replyTo and parentGroup are coalesced into one message to all their recipients. A failed message doesn't stop the others, the failures are
+    kept in :attr:`MessageBatch.errors` and raised together once all the messages were posted.
+
+    Used as a context manager, the messages are sent when the block ends without an exception.
+
+    :param client: Client used to post the messages
+    :type client: OpenReviewClient
+    :param max_workers: Maximum number of messages posted at the same time
+    :type max_workers: int, optional
+    """
+    def __init__(self, client, max_workers=6):
+        self.client = client
+        self.max_workers = max_workers
+        self.messages = {}
+        self.responses = []
+        self.errors = []
+
+    def __len__(self):
+        return len(self.messages)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.send()
+
+    def add(self, subject, recipients, message, ignoreRecipients=None, sender=None, replyTo=None, parentGroup=None):
+        """
+        Adds a message to the batch, the parameters are the same as :meth:`OpenReviewClient.post_message`
+        """
+        key = (subject, message, tuple(ignoreRecipients) if ignoreRecipients else None, tuple(sorted(sender.items())) if sender else None, replyTo, parentGroup)
+        if key not in self.messages:
+            self.messages[key] = {
+                'subject': subject,
+                'recipients': [],
+                'message': message,
+                'ignoreRecipients': ignoreRecipients,
+                'sender': sender,
+                'replyTo': replyTo,
+                'parentGroup': parentGroup
+            }
+        batch_recipients = self.messages[key]['recipients']
+        batch_recipients.extend([recipient for recipient in recipients if recipient not in batch_recipients])
+
+    def send(self, raise_errors=True):
+        """
+        Posts the collected messages and empties the batch
+
+        :param raise_errors: If True, an OpenReviewException with the failed messages is raised after posting all the messages
+        :type raise_errors: bool, optional
+
+        :return: Response of each posted message
+        :rtype: list[dict]
+        """
+        messages = list(self.messages.values())
+        self.messages = {}
+        responses = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(message, executor.submit(self.client.post_message, **message)) for message in messages]
+            for message, future in futures:
+                try:
+                    responses.append(future.result())
+                except Exception as e:
+                    errors.append((message, e))
+
+        self.responses.extend(responses)
+        self.errors.extend(errors)
+        if errors and raise_errors:
+            raise OpenReviewException({
+                'name': 'MessageBatchError',
+                'message': f'{len(errors)} of {len(messages)} messages failed',
+                'errors': [{ 'subject': message['subject'], 'recipients': message['recipients'], 'error': str(e) } for message, e in errors]
+            })
+        return responses
+
+class EdgeBatch(object):
+    """
+    Columnar list of Edges of the same invitation. Only the head, tail, weight and label of each Edge are stored, the readers, nonreaders, writers and signatures
+    are templates shared by all the Edges where :attr:`EdgeBatch.HEAD` and :attr:`EdgeBatch.TAIL` are replaced by the head and tail of each Edge.
+
+    It can be passed to :meth:`OpenReviewClient.post_edges` and :func:`tools.post_bulk_edges` in place of a list of Edges, the request payload is
+    built from the columns without creating Edge objects.
+
+    Example:
+
+    >>> edges = EdgeBatch(invitation='Venue/Reviewers/-/Affinity_Score', readers=['Venue', EdgeBatch.TAIL], writers=['Venue'], signatures=['Venue'])
+    >>> edges.append('paper_id', '~Reviewer_One1', weight=0.75)
+    >>> openreview.tools.post_bulk_edges(client, edges)
+
+    :param invitation: Invitation id of the Edges
+    :type invitation: str
+    :param readers: Readers template
+    :type readers: list[str], optional
+    :param writers: Writers template
+    :type writers: list[str], optional
+    :param signatures: Signatures template
+    :type signatures: list[str], optional
+    :param nonreaders: Nonreaders template
+    :type nonreaders: list[str], optional
+    """
+    HEAD = '{head}'
+    TAIL = '{tail}'
+
+    __slots__ = ('invitation', 'readers', 'writers', 'signatures', 'nonreaders', 'heads', 'tails', 'weights', 'labels')
+
+    def __init__(self, invitation, readers=None, writers=None, signatures=None, nonreaders=None):
+        self.invitation = invitation
+        self.readers = readers
+        self.writers = writers
+        self.signatures = signatures
+        self.nonreaders = nonreaders
+        self.heads = []
+        self.tails = []
+        self.weights = array('d')
+        self.labels = None
+
+    def append(self, head, tail, weight=None, label=None):
+        """
+        Adds an Edge to the batch
+
+        :param head: Head of the Edge
+        :type head: str
+        :param tail: Tail of the Edge
+        :type tail: str
+        :param weight: Weight of the Edge
+        :type weight: float, optional
+        :param label: Label of the Edge
+        :type label: str, optional
+        """
+        if label is not None and self.labels is None:
+            self.labels = [None] * len(self.heads)
+        self.heads.append(head)
+        self.tails.append(tail)
+        self.weights.append(math.nan if weight is None else weight)
+        if self.labels is not None:
+            self.labels.append(label)
+
+    def _filler(self, template):
+        if template is None:
+            return None
+        head_positions = [index for index, value in enumerate(template) if value == EdgeBatch.HEAD]
+        tail_positions = [index for index, value in enumerate(template) if value == EdgeBatch.TAIL]
+        if not head_positions and not tail_positions:
+            return lambda head, tail: list(template)
+
+        def fill(head, tail):
+            values = list(template)
+            for index in head_positions:
+                values[index] = head
+            for index in tail_positions:
+                values[index] = tail
+            return values
+        return fill
+
+    def _slice(self, start, stop):
+        batch = EdgeBatch(self.invitation, readers=self.readers, writers=self.writers, signatures=self.signatures, nonreaders=self.nonreaders)
+        batch.heads = self.heads[start:stop]
+        batch.tails = self.tails[start:stop]
+        batch.weights = self.weights[start:stop]
+        batch.labels = self.labels[start:stop] if self.labels is not None else None
+        return batch
+
+    def to_json(self):
+        """
+        Returns the list of serialized Edges, in the same format as :meth:`Edge.to_json`
+        """
+        send_json = []
+        labels = self.labels or [None] * len(self.heads)
+        fill_readers = self._filler(self.readers)
+        fill_writers = self._filler(self.writers)
+        fill_nonreaders = self._filler(self.nonreaders)
+        fill_signatures = self._filler(self.signatures)
+        for head, tail, weight, label in zip(self.heads, self.tails, self.weights, labels):
+            body = {
+                'invitation': self.invitation,
+                'head': head,
+                'tail': tail
+            }
+            if fill_readers:
+                body['readers'] = fill_readers(head, tail)
+            if fill_writers:
+                body['writers'] = fill_writers(head, tail)
+            if fill_nonreaders:
+                body['nonreaders'] = fill_nonreaders(head, tail)
+            if fill_signatures:
+                body['signatures'] = fill_signatures(head, tail)
+            if weight == weight:
+                body['weight'] = weight
+            if label is not None:
+                body['label'] = label
+            send_json.append(body)
+        return send_json
+
+    def __len__(self):
+        return len(self.heads)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self.heads))
+            if step != 1:
+                raise OpenReviewException('EdgeBatch slices must be contiguous')
+            return self._slice(start, stop)
+        if index < 0:
+            index += len(self.heads)
+        if not 0 <= index < len(self.heads):
+            raise IndexError('EdgeBatch index out of range')
+        return Edge.from_json(self._slice(index, index + 1).to_json()[0])
+
+    def __iter__(self):
+        for index in range(len(self.heads)):
+            yield self[index]
+
+    def __repr__(self):
+        return 'EdgeBatch(invitation = %r,edges = %d)' % (self.invitation, len(self.heads))
 
 class Group(object):
     """
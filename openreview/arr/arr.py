@@ -453,8 +453,8 @@ class ARR(object):
     def send_decision_notifications(self, decision_options, messages):
         return self.venue.send_decision_notifications(decision_options,  messages)
 
-    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None):
-        matching_value = self.venue.setup_committee_matching(committee_id, compute_affinity_scores, compute_conflicts, compute_conflicts_n_years, alternate_matching_group, submission_track)
+    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None, workers=None, checkpoint_dir=None):
+        matching_value = self.venue.setup_committee_matching(committee_id, compute_affinity_scores, compute_conflicts, compute_conflicts_n_years, alternate_matching_group, submission_track, workers, checkpoint_dir)
         cmp_inv = self.client.get_invitation(self.get_custom_max_papers_id(committee_id))
         cmp_inv.edit['weight']['param']['optional'] = True
         if 'enum' in cmp_inv.edit['weight']['param']:
@@ -471,8 +471,8 @@ class ARR(object):
         )
         return matching_value
 
-    def set_assignments(self, assignment_title, committee_id, enable_reviewer_reassignment=False, overwrite=False):
-        return self.venue.set_assignments(assignment_title,  committee_id, enable_reviewer_reassignment, overwrite)
+    def set_assignments(self, assignment_title, committee_id, enable_reviewer_reassignment=False, overwrite=False, checkpoint_dir=None):
+        return self.venue.set_assignments(assignment_title,  committee_id, enable_reviewer_reassignment, overwrite, checkpoint_dir)
 
     def setup_assignment_recruitment(self, committee_id, hash_seed, due_date, assignment_title=None, invitation_labels={}, email_template=None):
         return self.venue.setup_assignment_recruitment(committee_id,  hash_seed,  due_date, assignment_title, invitation_labels, email_template)
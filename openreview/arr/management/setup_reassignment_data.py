@@ -8,6 +8,7 @@ def process(client, invitation):
         print('invitation is not yet active and no child invitations created', cdate)
         return
 
+    import time
     from openreview.venue import matching
     from openreview.arr.helpers import get_resubmissions
     from collections import defaultdict
@@ -19,40 +20,41 @@ def process(client, invitation):
         else:
             return ''
 
-    def replace_edge(existing_edge=None, edge_inv=None, new_weight=None, submission_id=None, profile_id=None, edge_readers=None):
-        client.delete_edges(
-            invitation=edge_inv,
-            id=existing_edge['id'],
-            wait_to_finish=True,
-            soft_delete=True
-        )
-        if submission_id:
-            print(f'{profile_id}->{submission_id},weight={new_weight}')
-            client.post_edge(
-                openreview.api.Edge(
-                    invitation=edge_inv,
-                    head=submission_id,
-                    tail=profile_id,
-                    weight=new_weight,
-                    readers=edge_readers,
-                    writers=[venue_id],
-                    signatures=[venue_id]
-                )
-            )
-        else:
-            group_id = edge_inv.split('/-/')[0]
-            client.post_edge(
-                openreview.api.Edge(
-                    invitation=edge_inv,
-                    head=group_id,
-                    tail=profile_id,
-                    weight=new_weight,
-                    readers=edge_readers,
-                    writers=[venue_id],
-                    signatures=[venue_id]
-                )
-            )
-
+    phase_times = {}
+    def record_phase(name, start):
+        phase_times[name] = time.time() - start
+        print(f'{name}: {phase_times[name]:.2f}s')
+
+    def replace_edges(edge_inv, changes):
+        ## Soft delete the existing edges and post the edges with the new weights, changes are keyed by (head, tail)
+        if not changes:
+            return
+        deleted_edges = []
+        new_edges = []
+        for (head, tail), (existing_edge, new_weight, edge_readers) in changes.items():
+            print(f'{tail}->{head},weight={new_weight}')
+            deleted_edges.append(openreview.api.Edge(
+                id=existing_edge['id'],
+                invitation=edge_inv,
+                head=head,
+                tail=tail,
+                weight=existing_edge['weight'],
+                readers=edge_readers,
+                writers=[venue_id],
+                signatures=[venue_id],
+                ddate=now
+            ))
+            new_edges.append(openreview.api.Edge(
+                invitation=edge_inv,
+                head=head,
+                tail=tail,
+                weight=new_weight,
+                readers=edge_readers,
+                writers=[venue_id],
+                signatures=[venue_id]
+            ))
+        openreview.tools.post_bulk_edges(client, deleted_edges)
+        openreview.tools.post_bulk_edges(client, new_edges)
 
     domain = client.get_group(invitation.domain)
     venue_id = domain.id
@@ -98,6 +100,7 @@ def process(client, invitation):
     print(f"records of resubmission: {','.join([s.id for s in resubmissions])}")
 
     # Fetch profiles and map names to profile IDs - account for change in preferred names
+    phase_start = time.time()
     reviewer_profiles = []
     all_profiles = []
     name_to_id = {}
@@ -113,8 +116,10 @@ def process(client, invitation):
         )
         for name_obj in filtered_names:
             name_to_id[name_obj['username']] = profile.id
+    record_phase('profile fetch', phase_start)
 
     # Build load map
+    phase_start = time.time()
     id_to_load_note = {}
     for role_id in [reviewers_id, area_chairs_id, senior_area_chairs_id]:
         load_notes = client.get_all_notes(invitation=f"{role_id}/-/{max_load_name}") ## Assume only 1 note per user
@@ -123,8 +128,10 @@ def process(client, invitation):
                 continue
             note_signature_id = name_to_id[note.signatures[0]]
             id_to_load_note[note_signature_id] = note
+    record_phase('load map', phase_start)
 
     # Build track map
+    phase_start = time.time()
     track_to_ids = {}
     for role_id in [reviewers_id, area_chairs_id, senior_area_chairs_id]:
         track_to_ids[role_id] = defaultdict(list)
@@ -145,6 +152,7 @@ def process(client, invitation):
         area_chairs_id: [venue_id, senior_area_chairs_id],
         senior_area_chairs_id: [venue_id]
     }
+    record_phase('track map', phase_start)
 
     # Create reviewers submitted groups 
     for submission in submissions:
@@ -171,33 +179,19 @@ def process(client, invitation):
             )
         )
 
-    # Reset custom max papers to ground truth notes
+    # Reset custom max papers to ground truth notes, the weights are posted after adding the resubmissions
+    phase_start = time.time()
+    cmp_weights = {}
     for role_id in [reviewers_id, area_chairs_id, senior_area_chairs_id]:
-        cmp_to_post = []
         role_cmp_inv = f"{role_id}/-/Custom_Max_Papers"
+        cmp_weights[role_cmp_inv] = {}
         for id, note in id_to_load_note.items():
             load_invitation = [inv for inv in note.invitations if max_load_name in inv][0]
             if role_id not in load_invitation:
                 continue
+            cmp_weights[role_cmp_inv][(role_id, id)] = int(note.content['maximum_load_this_cycle']['value'])
 
-            cmp_to_post.append(
-                openreview.api.Edge(
-                    invitation=role_cmp_inv,
-                    head=role_id,
-                    tail=id,
-                    weight=int(note.content['maximum_load_this_cycle']['value']),
-                    readers=track_edge_readers[role_id] + [id],
-                    writers=[venue_id],
-                    signatures=[venue_id]
-                )
-            )
-        client.delete_edges(
-            invitation=role_cmp_inv,
-            soft_delete=True,
-            wait_to_finish=True
-        )
-        openreview.tools.post_bulk_edges(client=client, edges=cmp_to_post)
-    
+    affinity_changes = { rev_affinity_inv: {}, ae_affinity_inv: {} }
 
     print('iterating through')
     print(list(resubmissions))
@@ -244,11 +238,6 @@ def process(client, invitation):
             
             if reviewer not in name_to_id or name_to_id[reviewer] not in rev_scores:
                 continue
-            
-            rev_cmp = {
-                g['id']['tail'] : g['values'][0]
-                for g in current_client.get_grouped_edges(invitation=rev_cmp_inv, select='id,weight', groupby='tail')
-            }
 
             reviewer_id = name_to_id[reviewer]
             reviewer_edge = rev_scores[reviewer_id]
@@ -280,23 +269,9 @@ def process(client, invitation):
                         'role': reviewers_id,
                         'name': reviewer_id
                     })
-                    reviewer_cmp_edge = rev_cmp[reviewer_id] ##note implies cmp edge
-                    replace_edge(
-                        existing_edge=reviewer_cmp_edge,
-                        edge_inv=rev_cmp_inv,
-                        new_weight=reviewer_cmp_edge['weight'] + 1,
-                        profile_id=reviewer_id,
-                        edge_readers=[venue_id, senior_area_chairs_id, area_chairs_id, reviewer_id]
-                    )
+                    cmp_weights[rev_cmp_inv][(reviewers_id, reviewer_id)] += 1 ##note implies cmp edge
 
-            replace_edge(
-                existing_edge=reviewer_edge,
-                edge_inv=rev_affinity_inv,
-                new_weight=updated_weight,
-                submission_id=submission.id,
-                profile_id=reviewer_id,
-                edge_readers=[venue_id, senior_area_chairs_id, area_chairs_id, reviewer_id]
-            )
+            affinity_changes[rev_affinity_inv][(submission.id, reviewer_id)] = (reviewer_edge, updated_weight, [venue_id, senior_area_chairs_id, area_chairs_id, reviewer_id])
 
         # Handle AE reassignments
         for ae in previous_ae.members:
@@ -309,11 +284,6 @@ def process(client, invitation):
             if ae not in name_to_id or name_to_id[ae] not in ae_scores:
                 continue
 
-            ae_cmp = {
-                g['id']['tail'] : g['values'][0]
-                for g in current_client.get_grouped_edges(invitation=ae_cmp_inv, select='id,weight', groupby='tail')
-            }
-
             ae_id = name_to_id[ae]
             ae_edge = ae_scores[ae_id]
 
@@ -344,23 +314,9 @@ def process(client, invitation):
                         'role': area_chairs_id,
                         'name': ae_id
                     })
-                    ae_cmp_edge = ae_cmp[ae_id] ##note implies cmp edge
-                    replace_edge(
-                        existing_edge=ae_cmp_edge,
-                        edge_inv=ae_cmp_inv,
-                        new_weight=ae_cmp_edge['weight'] + 1,
-                        profile_id=ae_id,
-                        edge_readers=[venue_id, senior_area_chairs_id, ae_id]
-                    )
+                    cmp_weights[ae_cmp_inv][(area_chairs_id, ae_id)] += 1 ##note implies cmp edge
 
-            replace_edge(
-                existing_edge=ae_edge,
-                edge_inv=ae_affinity_inv,
-                new_weight=updated_weight,
-                submission_id=submission.id,
-                profile_id=ae_id,
-                edge_readers=[venue_id, senior_area_chairs_id, ae_id]
-            )
+            affinity_changes[ae_affinity_inv][(submission.id, ae_id)] = (ae_edge, updated_weight, [venue_id, senior_area_chairs_id, ae_id])
 
         # 2) Grant readership to previous submissions
         if venue.get_area_chairs_id(number=submission.number) not in previous_ae.members:
@@ -368,6 +324,29 @@ def process(client, invitation):
         if venue.get_reviewers_id(number=submission.number, submitted=True) not in previous_reviewers.members:
             current_client.add_members_to_group(previous_reviewers, venue.get_reviewers_id(number=submission.number, submitted=True))
 
+    # Apply the weight changes, one soft delete and one bulk post per invitation
+    for role_cmp_inv, weights in cmp_weights.items():
+        role_id = role_cmp_inv.split('/-/')[0]
+        client.delete_edges(
+            invitation=role_cmp_inv,
+            soft_delete=True,
+            wait_to_finish=True
+        )
+        openreview.tools.post_bulk_edges(client=client, edges=[
+            openreview.api.Edge(
+                invitation=role_cmp_inv,
+                head=head,
+                tail=tail,
+                weight=weight,
+                readers=track_edge_readers[role_id] + [tail],
+                writers=[venue_id],
+                signatures=[venue_id]
+            ) for (head, tail), weight in weights.items()
+        ])
+    for edge_inv, changes in affinity_changes.items():
+        replace_edges(edge_inv, changes)
+    record_phase('edge rewrite', phase_start)
+
     # 3) Post track edges
     for role_id, track_to_members in track_to_ids.items():
         track_edges_to_post = []
@@ -400,28 +379,27 @@ def process(client, invitation):
         openreview.tools.post_bulk_edges(client=client, edges=track_edges_to_post)
 
     # 5) Post status edges
+    status_by_invitation = defaultdict(dict)
     for head, edges in reassignment_status.items():
         for edge_info in edges:
-            role = edge_info['role']
-            status_inv = f"{role}/-/{status_name}"
-            client.delete_edges(
+            status_by_invitation[f"{edge_info['role']}/-/{status_name}"][(head, edge_info['tail'])] = edge_info
+    for status_inv, status_edges in status_by_invitation.items():
+        role = status_inv.split('/-/')[0]
+        existing_status_edges = [e for e in client.get_all_edges(invitation=status_inv) if (e.head, e.tail) in status_edges]
+        for edge in existing_status_edges:
+            edge.ddate = now
+        openreview.tools.post_bulk_edges(client, existing_status_edges)
+        openreview.tools.post_bulk_edges(client, [
+            openreview.api.Edge(
                 invitation=status_inv,
-                tail=edge_info['tail'],
                 head=head,
-                wait_to_finish=True,
-                soft_delete=True
-            )
-            client.post_edge(
-                openreview.api.Edge(
-                    invitation=status_inv,
-                    head=head,
-                    tail=edge_info['tail'],
-                    label=edge_info['label'],
-                    readers=track_edge_readers[role] + [edge_info['tail']],
-                    writers=[venue_id],
-                    signatures=[venue_id]
-                )
-            )
+                tail=tail,
+                label=edge_info['label'],
+                readers=track_edge_readers[role] + [tail],
+                writers=[venue_id],
+                signatures=[venue_id]
+            ) for (head, tail), edge_info in status_edges.items()
+        ])
 
     # 6) Post seniority edges
     seniority_edges = []
@@ -9,22 +9,26 @@ def process(client, invitation):
         print('invitation is not yet active and no child invitations created', cdate)
         return
 
-    import time, calendar
+    import time, calendar, json
     registration_name = 'Registration'
     max_load_name = 'Max_Load_And_Unavailability_Request'
     reviewer_license_name = 'License_Agreement'
 
-    def _is_identical_content(note_to_post, notes):
-        for note in notes:
-            is_identical = True
-            if set(note.content.keys()) != set(note_to_post.content.keys()):
-                continue
-            for k, v in note_to_post.content.items():
-                if v['value'] != note.content[k]['value']:
-                    is_identical = False
-            if is_identical:
-                return note
-        return None
+    def _content_key(note):
+        ## Notes of the same user with the same content fields and values have the same key
+        return json.dumps([note.signatures[0] if note.signatures else None, { k: v.get('value') for k, v in note.content.items() }], sort_keys=True, default=str)
+
+    def _post_note_edits(note_edits, desc):
+        def post_note_edit(note_edit):
+            invitation_id, note = note_edit
+            client.post_note_edit(
+                invitation=invitation_id,
+                signatures=note.signatures,
+                readers=note.readers,
+                note=note
+            )
+        print(f'{desc}: posting {len(note_edits)} notes')
+        openreview.tools.concurrent_requests(post_note_edit, note_edits, desc=desc)
 
     def _is_not_available(month: str, year: int, current_date: datetime.datetime, posted_date: datetime.datetime) -> bool:
         """
@@ -123,12 +127,15 @@ def process(client, invitation):
         reg_invitation = client.get_invitation(f"{role}/-/{registration_name}")
         next_reg_invitation = client.get_invitation(f"{next_cycle_id}/{role.split('/')[-1]}/-/{registration_name}")
 
-        existing_notes = client.get_all_notes(invitation=next_reg_invitation.id)
+        existing_keys = set(_content_key(note) for note in client.get_all_notes(invitation=next_reg_invitation.id))
         notes = client.get_all_notes(invitation=reg_invitation.id)
 
+        note_edits = []
         for note in notes:
-            if _is_identical_content(note, existing_notes):
+            note_key = _content_key(note)
+            if note_key in existing_keys:
                 continue
+            existing_keys.add(note_key)
             # Clear note fields
             note.id = None
             note.invitations = None
@@ -139,27 +146,26 @@ def process(client, invitation):
             note.writers = [next_cycle_id, note.signatures[0]]
             note.forum = next_reg_invitation.edit['note']['forum']
             note.replyto = next_reg_invitation.edit['note']['replyto']
+            note_edits.append((f"{next_cycle_id}/{role.split('/')[-1]}/-/{registration_name}", note))
 
-            client.post_note_edit(
-                invitation=f"{next_cycle_id}/{role.split('/')[-1]}/-/{registration_name}",
-                signatures=note.signatures,
-                readers=note.readers,
-                note=note
-            )
+        _post_note_edits(note_edits, f'copy_{registration_name}')
 
     # Reviewer License Notes (Registraton Notes)
     reviewers_id = domain.content['reviewers_id']['value'].replace(venue_id, previous_cycle_id)
     license_invitation = client.get_invitation(f"{reviewers_id}/-/{reviewer_license_name}")
     next_license_invitation = client.get_invitation(f"{next_cycle_id}/{reviewers_id.split('/')[-1]}/-/{reviewer_license_name}")
 
-    existing_notes = client.get_all_notes(invitation=next_license_invitation.id)
+    existing_keys = set(_content_key(note) for note in client.get_all_notes(invitation=next_license_invitation.id))
     notes = client.get_all_notes(invitation=license_invitation.id)
 
+    note_edits = []
     for note in notes:
-        if _is_identical_content(note, existing_notes):
+        note_key = _content_key(note)
+        if note_key in existing_keys:
             continue
         if 'agree for this cycle and all future cycles' not in note.content['agreement']['value'].lower():
             continue
+        existing_keys.add(note_key)
         # Clear note fields
         note.id = None
         note.invitations = None
@@ -170,13 +176,9 @@ def process(client, invitation):
         note.writers = [next_cycle_id, note.signatures[0]]
         note.forum = next_license_invitation.edit['note']['forum']
         note.replyto = next_license_invitation.edit['note']['replyto']
+        note_edits.append((f"{next_cycle_id}/{reviewers_id.split('/')[-1]}/-/{reviewer_license_name}", note))
 
-        client.post_note_edit(
-            invitation=f"{next_cycle_id}/{reviewers_id.split('/')[-1]}/-/{reviewer_license_name}",
-            signatures=note.signatures,
-            readers=note.readers,
-            note=note
-        )
+    _post_note_edits(note_edits, f'copy_{reviewer_license_name}')
 
     # Edges (Expertise Edges)
     for role in roles:
@@ -185,17 +187,19 @@ def process(client, invitation):
             groupby='tail',
             select='head,label')
         }
-        existing_exp_edges = {o['id']['tail']: [e['head'] for e in o['values']] for o in client.get_grouped_edges(
+        existing_exp_edges = set((o['id']['tail'], e['head']) for o in client.get_grouped_edges(
             invitation=f"{next_cycle_id}/{role.split('/')[-1]}/-/Expertise_Selection",
             groupby='tail',
-            select='head')
-        }
+            select='head') for e in o['values']
+        )
 
+        edges_to_post = []
         for tail, pub_edges in exp_edges.items():
             for pub_edge in pub_edges:
-                if tail in existing_exp_edges and pub_edge['head'] in existing_exp_edges[tail]:
+                if (tail, pub_edge['head']) in existing_exp_edges:
                     continue
-                client.post_edge(
+                existing_exp_edges.add((tail, pub_edge['head']))
+                edges_to_post.append(
                     openreview.api.Edge(
                         invitation=f"{next_cycle_id}/{role.split('/')[-1]}/-/Expertise_Selection",
                         readers=[next_cycle_id, tail],
@@ -207,6 +211,9 @@ def process(client, invitation):
                     )
                 )
 
+        print(f'{role}: posting {len(edges_to_post)} expertise edges')
+        openreview.tools.post_bulk_edges(client, edges_to_post)
+
     # Conditionally post unavailability notes
     month_to_number = {name: number for number, name in enumerate(calendar.month_name)}
     cycle_year = int(venue_id.split('/')[-2])
@@ -216,9 +223,10 @@ def process(client, invitation):
         load_invitation = client.get_invitation(f"{role}/-/{max_load_name}")
         next_load_invitation = client.get_invitation(f"{next_cycle_id}/{role.split('/')[-1]}/-/{max_load_name}")
 
-        existing_notes = client.get_all_notes(invitation=next_load_invitation.id)
+        existing_keys = set(_content_key(note) for note in client.get_all_notes(invitation=next_load_invitation.id))
         notes = client.get_all_notes(invitation=load_invitation.id)
 
+        note_edits = []
         for note in notes:
             next_available_date = _is_not_available(
                 note.content.get('next_available_month', {}).get('value'),
@@ -239,11 +247,10 @@ def process(client, invitation):
                 note.content['maximum_load_this_cycle'] = {'value': '0'}
                 note.content['next_available_month'] = {'value': next_available_date[0]}
                 note.content['next_available_year'] = {'value': next_available_date[1]}
-                
-                if not _is_identical_content(note, existing_notes):
-                    client.post_note_edit(
-                        invitation=f"{next_cycle_id}/{role.split('/')[-1]}/-/{max_load_name}",
-                        signatures=note.signatures,
-                        readers=note.readers,
-                        note=note
-                    )
\ No newline at end of file
+
+                note_key = _content_key(note)
+                if note_key not in existing_keys:
+                    existing_keys.add(note_key)
+                    note_edits.append((f"{next_cycle_id}/{role.split('/')[-1]}/-/{max_load_name}", note))
+
+        _post_note_edits(note_edits, f'copy_{max_load_name}')
@@ -27,6 +27,41 @@ def _jaccard_similarity(list1, list2):
     union = set1.union(set2)
     return len(intersection) / len(union)
 
+def _subject_area_scores(papers_subject_areas, users_subject_areas, threshold=None):
+    '''
+    Yield the Jaccard similarity of the subject areas of every paper and every user as (paper position, user position, score).
+
+    The subject areas are encoded once as sparse binary rows, the papers x areas matrix and the areas x users matrix stored by area,
+    and the intersections of a paper with all the users are the row of their sparse product, so only the pairs with common areas are visited.
+    If threshold is present, only the scores greater than the threshold are yielded, threshold=0 skips the pairs without common areas.
+    '''
+    area_positions = {}
+    def encode(subject_areas):
+        return { area_positions.setdefault(area, len(area_positions)) for area in subject_areas }
+
+    paper_rows = [encode(subject_areas) for subject_areas in papers_subject_areas]
+    user_rows = [encode(subject_areas) for subject_areas in users_subject_areas]
+    users_by_area = [[] for _ in range(len(area_positions))]
+    for user_position, row in enumerate(user_rows):
+        for area in row:
+            users_by_area[area].append(user_position)
+    user_sizes = [len(row) for row in user_rows]
+
+    for paper_position, row in enumerate(paper_rows):
+        intersections = {}
+        for area in row:
+            for user_position in users_by_area[area]:
+                intersections[user_position] = intersections.get(user_position, 0) + 1
+
+        paper_size = len(row)
+        user_positions = sorted(intersections) if threshold is not None else range(len(user_rows))
+        for user_position in user_positions:
+            intersection = intersections.get(user_position, 0)
+            union = paper_size + user_sizes[user_position] - intersection
+            score = intersection / union if union else 0
+            if threshold is None or score > threshold:
+                yield paper_position, user_position, score
+
 def _conflict_label(conflicts):
     if len(conflicts) == 0:
         return 'None'
@@ -57,7 +92,7 @@ class Matching(object):
         self.is_senior_area_chair = conference.get_senior_area_chairs_id() == match_group.id
         self.is_ethics_reviewer = conference.get_ethics_reviewers_id() == match_group.id
         self.should_read_by_area_chair = conference.get_reviewers_id() == match_group.id and conference.use_area_chairs
-
+        self.author_info_cache = {}
 
     def _get_edge_invitation_id(self, edge_name):
         '''
@@ -231,27 +266,30 @@ class Matching(object):
         invitation = self.client.post_invitation(invitation)
         return invitation
 
-    def _build_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years):
+    def _build_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years, workers=None):
         if self.alternate_matching_group:
             other_matching_group = self.client.get_group(self.alternate_matching_group)
             other_matching_profiles = tools.get_profiles(self.client, other_matching_group.members)
             return self._build_profile_conflicts(other_matching_profiles, user_profiles)
-        return self._build_note_conflicts(submissions, user_profiles, get_profile_info, compute_conflicts_n_years)
+        return self._build_note_conflicts(submissions, user_profiles, get_profile_info, compute_conflicts_n_years, workers)
 
-    def append_note_conflicts(self, profile_id, build_conflicts=None):
+    def append_note_conflicts(self, profile_ids, build_conflicts=None, compute_conflicts_n_years=None, workers=None):
         '''
-        Create conflict edges between the given Notes and a single profile
+        Create conflict edges between all the submissions and the given profiles, replacing only the conflicts of these profiles.
+        The authors of the submissions are loaded once for all the profiles, and only the first time when the same Matching is used again.
         '''
-
-        # Adapt single profile to multi-profile code
-        user_profiles = [profile_id]
-        user_profiles = tools.get_profiles(self.client, user_profiles, with_publications=build_conflicts)
-        # Check for existing OpenReview profile - perform dummy check
-        if user_profiles[0].active == None:
-            raise openreview.OpenReviewException('No profile exists')
+        if isinstance(profile_ids, str):
+            profile_ids = [profile_ids]
+
+        user_profile_by_id = tools.get_profiles(self.client, profile_ids, with_publications=build_conflicts, as_dict=True)
+        # Check for existing OpenReview profiles
+        missing_profiles = [profile_id for profile_id in profile_ids if not user_profile_by_id.get(profile_id) or user_profile_by_id[profile_id].active == None]
+        if missing_profiles:
+            raise openreview.OpenReviewException('No profile exists: {}'.format(', '.join(missing_profiles)))
+        user_profiles = list({ profile.id: profile for profile in user_profile_by_id.values() }.values())
         get_profile_info = openreview.tools.get_neurips_profile_info if build_conflicts == 'NeurIPS' else openreview.tools.get_profile_info
         info_function = openreview.tools.info_function_builder(get_profile_info)
-        user_profiles_info = [info_function(p) for p in user_profiles]
+        user_profiles_info = [info_function(p, compute_conflicts_n_years) for p in user_profiles]
 
         # Re-setup information that would have been initialized in setup()
         submissions = self.conference.client.get_all_notes(
@@ -264,125 +302,89 @@ class Matching(object):
         except:
             raise openreview.OpenReviewException('Failed to retrieve conflict invitation')
 
-        edges = []
-
-        # Redo submission-author-user loop from _build_note_conflicts
-        for submission in tqdm(submissions, total=len(submissions), desc='_build_conflicts'):
-            # Get author profiles
-            authorids = submission.content['authorids']
-            if submission.details and submission.details.get('original'):
-                authorids = submission.details['original']['content']['authorids']
-
-            # Extract domains from each profile
-            author_profiles = tools.get_profiles(self.client, authorids, with_publications=True)
-            author_domains = set()
-            author_emails = set()
-            author_relations = set()
-            author_publications = set()
-
-            for author_profile in author_profiles:
-                author_info = info_function(author_profile)
-                author_domains.update(author_info['domains'])
-                author_emails.update(author_info['emails'])
-                author_relations.update(author_info['relations'])
-                author_publications.update(author_info['publications'])
-
-            # Compute conflicts for the user and all the paper authors
-            for user_info in user_profiles_info:
-                conflicts = set()
-                conflicts.update(author_domains.intersection(user_info['domains']))
-                conflicts.update(author_relations.intersection(user_info['emails']))
-                conflicts.update(author_emails.intersection(user_info['relations']))
-                conflicts.update(author_emails.intersection(user_info['emails']))
-                conflicts.update(author_publications.intersection(user_info['publications']))
-
-                if conflicts:
-                    edges.append(Edge(
-                        invitation=invitation.id,
-                        head=submission.id,
-                        tail=user_info['id'],
-                        weight=-1,
-                        label='Conflict',
-                        readers=self._get_edge_readers(tail=user_info['id']),
-                        writers=[self.conference.id],
-                        signatures=[self.conference.id]
-                    ))
+        authors_info_list = self._get_authors_info(submissions, get_profile_info, compute_conflicts_n_years)
+        positions_by_submission = tools.search_conflicts(user_profiles_info, authors_info_list, match_ids=False, workers=workers)
+        edges = self._get_conflict_edges(invitation.id, submissions, user_profiles_info, positions_by_submission)
 
-        ## Delete any previous conflicts related to single user
-        self.client.delete_edges(invitation.id, tail=user_info['id'], wait_to_finish=True)
+        ## Delete any previous conflicts related to the given users
+        for user_info in user_profiles_info:
+            self.client.delete_edges(invitation.id, tail=user_info['id'], wait_to_finish=True)
 
-        original_edges_posted = self.client.get_edges_count(invitation=invitation.id)
         openreview.tools.post_bulk_edges(client=self.client, edges=edges)
 
         # Perform sanity check
-        edges_posted = self.client.get_edges_count(invitation=invitation.id)
-        intended_edges_posted = original_edges_posted + len(edges)
-        if intended_edges_posted < edges_posted:
-            raise openreview.OpenReviewException('Failed during bulk post of Conflict edges! Conflicts found: {0}, Edges posted: {1}'.format(intended_edges_posted, edges_posted))
+        edges_posted = sum(self.client.get_edges_count(invitation=invitation.id, tail=user_info['id']) for user_info in user_profiles_info)
+        if edges_posted < len(edges):
+            raise openreview.OpenReviewException('Failed during bulk post of Conflict edges! Conflicts found: {0}, Edges posted: {1}'.format(len(edges), edges_posted))
         return invitation
 
-
-    def _build_note_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years=None):
+    def _get_authors_info(self, submissions, get_profile_info, compute_conflicts_n_years=None):
         '''
-        Create conflict edges between the given Notes and Profiles
+        Returns the conflict info of the authors of each submission. The info of the authors is kept in the Matching, so the authors
+        are only loaded once when the conflicts are computed several times.
         '''
         info_function = tools.info_function_builder(get_profile_info)
-        invitation = self._create_edge_invitation(self.conference.get_conflict_score_id(self.match_group.id))
-        # Get profile info from the match group
-        user_profiles_info = [info_function(p, compute_conflicts_n_years) for p in user_profiles]
-        # Get profile info from all the authors
-        all_authorids = []
-        for submission in submissions:
-            authorids = submission.content['authorids']
+        author_info_by_id = self.author_info_cache.setdefault((get_profile_info, compute_conflicts_n_years), {})
+
+        def get_authorids(submission):
             if submission.details and submission.details.get('original'):
-                authorids = submission.details['original']['content']['authorids']
-            all_authorids = all_authorids + authorids
+                return submission.details['original']['content']['authorids']
+            return submission.content['authorids']
 
-        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, as_dict=True)
+        # Get profile info from the authors that are not in the cache
+        missing_authorids = set()
+        for submission in submissions:
+            missing_authorids.update(authorid for authorid in get_authorids(submission) if authorid not in author_info_by_id)
 
-        edges = []
+        if missing_authorids:
+            author_profile_by_id = tools.get_profiles(self.client, list(missing_authorids), with_publications=True, as_dict=True)
+            for authorid in missing_authorids:
+                author_profile = author_profile_by_id.get(authorid)
+                author_info_by_id[authorid] = info_function(author_profile, compute_conflicts_n_years) if author_profile else None
 
-        for submission in tqdm(submissions, total=len(submissions), desc='_build_conflicts'):
-            # Get author profiles
-            authorids = submission.content['authorids']
-            if submission.details and submission.details.get('original'):
-                authorids = submission.details['original']['content']['authorids']
-
-            # Extract domains from each autyhorprofile
-            author_domains = set()
-            author_emails = set()
-            author_relations = set()
-            author_publications = set()
-            for authorid in authorids:
-                if author_profile_by_id.get(authorid):
-                    author_info = info_function(author_profile_by_id[authorid], compute_conflicts_n_years)
-                    author_domains.update(author_info['domains'])
-                    author_emails.update(author_info['emails'])
-                    author_relations.update(author_info['relations'])
-                    author_publications.update(author_info['publications'])
+        authors_info_list = []
+        for submission in submissions:
+            # Extract domains from each author profile
+            authors_info = []
+            for authorid in get_authorids(submission):
+                if author_info_by_id[authorid]:
+                    authors_info.append(author_info_by_id[authorid])
                 else:
                     print(f'Profile not found: {authorid}')
+            authors_info_list.append(authors_info)
+        return authors_info_list
 
-            # Compute conflicts for each user and all the paper authors
-            for user_info in user_profiles_info:
-                conflicts = set()
-                conflicts.update(author_domains.intersection(user_info['domains']))
-                conflicts.update(author_relations.intersection(user_info['emails']))
-                conflicts.update(author_emails.intersection(user_info['relations']))
-                conflicts.update(author_emails.intersection(user_info['emails']))
-                conflicts.update(author_publications.intersection(user_info['publications']))
+    def _get_conflict_edges(self, invitation_id, submissions, user_profiles_info, positions_by_submission):
+        edges = []
+        for submission, positions in zip(submissions, positions_by_submission):
+            for position in positions:
+                user_info = user_profiles_info[position]
+                edges.append(Edge(
+                    invitation=invitation_id,
+                    head=submission.id,
+                    tail=user_info['id'],
+                    weight=-1,
+                    label='Conflict',
+                    readers=self._get_edge_readers(tail=user_info['id']),
+                    writers=[self.conference.id],
+                    signatures=[self.conference.id]
+                ))
+        return edges
 
-                if conflicts:
-                    edges.append(Edge(
-                        invitation=invitation.id,
-                        head=submission.id,
-                        tail=user_info['id'],
-                        weight=-1,
-                        label='Conflict',
-                        readers=self._get_edge_readers(tail=user_info['id']),
-                        writers=[self.conference.id],
-                        signatures=[self.conference.id]
-                    ))
+    def _build_note_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years=None, workers=None):
+        '''
+        Create conflict edges between the given Notes and Profiles. If workers is greater than one, the conflicts are computed by a pool of processes.
+        '''
+        info_function = tools.info_function_builder(get_profile_info)
+        invitation = self._create_edge_invitation(self.conference.get_conflict_score_id(self.match_group.id))
+        # Get profile info from the match group
+        user_profiles_info = [info_function(p, compute_conflicts_n_years) for p in user_profiles]
+        # Get profile info from all the authors
+        authors_info_list = self._get_authors_info(submissions, get_profile_info, compute_conflicts_n_years)
+
+        # Compute conflicts for each user and all the paper authors
+        positions_by_submission = tools.search_conflicts(user_profiles_info, authors_info_list, match_ids=False, workers=workers)
+        edges = self._get_conflict_edges(invitation.id, submissions, user_profiles_info, positions_by_submission)
 
         ## Delete previous conflicts
         self.client.delete_edges(invitation.id, wait_to_finish=True)
@@ -489,129 +491,140 @@ class Matching(object):
     def _build_scores_from_file(self, score_invitation_id, score_file, submissions):
         if self.alternate_matching_group:
             return self._build_profile_scores(score_invitation_id, score_file)
-        scores = []
-        with open(score_file) as file_handle:
-            scores = [row for row in csv.reader(file_handle)]
-        return self._build_note_scores(score_invitation_id, scores, submissions)
+        return self._build_note_scores(score_invitation_id, tools.ScoreRows(score_file=score_file), submissions)
 
     def _build_scores_from_stream(self, score_invitation_id, scores_stream, submissions):
-        scores = [input_line.split(',') for input_line in scores_stream.decode().split('\n')]
-        return self._build_note_scores(score_invitation_id, scores, submissions)
+        return self._build_note_scores(score_invitation_id, tools.ScoreRows(scores_stream=scores_stream), submissions)
 
     def _build_note_scores(self, score_invitation_id, scores, submissions):
         '''
-        Given an array of scores and submissions, create score edges
+        Given an iterable of scores and submissions, create score edges and post them while the scores are read
         '''
         invitation = self._create_edge_invitation(score_invitation_id)
 
         submissions_per_id = {note.id: note.number for note in submissions}
+        if not isinstance(scores, tools.ScoreRows):
+            scores = tools.ScoreRows(rows=scores)
 
-        edges = []
         deleted_papers = set()
-        for score_line in tqdm(scores, desc='_build_scores'):
-            if score_line:
-                paper_note_id = score_line[0]
-                paper_number = submissions_per_id.get(paper_note_id)
-                if paper_number:
-                    profile_id = score_line[1]
-                    score = str(max(round(float(score_line[2]), 4), 0))
-                    edges.append(openreview.Edge(
-                        invitation=invitation.id,
-                        head=paper_note_id,
-                        tail=profile_id,
-                        weight=float(score),
-                        readers=self._get_edge_readers(tail=profile_id),
-                        nonreaders=[self.conference.get_authors_id(number=paper_number)],
-                        writers=[self.conference.id],
-                        signatures=[self.conference.id]
-                    ))
-                else:
-                    deleted_papers.add(paper_note_id)
-
-        print('deleted papers', deleted_papers)
+        invalid_rows = []
+        def score_edges():
+            for score_line in tqdm(scores, desc='_build_scores'):
+                if score_line:
+                    paper_note_id = score_line[0]
+                    paper_number = submissions_per_id.get(paper_note_id)
+                    if paper_number:
+                        profile_id = score_line[1]
+                        score = tools.get_row_score(score_line)
+                        if score is None:
+                            invalid_rows.append(score_line)
+                            continue
+                        yield openreview.Edge(
+                            invitation=invitation.id,
+                            head=paper_note_id,
+                            tail=profile_id,
+                            weight=score,
+                            readers=self._get_edge_readers(tail=profile_id),
+                            nonreaders=[self.conference.get_authors_id(number=paper_number)],
+                            writers=[self.conference.id],
+                            signatures=[self.conference.id]
+                        )
+                    else:
+                        deleted_papers.add(paper_note_id)
 
         ## Delete previous scores
         self.client.delete_edges(invitation.id, wait_to_finish=True)
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
+        edges_count = tools.post_bulk_edges_stream(self.client, score_edges())
+
+        print('deleted papers', deleted_papers)
+        if invalid_rows:
+            print('invalid score rows', invalid_rows)
+
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation.id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, len(edges), edges_posted))
+        if edges_posted < edges_count:
+            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Scores found: {1}, Edges posted: {2}'.format(score_invitation_id, edges_count, edges_posted))
         return invitation
 
     def _build_profile_scores(self, score_invitation_id, score_file = None, scores = None):
         '''
-        Given a csv file or score list with affinity scores, create score edges
+        Given a csv file or score list with affinity scores, create score edges and post them while the scores are read
         '''
         invitation = self._create_edge_invitation(score_invitation_id)
-        edges = []
 
         # Validate and select scores
         if not scores and not score_file:
             raise openreview.OpenReviewException('No profile scores provided')
         if scores:
-            score_handle = scores
+            score_handle = scores if isinstance(scores, tools.ScoreRows) else tools.ScoreRows(rows=scores)
         elif score_file:
-            score_handle = csv.reader(open(score_file))
-
-        for row in tqdm(score_handle, desc='_build_scores'):
-            edges.append(Edge(
-                invitation=invitation.id,
-                head=row[0],
-                tail=row[1],
-                weight=str(max(round(float(row[2]), 4), 0)),
-                readers=self._get_edge_readers(tail=row[1]),
-                writers=[self.conference.id],
-                signatures=[self.conference.id]
-            ))
+            score_handle = tools.ScoreRows(score_file=score_file)
+
+        invalid_rows = []
+        def score_edges():
+            for row in tqdm(score_handle, desc='_build_scores'):
+                score = tools.get_row_score(row)
+                if score is None:
+                    invalid_rows.append(row)
+                    continue
+                yield Edge(
+                    invitation=invitation.id,
+                    head=row[0],
+                    tail=row[1],
+                    weight=str(score),
+                    readers=self._get_edge_readers(tail=row[1]),
+                    writers=[self.conference.id],
+                    signatures=[self.conference.id]
+                )
 
         ## Delete previous scores
         self.client.delete_edges(invitation.id, wait_to_finish=True)
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
+        edges_count = tools.post_bulk_edges_stream(self.client, score_edges())
+        if invalid_rows:
+            print('invalid score rows', invalid_rows)
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation.id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, len(edges), edges_posted))
+        if edges_posted < edges_count:
+            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, edges_count, edges_posted))
         return invitation
 
-    def _build_subject_area_scores(self, submissions):
+    def _build_subject_area_scores(self, submissions, threshold=None):
         '''
         Create subject area scores between all users in the match group and all given submissions
+
+        If threshold is present, only the scores greater than the threshold are posted, threshold=0 skips the pairs without common subject areas.
         '''
         invitation = self._create_edge_invitation(self._get_edge_invitation_id('Subject_Areas_Score'))
 
-        edges = []
-        user_subject_areas = self.client.get_all_notes(invitation=self.conference.get_registration_id(self.match_group.id))
-
-        for note in tqdm(submissions, total=len(submissions), desc='_build_subject_area_scores'):
-            note_subject_areas = note.content['subject_areas']
-            paper_note_id = note.id
-            for subject_area_note in user_subject_areas:
-                profile_id = subject_area_note.signatures[0]
-                if profile_id in self.match_group.members:
-                    subject_areas = subject_area_note.content['subject_areas']
-                    score = _jaccard_similarity(note_subject_areas, subject_areas)
-                    edges.append(Edge(
-                        invitation=invitation.id,
-                        head=paper_note_id,
-                        tail=profile_id,
-                        weight=float(score),
-                        readers=self._get_edge_readers(tail=profile_id),
-                        writers=[self.conference.id],
-                        signatures=[self.conference.id]
-                    ))
+        members = set(self.match_group.members)
+        user_subject_areas = [note for note in self.client.get_all_notes(invitation=self.conference.get_registration_id(self.match_group.id)) if note.signatures[0] in members]
+        profile_ids = [note.signatures[0] for note in user_subject_areas]
+        readers_by_profile_id = { profile_id: self._get_edge_readers(tail=profile_id) for profile_id in profile_ids }
+
+        def score_edges():
+            scores = _subject_area_scores([note.content['subject_areas'] for note in submissions], [note.content['subject_areas'] for note in user_subject_areas], threshold=threshold)
+            for paper_position, user_position, score in tqdm(scores, desc='_build_subject_area_scores'):
+                profile_id = profile_ids[user_position]
+                yield Edge(
+                    invitation=invitation.id,
+                    head=submissions[paper_position].id,
+                    tail=profile_id,
+                    weight=float(score),
+                    readers=readers_by_profile_id[profile_id],
+                    writers=[self.conference.id],
+                    signatures=[self.conference.id]
+                )
 
         ## Delete previous scores
         self.client.delete_edges(invitation.id, wait_to_finish=True)
 
-        print('post edges', edges)
-        openreview.tools.post_bulk_edges(client=self.conference.client, edges=edges)
+        edges_count = tools.post_bulk_edges_stream(self.client, score_edges())
         # Perform sanity check
-        edges_posted = self.conference.client.get_edges_count(invitation=invitation.id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of edges! Scores found: {0}, Edges posted: {1}'.format(len(edges), edges_posted))
+        edges_posted = self.client.get_edges_count(invitation=invitation.id)
+        if edges_posted < edges_count:
+            raise openreview.OpenReviewException('Failed during bulk post of edges! Scores found: {0}, Edges posted: {1}'.format(edges_count, edges_posted))
         return invitation
 
     def _compute_scores(self, score_invitation_id, submissions, model='specter+mfr'):
@@ -929,9 +942,11 @@ class Matching(object):
         print(f'Poster {len(edges)} alternate conflict edges')
     
     
-    def setup(self, compute_affinity_scores=False, tpms_score_file=None, elmo_score_file=None, build_conflicts=None, compute_conflicts_n_years=None):
+    def setup(self, compute_affinity_scores=False, tpms_score_file=None, elmo_score_file=None, build_conflicts=None, compute_conflicts_n_years=None, workers=None, subject_area_threshold=None):
         '''
         Build all the invitations and edges necessary to run a match
+
+        If subject_area_threshold is present, only the subject area scores greater than it are posted, see :meth:`Matching._build_subject_area_scores`
         '''
         score_spec = {}
         matching_status = {
@@ -1050,7 +1065,7 @@ class Matching(object):
             }
 
         if self.conference.submission_stage.subject_areas:
-            invitation = self._build_subject_area_scores(submissions)
+            invitation = self._build_subject_area_scores(submissions, threshold=subject_area_threshold)
             score_spec[invitation.id] = {
                 'weight': 1,
                 'default': 0
@@ -1068,7 +1083,7 @@ class Matching(object):
                 }
 
         if build_conflicts:
-            self._build_conflicts(submissions, user_profiles, openreview.tools.get_neurips_profile_info if build_conflicts == 'NeurIPS' else openreview.tools.get_profile_info, compute_conflicts_n_years)
+            self._build_conflicts(submissions, user_profiles, openreview.tools.get_neurips_profile_info if build_conflicts == 'NeurIPS' else openreview.tools.get_profile_info, compute_conflicts_n_years, workers)
 
         self._build_config_invitation(score_spec)
         return matching_status
@@ -1274,8 +1289,13 @@ class Matching(object):
             reviewer_name = self.conference.area_chairs_name
             review_name = 'Meta_Review'
 
-        papers = self.client.get_all_notes(invitation=self.conference.get_blind_submission_id(), details='directReplies')
-        reviews = [reply for paper in papers for reply in paper.details['directReplies'] if review_name in reply['invitation']]
+        ## Stream the submissions and drop their replies once they are checked, only one page of replies is in memory at a time
+        papers = []
+        reviews = []
+        for paper in tools.iterget_notes(self.client, invitation=self.conference.get_blind_submission_id(), details='directReplies'):
+            reviews.extend(reply['id'] for reply in paper.details['directReplies'] if review_name in reply['invitation'])
+            paper.details = None
+            papers.append(paper)
         proposed_assignment_edges =  { g['id']['head']: g['values'] for g in self.client.get_grouped_edges(invitation=self.conference.get_paper_assignment_id(self.match_group.id),
             label=assignment_title, groupby='head', select=None)}
         assignment_edges = []
@@ -0,0 +1,656 @@
+'''
+In-process stand-in of the OpenReview API used to run the clients without a server.
+
+:class:`FakeOpenReviewServer` keeps notes, edges, groups, invitations and profiles in memory and answers the
+requests of :class:`openreview.api.OpenReviewClient` and :class:`openreview.Client` through a requests transport
+adapter mounted on the client session, so no socket is opened. It implements the routes used by the getters and
+by the bulk edge methods with the pagination semantics of the API (limit, offset, after, sort and count), counts the
+requests by route and can add a fixed latency to every request to measure client side changes reproducibly. Requests of a
+route can be made to fail with :meth:`FakeOpenReviewServer.fail_requests` to test the error handling of the clients.
+Use :meth:`FakeOpenReviewServer.intercept` when the code under test creates its own clients.
+
+Example::
+
+    server = openreview.fake_server.FakeOpenReviewServer(latency=0.05)
+    server.add_notes([{ 'id': 'paper1', 'number': 1, 'invitations': ['Venue/-/Submission'], 'content': {} }])
+    client = server.client()
+    client.get_all_notes(invitation='Venue/-/Submission')
+    server.request_counts['GET /notes']
+'''
+
+import bisect
+import collections
+import contextlib
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import jwt
+import requests
+from requests.adapters import BaseAdapter
+
+class FakeTransportAdapter(BaseAdapter):
+    """
+    Requests transport adapter that sends the requests to a :class:`FakeOpenReviewServer` instead of the network.
+
+    :param server: Server that answers the requests
+    :type server: FakeOpenReviewServer
+    """
+    def __init__(self, server):
+        super().__init__()
+        self.server = server
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        return self.server.handle(request)
+
+    def close(self):
+        pass
+
+class FakeOpenReviewServer(object):
+    """
+    In-memory OpenReview API.
+
+    Objects are stored as the JSON returned by the API and can be loaded with :meth:`add_notes`, :meth:`add_edges`, :meth:`add_groups`,
+    :meth:`add_invitations` and :meth:`add_profiles`. Objects without an id get a sequential one, so the id order is the insertion order.
+
+    :param baseurl: Url of the server, the adapter is mounted on this prefix
+    :type baseurl: str, optional
+    :param latency: Seconds added to every request. It can also be a function that receives the method and the path of the request and returns the seconds
+    :type latency: float or function, optional
+    :param latency_per_item: Seconds added for every object returned in the response
+    :type latency_per_item: float, optional
+    :param max_limit: Max number of objects returned per page, it is also the page size when the request has no limit
+    :type max_limit: int, optional
+    """
+    def __init__(self, baseurl='http://fake.openreview.net', latency=0, latency_per_item=0, max_limit=1000):
+        self.baseurl = baseurl.rstrip('/')
+        self.latency = latency
+        self.latency_per_item = latency_per_item
+        self.max_limit = max_limit
+        self.notes = {}
+        self.edges = {}
+        self.groups = {}
+        self.invitations = {}
+        self.profiles = {}
+        self.messages = []
+        self.request_counts = collections.Counter()
+        self.failures = {}
+        self.adapter = FakeTransportAdapter(self)
+        self.lock = threading.RLock()
+        self.query_cache = {}
+        self.content_indexes = {}
+        self.id_counter = 0
+        self.routes = {
+            ('GET', '/notes'): self.get_notes,
+            ('POST', '/notes/edits'): self.post_note_edit,
+            ('POST', '/notes/search'): self.search_notes,
+            ('GET', '/edges'): self.get_edges,
+            ('POST', '/edges'): self.post_edge,
+            ('DELETE', '/edges'): self.delete_edges,
+            ('POST', '/edges/bulk'): self.post_edges,
+            ('GET', '/edges/count'): self.get_edges_count,
+            ('GET', '/groups'): self.get_groups,
+            ('POST', '/groups/edits'): self.post_group_edit,
+            ('PUT', '/groups/members'): self.add_group_members,
+            ('DELETE', '/groups/members'): self.remove_group_members,
+            ('GET', '/invitations'): self.get_invitations,
+            ('POST', '/invitations/edits'): self.post_invitation_edit,
+            ('GET', '/profiles'): self.get_profiles,
+            ('POST', '/profiles/search'): self.search_profiles,
+            ('POST', '/messages'): self.post_message,
+            ('POST', '/login'): self.login
+        }
+
+    ## CLIENTS
+
+    def connect(self, client, user='~Super_User1'):
+        """
+        Mounts the server on the session of a client and authenticates it as user.
+
+        :param client: Client created with the baseurl of the server
+        :type client: openreview.api.OpenReviewClient or openreview.Client
+        :param user: Profile id of the authenticated user
+        :type user: str, optional
+
+        :return: The client
+        """
+        client.session.mount(self.baseurl, self.adapter)
+        token = self.get_token(user)
+        client.token = token
+        client.headers['Authorization'] = 'Bearer ' + token
+        client.user = jwt.decode(token, algorithms=['HS256'], issuer='openreview', options={'verify_signature': False})
+        client.profile = openreview_profile(self.profiles.get(user, { 'id': user }))
+        return client
+
+    def client(self, client_class=None, user='~Super_User1'):
+        """
+        Creates a client connected to the server. The credentials in the environment variables are not used.
+
+        :param client_class: Client to create, defaults to :class:`openreview.api.OpenReviewClient`
+        :type client_class: class, optional
+        :param user: Profile id of the authenticated user
+        :type user: str, optional
+
+        :return: The client
+        """
+        if client_class is None:
+            from openreview.api import OpenReviewClient
+            client_class = OpenReviewClient
+        environ = { key: os.environ.pop(key) for key in ['OPENREVIEW_USERNAME', 'OPENREVIEW_PASSWORD'] if key in os.environ }
+        try:
+            client = client_class(baseurl=self.baseurl)
+        finally:
+            os.environ.update(environ)
+        return self.connect(client, user)
+
+    @contextlib.contextmanager
+    def intercept(self):
+        """
+        Sends the requests of every session to the server while the context is active, including the clients created inside the helpers,
+        for example the API v1 and API v2 clients of :func:`openreview.tools.get_publications`. Nest the contexts of two servers with the
+        baseurls http://localhost:3000 and http://localhost:3001 to serve both APIs.
+        """
+        get_adapter = requests.Session.get_adapter
+        server = self
+
+        def intercepted_get_adapter(session, url):
+            if url.startswith(server.baseurl):
+                return server.adapter
+            return get_adapter(session, url)
+
+        requests.Session.get_adapter = intercepted_get_adapter
+        try:
+            yield self
+        finally:
+            requests.Session.get_adapter = get_adapter
+
+    def get_token(self, user):
+        return jwt.encode({ 'user': { 'id': user, 'profile': { 'id': user } }, 'iss': 'openreview' }, 'fake-openreview-server-signing-key', algorithm='HS256')
+
+    @property
+    def total_requests(self):
+        return sum(self.request_counts.values())
+
+    def reset_counts(self):
+        self.request_counts.clear()
+
+    def fail_requests(self, route, status=500, calls=None, match=None, applied=False):
+        """
+        Makes the requests of a route fail with an error response. Call it with calls=[] to stop the failures of the route.
+
+        :param route: Method and path of the route, like the keys of request_counts, for example 'POST /edges/bulk'
+        :type route: str
+        :param status: Status of the error response
+        :type status: int, optional
+        :param calls: Numbers of the requests of the route that fail, counted from 1 like request_counts. If calls and match are not present every request fails
+        :type calls: list[int], optional
+        :param match: Function that receives the body of a request and returns True if the request fails
+        :type match: function, optional
+        :param applied: If True the request is applied before the error is returned, like a request that timed out after the server handled it
+        :type applied: bool, optional
+        """
+        self.failures[route] = { 'status': status, 'calls': calls, 'match': match, 'applied': applied }
+
+    ## DATA
+
+    def add_notes(self, notes):
+        """
+        Stores notes, a note without forum is a forum.
+
+        :param notes: Note objects or their JSON
+        :type notes: list
+        """
+        with self.lock:
+            stored = self.store(self.notes, notes, 'note')
+            for note in stored:
+                note.setdefault('forum', note['id'])
+                note.setdefault('content', {})
+            return stored
+
+    def add_edges(self, edges):
+        """
+        Stores edges.
+
+        :param edges: Edge objects, their JSON or an :class:`openreview.api.EdgeBatch`
+        :type edges: list
+        """
+        with self.lock:
+            return self.store(self.edges, edges.to_json() if hasattr(edges, 'heads') else edges, 'edge')
+
+    def add_groups(self, groups):
+        """
+        Stores groups.
+
+        :param groups: Group objects or their JSON
+        :type groups: list
+        """
+        with self.lock:
+            stored = self.store(self.groups, groups, 'group')
+            for group in stored:
+                group.setdefault('members', [])
+            return stored
+
+    def add_invitations(self, invitations):
+        """
+        Stores invitations.
+
+        :param invitations: Invitation objects or their JSON
+        :type invitations: list
+        """
+        with self.lock:
+            return self.store(self.invitations, invitations, 'invitation')
+
+    def add_profiles(self, profiles):
+        """
+        Stores profiles. The emails of the content are also added to emailsConfirmed when it is missing.
+
+        :param profiles: Profile objects or their JSON
+        :type profiles: list
+        """
+        with self.lock:
+            stored = self.store(self.profiles, profiles, 'profile')
+            for profile in stored:
+                content = profile.setdefault('content', {})
+                content.setdefault('names', [{ 'username': profile['id'], 'preferred': True }])
+                content.setdefault('emails', [])
+                content.setdefault('emailsConfirmed', list(content['emails']))
+            return stored
+
+    def store(self, objects_by_id, objects, prefix):
+        now = int(time.time() * 1000)
+        stored = []
+        for obj in objects:
+            obj = dict(obj.to_json() if hasattr(obj, 'to_json') else obj)
+            if not obj.get('id'):
+                self.id_counter += 1
+                obj['id'] = f'{prefix}{self.id_counter:09d}'
+            existing = objects_by_id.get(obj['id'])
+            obj['tcdate'] = existing['tcdate'] if existing else obj.get('tcdate') or now
+            obj.setdefault('cdate', obj['tcdate'])
+            obj['tmdate'] = now
+            objects_by_id[obj['id']] = obj
+            stored.append(obj)
+        self.query_cache.clear()
+        self.content_indexes.clear()
+        return stored
+
+    ## TRANSPORT
+
+    def handle(self, request):
+        """
+        Answers a prepared request, it is called by :class:`FakeTransportAdapter`.
+
+        :param request: Prepared request sent by the client session
+        :type request: requests.PreparedRequest
+
+        :return: Response with the JSON answer of the route or the JSON error
+        :rtype: requests.Response
+        """
+        url = urlsplit(request.url)
+        path = url.path[len(urlsplit(self.baseurl).path):].rstrip('/') or '/'
+        query = parse_qs(url.query, keep_blank_values=True)
+        body = json.loads(request.body) if request.body else None
+        with self.lock:
+            self.request_counts[f'{request.method} {path}'] += 1
+            call = self.request_counts[f'{request.method} {path}']
+
+        route = self.routes.get((request.method, path))
+        failure = self.failures.get(f'{request.method} {path}')
+        if failure and not self.should_fail(failure, call, body):
+            failure = None
+        status, payload = 404, { 'name': 'NotFoundError', 'message': f'{request.method} {path} is not implemented by the fake server' }
+        if route and (not failure or failure['applied']):
+            try:
+                with self.lock:
+                    status, payload = 200, route(query, body)
+            except FakeServerError as e:
+                status, payload = e.status, { 'name': e.name, 'message': e.message }
+        if failure:
+            status, payload = failure['status'], { 'name': 'FakeServerError', 'message': f'{request.method} {path} failed' }
+
+        delay = self.latency(request.method, path) if callable(self.latency) else self.latency
+        if self.latency_per_item and status == 200:
+            delay += self.latency_per_item * response_size(payload)
+        if delay:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = 'OK' if status == 200 else payload['name']
+        response.headers['Content-Type'] = 'application/json; charset=utf-8'
+        response._content = json.dumps(payload).encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def should_fail(self, failure, call, body):
+        if failure['calls'] is None and failure['match'] is None:
+            return True
+        return (failure['calls'] is not None and call in failure['calls']) or (failure['match'] is not None and failure['match'](body))
+
+    def query(self, name, objects, query, matches, default_sort=None):
+        """
+        Filters, sorts and paginates the objects of a store like the API does. A request with stream=true gets all the objects.
+
+        The filtered and sorted list is cached until the next write, so walking the pages of a large result only filters it once.
+
+        :param name: Name of the store, used in the cache key
+        :type name: str
+        :param objects: Objects of the store or a subset of them that contains all the matches
+        :type objects: iterable
+
+        :return: Page of objects and the total count of the filtered objects
+        :rtype: tuple(list, int)
+        """
+        sort = first(query, 'sort') or default_sort
+        if first(query, 'after'):
+            sort = 'id'
+        filters = tuple(sorted((key, tuple(values)) for key, values in query.items() if key not in ['limit', 'offset', 'after', 'details', 'select', 'stream']))
+        key = (name, filters, sort)
+        if key not in self.query_cache:
+            if len(self.query_cache) >= 10000:
+                self.query_cache.clear()
+            found = [obj for obj in objects if matches(obj)]
+            if sort:
+                field, _, order = sort.partition(':')
+                found.sort(key=lambda obj: (obj.get(field) is None, obj.get(field) if obj.get(field) is not None else 0), reverse=order == 'desc')
+            self.query_cache[key] = (found, [obj['id'] for obj in found] if sort == 'id' else None)
+        found, ids = self.query_cache[key]
+
+        start = int(first(query, 'offset') or 0)
+        after = first(query, 'after')
+        if after:
+            start = bisect.bisect_right(ids, after)
+        if (first(query, 'stream') or '').lower() == 'true':
+            return found[start:], len(found)
+        limit = min(int(first(query, 'limit') or self.max_limit), self.max_limit)
+        return found[start:start + limit], len(found)
+
+    def page_response(self, name, objects, query, matches, default_sort=None):
+        page, count = self.query(name, objects, query, matches, default_sort)
+        if first(query, 'id') and not page:
+            raise FakeServerError(404, 'NotFoundError', f'{name.capitalize()} {first(query, "id")} not found')
+        return { name: page, 'count': count }
+
+    ## ROUTES
+
+    def get_notes(self, query, body):
+        content_filters = { key[len('content.'):]: values[0] for key, values in query.items() if key.startswith('content.') }
+        filters = field_filters(query, { 'id': 'id', 'forum': 'forum', 'replyto': 'replyto', 'number': 'number', 'paperhash': 'paperhash', 'signature': 'signatures' })
+        invitation = first(query, 'invitation')
+        trash = first(query, 'trash') == 'true'
+
+        def matches(note):
+            if note.get('ddate') and not trash:
+                return False
+            if invitation and invitation not in (note.get('invitations') or [note.get('invitation')]):
+                return False
+            for field, value in content_filters.items():
+                if value not in content_values(note, field):
+                    return False
+            return filters(note)
+
+        ## Look up the first content filter in an index, the publications of a profile are requested by content.authorids
+        notes = self.notes.values()
+        if content_filters:
+            field, value = next(iter(content_filters.items()))
+            notes = self.content_index(field).get(value, [])
+
+        response = self.page_response('notes', notes, query, matches)
+        details = first(query, 'details')
+        if details:
+            response['notes'] = [self.note_details(note, details.split(',')) for note in response['notes']]
+        return response
+
+    def search_notes(self, query, body):
+        notes = [self.notes[note_id] for note_id in dict.fromkeys(body.get('ids', [])) if note_id in self.notes]
+        return { 'notes': notes, 'count': len(notes) }
+
+    def content_index(self, field):
+        if field not in self.content_indexes:
+            index = {}
+            for note in self.notes.values():
+                for value in content_values(note, field):
+                    index.setdefault(value, []).append(note)
+            self.content_indexes[field] = index
+        return self.content_indexes[field]
+
+    def note_details(self, note, details):
+        note = dict(note)
+        replies = [reply for reply in self.notes.values() if reply['forum'] == note['id'] and reply['id'] != note['id'] and not reply.get('ddate')] if note['forum'] == note['id'] else []
+        note['details'] = {}
+        if 'replies' in details:
+            note['details']['replies'] = replies
+        if 'directReplies' in details:
+            note['details']['directReplies'] = [reply for reply in replies if reply.get('replyto') == note['id']]
+        if 'replyCount' in details:
+            note['details']['replyCount'] = len(replies)
+        return note
+
+    def post_note_edit(self, query, body):
+        note = dict(body['note'])
+        if note.get('id') in self.notes:
+            existing = self.notes[note['id']]
+            note = dict(existing, **{ key: value for key, value in note.items() if key != 'content' }, content=dict(existing['content'], **note.get('content', {})))
+        elif body.get('invitation'):
+            note.setdefault('invitations', [body['invitation']])
+        return dict(body, note=self.add_notes([note])[0])
+
+    def get_edges(self, query, body):
+        filters = field_filters(query, { 'id': 'id', 'invitation': 'invitation', 'head': 'head', 'tail': 'tail', 'label': 'label' })
+        trash = first(query, 'trash') == 'true'
+
+        def matches(edge):
+            return (trash or not edge.get('ddate')) and filters(edge)
+
+        group_by = first(query, 'groupBy')
+        if not group_by:
+            return self.page_response('edges', self.edges.values(), query, matches)
+
+        group_fields = group_by.split(',')
+        select = first(query, 'select')
+        select = select.split(',') if select else None
+        grouped = collections.OrderedDict()
+        for edge in self.edges.values():
+            if matches(edge):
+                group_id = tuple(edge.get(field) for field in group_fields)
+                value = { field: edge.get(field) for field in select } if select else { key: value for key, value in edge.items() if key not in group_fields }
+                grouped.setdefault(group_id, []).append(value)
+        groups = [{ 'id': dict(zip(group_fields, group_id)), 'values': values, 'count': len(values) } for group_id, values in grouped.items()]
+        start = int(first(query, 'offset') or 0)
+        limit = int(first(query, 'limit') or len(groups))
+        return { 'groupedEdges': groups[start:start + limit] }
+
+    def get_edges_count(self, query, body):
+        filters = field_filters(query, { 'id': 'id', 'invitation': 'invitation', 'head': 'head', 'tail': 'tail', 'label': 'label' })
+        return { 'count': sum(1 for edge in self.edges.values() if not edge.get('ddate') and filters(edge)) }
+
+    def post_edge(self, query, body):
+        return self.add_edges([body])[0]
+
+    def post_edges(self, query, body):
+        return self.add_edges(body)
+
+    def delete_edges(self, query, body):
+        filters = field_filters({ key: [value] for key, value in body.items() if key in ['id', 'invitation', 'head', 'tail', 'label'] }, { 'id': 'id', 'invitation': 'invitation', 'head': 'head', 'tail': 'tail', 'label': 'label' })
+        now = int(time.time() * 1000)
+        for edge in [edge for edge in self.edges.values() if filters(edge)]:
+            if body.get('softDelete'):
+                edge['ddate'] = now
+            else:
+                del self.edges[edge['id']]
+        self.query_cache.clear()
+        self.content_indexes.clear()
+        return { 'status': 'ok' }
+
+    def get_groups(self, query, body):
+        filters = field_filters(query, { 'id': 'id', 'parent': 'parent', 'domain': 'domain', 'member': 'members', 'signatory': 'signatories', 'invitation': 'invitations' })
+        prefix = first(query, 'prefix')
+
+        def matches(group):
+            return (not prefix or group['id'].startswith(prefix)) and filters(group)
+
+        return self.page_response('groups', self.groups.values(), query, matches)
+
+    def post_group_edit(self, query, body):
+        group = dict(body.get('group') or self.resolve_template(body.get('invitation'), 'group', body.get('content')))
+        existing = self.groups.get(group['id'])
+        if existing:
+            members = group.pop('members', None)
+            group = dict(existing, **group)
+            if isinstance(members, dict):
+                group['members'] = [member for member in existing['members'] if member not in members.get('remove', [])] + [member for member in members.get('add', members.get('append', [])) if member not in existing['members']]
+            elif members is not None:
+                group['members'] = members
+        ## The group keeps the ids of the invitations of its edits
+        if body.get('invitation'):
+            invitations = group.get('invitations') or []
+            group['invitations'] = invitations if body['invitation'] in invitations else invitations + [body['invitation']]
+        return dict(body, group=self.add_groups([group])[0])
+
+    def add_group_members(self, query, body):
+        group = self.get_group_or_raise(body['id'])
+        return self.add_groups([dict(group, members=group['members'] + [member for member in body['members'] if member not in group['members']])])[0]
+
+    def remove_group_members(self, query, body):
+        group = self.get_group_or_raise(body['id'])
+        return self.add_groups([dict(group, members=[member for member in group['members'] if member not in body['members']])])[0]
+
+    def get_group_or_raise(self, group_id):
+        if group_id not in self.groups:
+            raise FakeServerError(404, 'NotFoundError', f'Group Not Found: {group_id}')
+        return self.groups[group_id]
+
+    def get_invitations(self, query, body):
+        filters = field_filters(query, { 'id': 'id', 'domain': 'domain' })
+        ids = set(','.join(query.get('ids', [])).split(',')) - { '' }
+        prefix = first(query, 'prefix')
+        invitation = first(query, 'invitation')
+        invitation_type = first(query, 'type')
+        expired = first(query, 'expired') == 'true'
+        minduedate = int(first(query, 'minduedate') or 0)
+        now = int(time.time() * 1000)
+
+        def matches(invitation_json):
+            if ids and invitation_json['id'] not in ids:
+                return False
+            if prefix and not invitation_json['id'].startswith(prefix):
+                return False
+            if invitation and invitation not in invitation_json.get('invitations', []):
+                return False
+            if invitation_type == 'notes' and 'note' not in (invitation_json.get('edit') or {}):
+                return False
+            if invitation_type in ['edges', 'tags'] and invitation_type[:-1] not in invitation_json:
+                return False
+            if not expired and (invitation_json.get('expdate') or float('inf')) < now:
+                return False
+            if minduedate and (invitation_json.get('duedate') or 0) < minduedate:
+                return False
+            return filters(invitation_json)
+
+        return self.page_response('invitations', self.invitations.values(), query, matches)
+
+    def post_invitation_edit(self, query, body):
+        invitation = dict(body.get('invitation') or self.resolve_template(body.get('invitations'), 'invitation', body.get('content')))
+        existing = self.invitations.get(invitation['id'])
+        if existing:
+            invitation = dict(existing, **invitation)
+        ## The invitation keeps the ids of the invitations of its edits
+        if body.get('invitations'):
+            invitations = invitation.get('invitations') or []
+            invitation['invitations'] = invitations if body['invitations'] in invitations else invitations + [body['invitations']]
+        return dict(body, invitation=self.add_invitations([invitation])[0])
+
+    def resolve_template(self, invitation_id, field, content):
+        ## An edit without the child is an edit of a meta invitation, the child is the template of the invitation with the content of the edit
+        from openreview.tools import resolve_edit_template
+        if invitation_id not in self.invitations:
+            raise FakeServerError(404, 'NotFoundError', f'Invitation Not Found: {invitation_id}')
+        return resolve_edit_template(self.invitations[invitation_id]['edit'][field], content or {})
+
+    def get_profiles(self, query, body):
+        profile_id = first(query, 'id')
+        email = first(query, 'email')
+        if profile_id or email:
+            profiles = self.find_profiles(ids=profile_id.split(',') if profile_id else [], emails=email.split(',') if email else [])
+            return { 'profiles': profiles, 'count': len(profiles) }
+        page, count = self.query('profiles', self.profiles.values(), query, lambda profile: True)
+        return { 'profiles': page, 'count': count }
+
+    def search_profiles(self, query, body):
+        return { 'profiles': self.find_profiles(ids=body.get('ids', []), emails=body.get('emails', [])) }
+
+    def find_profiles(self, ids, emails):
+        profiles = []
+        if ids:
+            ids = set(ids)
+            profiles.extend(profile for profile in self.profiles.values() if ids.intersection(name.get('username') for name in profile['content']['names']))
+        if emails:
+            emails = set(emails)
+            for profile in self.profiles.values():
+                for email in profile['content']['emails']:
+                    if email in emails:
+                        profiles.append(dict(profile, email=email))
+        return profiles
+
+    def post_message(self, query, body):
+        self.messages.append(body)
+        return { 'groups': body.get('groups', []), 'subject': body.get('subject') }
+
+    def login(self, query, body):
+        user = body.get('id') or '~Super_User1'
+        return { 'token': self.get_token(user), 'user': { 'id': user, 'profile': { 'id': user } } }
+
+class FakeServerError(Exception):
+    def __init__(self, status, name, message):
+        super().__init__(message)
+        self.status = status
+        self.name = name
+        self.message = message
+
+def first(query, key):
+    values = query.get(key)
+    return values[0] if values else None
+
+def field_filters(query, fields):
+    """
+    Returns a function that checks the fields of an object against the values of the query. List fields like members match when
+    they contain the value, the values of a parameter can be repeated or separated by commas.
+    """
+    checks = []
+    for parameter, field in fields.items():
+        values = set(','.join(query.get(parameter, [])).split(',')) - { '' }
+        if values:
+            checks.append((field, values))
+
+    def matches(obj):
+        for field, values in checks:
+            value = obj.get(field)
+            if isinstance(value, list):
+                if not values.intersection(value):
+                    return False
+            elif str(value) not in values:
+                return False
+        return True
+
+    return matches
+
+def content_values(note, field):
+    value = note['content'].get(field)
+    value = value.get('value') if isinstance(value, dict) else value
+    return [str(v) for v in value] if isinstance(value, list) else [str(value)]
+
+def response_size(payload):
+    if isinstance(payload, list):
+        return len(payload)
+    for value in payload.values():
+        if isinstance(value, list):
+            return len(value)
+    return 1
+
+def openreview_profile(profile):
+    from openreview import Profile
+    return Profile.from_json(profile) if 'content' in profile else Profile(id=profile['id'])
@@ -3,16 +3,93 @@ from .. import tools
 
 from openreview.api import Edge
 
+import json
+import os
 import random
+import sqlite3
 import time
 from tqdm import tqdm
 
+class CommitteeConflictIndex(object):
+    """
+    Conflict info of the members of a journal committee, computed with the NeurIPS policy. The info of each member is stored with the tmdate of
+    the profile it was computed from, and :meth:`refresh` only requests the publications and relations of the members that are new, whose profile
+    changed or whose info is older than ttl seconds.
+
+    :param client: Client used to get the profiles
+    :type client: OpenReviewClient
+    :param path: Path of the SQLite file where the info is kept between runs. If none is provided, the info is only kept in memory
+    :type path: str, optional
+    :param ttl: Seconds after which the info of a member is computed again. Publications don't change the profile tmdate, so the publications added in the last ttl seconds can be missing
+    :type ttl: int, optional
+    :param n_years: Number of years of history and publications used to find conflicts
+    :type n_years: int, optional
+    """
+    def __init__(self, client, path=None, ttl=3600, n_years=3):
+        self.client = client
+        self.ttl = ttl
+        self.n_years = n_years
+        self.info_function = tools.info_function_builder(tools.get_neurips_profile_info)
+        self.connection = sqlite3.connect(path or ':memory:')
+        with self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS members (id TEXT PRIMARY KEY, tmdate INTEGER, fetched REAL, info TEXT)')
+        self.index = tools.ConflictIndex([])
+        self.refreshed = []
+
+    def refresh(self, members):
+        """
+        Updates the info of the passed members and rebuilds the index with them
+
+        :param members: Committee members, profile ids or emails
+        :type members: list[str]
+        """
+        profiles = tools.get_profiles(self.client, members)
+        min_fetched = time.time() - self.ttl
+        stored = { row[0]: (row[1], row[2]) for row in self.connection.execute('SELECT id, tmdate, fetched FROM members') }
+        stale_ids = [p.id for p in profiles if p.id not in stored or stored[p.id][0] != p.tmdate or stored[p.id][1] < min_fetched]
+
+        fetched = time.time()
+        stale_profiles = tools.get_profiles(self.client, stale_ids, with_publications=True, with_relations=True) if stale_ids else []
+        with self.connection:
+            for profile in stale_profiles:
+                info = self.info_function(profile, self.n_years)
+                info = { key: list(value) if isinstance(value, (set, list)) else value for key, value in info.items() }
+                self.connection.execute('REPLACE INTO members (id, tmdate, fetched, info) VALUES (?, ?, ?, ?)', (profile.id, profile.tmdate, fetched, json.dumps(info)))
+        self.refreshed = [p.id for p in stale_profiles]
+
+        member_ids = [p.id for p in profiles]
+        info_by_id = { row[0]: json.loads(row[1]) for row in self.connection.execute('SELECT id, info FROM members') }
+        self.index = tools.ConflictIndex([info_by_id[member_id] for member_id in member_ids if member_id in info_by_id])
+
+    def find_conflicts(self, author_profiles):
+        """
+        Finds the members that have conflicts with the authors
+
+        :param author_profiles: Profiles of the authors, with publications and relations
+        :type author_profiles: list[Profile]
+
+        :return: List of (member id, conflicts) tuples in the order of the members
+        :rtype: list[tuple]
+        """
+        authors_info = [self.info_function(profile, self.n_years) for profile in author_profiles]
+        return [(member_info['id'], tools.get_info_conflicts(authors_info, member_info)) for member_info in self.index.find(authors_info)]
+
 class Assignment(object):
 
     def __init__(self, journal):
         self.client = journal.client
         self.journal = journal
         self.show_conflict_details = journal.should_show_conflict_details()
+        self.conflict_index_dir = journal.get_conflict_index_dir() #if present, the conflict info of the committees is stored there and only refreshed for the members that changed
+        self.conflict_indexes = {}
+
+    def get_conflict_index(self, committee_id, members):
+        if committee_id not in self.conflict_indexes:
+            path = os.path.join(self.conflict_index_dir, committee_id.replace('/', '_') + '.sqlite') if self.conflict_index_dir else None
+            self.conflict_indexes[committee_id] = CommitteeConflictIndex(self.client, path=path)
+        conflict_index = self.conflict_indexes[committee_id]
+        conflict_index.refresh(members)
+        return conflict_index
 
     def post_submission_edges(self, edges):
         if edges:
@@ -32,7 +109,7 @@ class Assignment(object):
         authors_id=self.journal.get_authors_id(number=note.number)
 
         action_editors = self.journal.get_action_editors()
-        action_editor_profiles = tools.get_profiles(self.client, action_editors, with_publications=True, with_relations=True)
+        conflict_index = self.get_conflict_index(action_editors_id, action_editors)
 
         authors = self.journal.get_authors(number=note.number)
         author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True)
@@ -57,17 +134,15 @@ class Assignment(object):
 
         ## Create conflicts
         conflict_edges = []
-        for action_editor_profile in tqdm(action_editor_profiles):
-
-            conflicts = tools.get_conflicts(author_profiles, action_editor_profile, policy='NeurIPS', n_years=3)
+        for action_editor_id, conflicts in conflict_index.find_conflicts(author_profiles):
             if conflicts:
-                print('Compute AE conflict', note.id, action_editor_profile.id, conflicts)
+                print('Compute AE conflict', note.id, action_editor_id, conflicts)
                 edge = Edge(invitation = self.journal.get_ae_conflict_id(),
                     readers = [venue_id, authors_id],
                     writers = [venue_id],
                     signatures = [venue_id],
                     head = note.id,
-                    tail = action_editor_profile.id,
+                    tail = action_editor_id,
                     weight = -1,
                     label =  ','.join(conflicts) if self.show_conflict_details else 'Conflict'
                 )
@@ -85,7 +160,8 @@ class Assignment(object):
         authors_id = self.journal.get_authors_id(number=note.number)
 
         reviewers = self.journal.get_reviewers()
-        reviewer_profiles = tools.get_profiles(self.client, reviewers, with_publications=True, with_relations=True)
+        ## The conflicts of a reviewer can miss the publications added since their info was stored, up to the ttl of the conflict index
+        conflict_index = self.get_conflict_index(self.journal.get_reviewers_id(), reviewers)
 
         authors = self.journal.get_authors(number=note.number)
         author_profiles = tools.get_profiles(self.client, authors, with_publications=True, with_relations=True)
@@ -111,18 +187,16 @@ class Assignment(object):
 
         ## Create conflicts
         conflict_edges = []
-        for reviewer_profile in tqdm(reviewer_profiles):
-
-            conflicts = tools.get_conflicts(author_profiles, reviewer_profile, policy='NeurIPS', n_years=3)
+        for reviewer_id, conflicts in conflict_index.find_conflicts(author_profiles):
             if conflicts:
-                print('Compute Reviewer conflict', note.id, reviewer_profile.id, conflicts)
+                print('Compute Reviewer conflict', note.id, reviewer_id, conflicts)
                 edge = Edge(invitation = self.journal.get_reviewer_conflict_id(),
                     readers = [venue_id, action_editors_id],
                     nonreaders = [authors_id],
                     writers = [venue_id],
                     signatures = [venue_id],
                     head = note.id,
-                    tail = reviewer_profile.id,
+                    tail = reviewer_id,
                     weight = -1,
                     label = ','.join(conflicts) if self.show_conflict_details else 'Conflict'
                 )
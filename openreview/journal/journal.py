@@ -440,6 +440,9 @@ class Journal(object):
     def get_expertise_model(self):
         return self.settings.get('expertise_model', 'specter+mfr')
 
+    def get_conflict_index_dir(self):
+        return self.settings.get('conflict_index_dir')
+
     def are_authors_anonymous(self):
         return self.settings.get('author_anonymity', True)
     
@@ -704,37 +707,123 @@ class Journal(object):
 
         invitation = self.client.get_invitation(invitation_id)
 
-        invitee_members = []
-        for invitee in invitation.invitees:
-            if invitee not in [self.venue_id, self.get_editors_in_chief_id()]:
-                if invitee.startswith('~'):
-                    profile = self.client.get_profile(invitee)
-                    invitee_members.append(profile.id)
-                elif '@' in invitee:
-                    profile = openreview.tools.get_profile(self.client, invitee)
-                    invitee_members.append(profile.id if profile else invitee)
-                else:
-                    invitee_members = invitee_members + self.client.get_group(invitee).members
-
         ## Check replies and get signatures
         replies = self.client.get_notes(invitation=invitation.id, details='signatures')
 
-        signature_members = []
-        for reply in replies:
-            for signature in reply.details['signatures']:
-                if signature['id'].startswith('~'):
-                    profile = self.client.get_profile(signature)
-                    signature_members.append(profile.id)
-                else:
-                    signature_members = signature_members  + self.client.get_group(signature['id']).members
+        return self.find_late_invitees([invitation], { invitation.id: replies })[invitation.id]
+
+    def get_all_late_invitees(self):
+        """
+        Computes the late invitees of every open task of the journal, the submission invitations with a past due date that are not expired. The tasks are
+        requested with one get_all_invitations call, their replies come with the submissions and the profiles and groups are resolved together.
+
+        :return: Dictionary of late invitees by task invitation id
+        :rtype: dict
+        """
+        now = openreview.tools.datetime_millis(datetime.datetime.utcnow())
+        invitations = [i for i in self.client.get_all_invitations(prefix=f'{self.venue_id}/{self.submission_group_name}') if i.type == 'Note' and i.invitees and i.duedate and i.duedate < now and (not i.expdate or i.expdate > now)]
+
+        replies_by_invitation = {}
+        for submission in self.client.get_all_notes(invitation=self.get_author_submission_id(), details='replies'):
+            for reply in submission.details['replies']:
+                for invitation_id in reply['invitations']:
+                    replies_by_invitation.setdefault(invitation_id, []).append(openreview.api.Note.from_json(reply))
+
+        return self.find_late_invitees(invitations, replies_by_invitation)
+
+    def find_late_invitees(self, invitations, replies_by_invitation):
+
+        excluded_invitees = [self.venue_id, self.get_editors_in_chief_id()]
+        profile_ids = set()
+        emails = set()
+        group_ids = set()
+
+        def add_signature_ids(reply):
+            if reply.details and 'signatures' in reply.details:
+                for signature in reply.details['signatures']:
+                    if signature['id'].startswith('~'):
+                        profile_ids.add(signature['id'])
+                    elif 'members' not in signature:
+                        group_ids.add(signature['id'])
             for signature in reply.signatures:
                 if signature.startswith('~'):
-                    profile = self.client.get_profile(signature)
-                    signature_members.append(profile.id)
+                    profile_ids.add(signature)
+                elif not reply.details or 'signatures' not in reply.details:
+                    group_ids.add(signature)
+
+        for invitation in invitations:
+            for invitee in invitation.invitees:
+                if invitee not in excluded_invitees:
+                    if invitee.startswith('~'):
+                        profile_ids.add(invitee)
+                    elif '@' in invitee:
+                        emails.add(invitee)
+                    else:
+                        group_ids.add(invitee)
+            for reply in replies_by_invitation.get(invitation.id, []):
+                add_signature_ids(reply)
+
+        ## Resolve all the profiles and groups at once
+        profile_id_by_name = {}
+        if profile_ids:
+            for profile in self.client.search_profiles(ids=list(profile_ids)):
+                profile_id_by_name[profile.id] = profile.id
+                for name in profile.content.get('names', []):
+                    if name.get('username'):
+                        profile_id_by_name[name['username']] = profile.id
+        profile_id_by_email = { email: profile.id for email, profile in self.client.search_profiles(confirmedEmails=list(emails)).items() } if emails else {}
+        members_by_group = self.get_groups_members(group_ids)
+
+        late_invitees = {}
+        for invitation in invitations:
+            invitee_members = []
+            for invitee in invitation.invitees:
+                if invitee not in excluded_invitees:
+                    if invitee.startswith('~'):
+                        invitee_members.append(profile_id_by_name.get(invitee, invitee))
+                    elif '@' in invitee:
+                        invitee_members.append(profile_id_by_email.get(invitee, invitee))
+                    else:
+                        invitee_members = invitee_members + members_by_group.get(invitee, [])
+
+            signature_members = []
+            for reply in replies_by_invitation.get(invitation.id, []):
+                signatures = reply.details['signatures'] if reply.details and 'signatures' in reply.details else [{ 'id': signature } for signature in reply.signatures]
+                for signature in signatures:
+                    if signature['id'].startswith('~'):
+                        signature_members.append(profile_id_by_name.get(signature['id'], signature['id']))
+                    else:
+                        signature_members = signature_members + signature.get('members', members_by_group.get(signature['id'], []))
+                for signature in reply.signatures:
+                    if signature.startswith('~'):
+                        signature_members.append(profile_id_by_name.get(signature, signature))
+
+            print(invitation.id, 'invitee_members', invitee_members)
+            print(invitation.id, 'signature_members', signature_members)
+            late_invitees[invitation.id] = list(set(invitee_members) - set(signature_members))
+
+        return late_invitees
+
+    def get_groups_members(self, group_ids):
+        ## The groups of a submission are requested with one call by prefix, all the submission groups are requested at once if there is more than one submission
+        paper_prefix = re.compile(rf'^{re.escape(self.venue_id)}/{re.escape(self.submission_group_name)}\d+/')
+        prefixes = set()
+        other_ids = []
+        for group_id in group_ids:
+            match = paper_prefix.match(group_id)
+            if match:
+                prefixes.add(match.group(0))
+            else:
+                other_ids.append(group_id)
 
-        print('invitee_members', invitee_members)
-        print('signature_members', signature_members)
-        return list(set(invitee_members) - set(signature_members))
+        groups = []
+        if len(prefixes) > 1:
+            groups = self.client.get_all_groups(prefix=f'{self.venue_id}/{self.submission_group_name}')
+        elif prefixes:
+            groups = self.client.get_all_groups(prefix=prefixes.pop())
+        if other_ids:
+            groups = groups + openreview.tools.concurrent_requests(lambda group_id: self.client.get_group(group_id), other_ids, desc='get_groups_members')
+        return { group.id: group.members for group in groups if group.id in group_ids }
 
     def notify_readers(self, edit, content_fields=[]):
 
@@ -768,6 +857,8 @@ Submission: {forum.content['title']['value']}
         content = f'''{formatted_content}
 To view the {lower_formatted_invitation}, click here: https://openreview.net/forum?id={note.forum}&noteId={note.id}'''
 
+        messages = self.client.message_batch()
+
         ## Notify author of the note
         if action == 'posted' and self.get_editors_in_chief_id() not in note.signatures:
             message = f'''Hi {{{{fullname}}}},
@@ -775,7 +866,7 @@ To view the {lower_formatted_invitation}, click here: https://openreview.net/for
 Your {lower_formatted_invitation} on a submission has been {action}
 {content}
 '''
-            self.client.post_message(recipients=[edit.tauthor], subject=subject, message=message, replyTo=self.contact_info)
+            messages.add(recipients=[edit.tauthor], subject=subject, message=message, replyTo=self.contact_info)
 
         ## Notify authors
         if is_public or self.get_authors_id(number=forum.number) in readers:
@@ -784,7 +875,7 @@ Your {lower_formatted_invitation} on a submission has been {action}
 {before_invitation} {lower_formatted_invitation} has been {action} on your submission.
 {content}
 '''
-            self.client.post_message(recipients=[self.get_authors_id(number=forum.number)], subject=subject, message=message, ignoreRecipients=nonreaders, replyTo=self.contact_info)
+            messages.add(recipients=[self.get_authors_id(number=forum.number)], subject=subject, message=message, ignoreRecipients=nonreaders, replyTo=self.contact_info)
 
         ## Notify reviewers
         reviewer_recipients = []
@@ -801,7 +892,7 @@ Your {lower_formatted_invitation} on a submission has been {action}
 {before_invitation} {lower_formatted_invitation} has been {action} on a submission for which you are a reviewer.
 {content}
 '''
-            self.client.post_message(recipients=reviewer_recipients, subject=subject, message=message, ignoreRecipients=nonreaders, replyTo=self.contact_info)
+            messages.add(recipients=reviewer_recipients, subject=subject, message=message, ignoreRecipients=nonreaders, replyTo=self.contact_info)
 
 
         ## Notify action editors
@@ -811,7 +902,7 @@ Your {lower_formatted_invitation} on a submission has been {action}
 {before_invitation} {lower_formatted_invitation} has been {action} on a submission for which you are an Action Editor.
 {content}
 '''
-            self.client.post_message(recipients=[self.get_action_editors_id(number=forum.number)], subject=subject, message=message, ignoreRecipients=nonreaders, replyTo=self.contact_info)
+            messages.add(recipients=[self.get_action_editors_id(number=forum.number)], subject=subject, message=message, ignoreRecipients=nonreaders, replyTo=self.contact_info)
 
 
         if self.get_editors_in_chief_id() in readers and len(readers) == 2 and 'comment' in lower_formatted_invitation:
@@ -820,7 +911,9 @@ Your {lower_formatted_invitation} on a submission has been {action}
 {before_invitation} {lower_formatted_invitation} has been {action} on a submission for which you are serving as Editor-In-Chief.
 {content}
 '''
-            self.client.post_message(recipients=[self.get_editors_in_chief_id()], subject=subject, message=message, ignoreRecipients=nonreaders, replyTo=self.contact_info)
+            messages.add(recipients=[self.get_editors_in_chief_id()], subject=subject, message=message, ignoreRecipients=nonreaders, replyTo=self.contact_info)
+
+        messages.send()
 
     def setup_note_invitations(self):
 
@@ -1717,66 +1810,24 @@ OpenReview Team'''
                 response = client.post_message(subject, edge.signatures, message, replyTo=journal.contact_info)            
         
         journal_requests = client.get_all_notes(invitation=f'{support_group_id}/-/Journal_Request')
+        pending_sign_ups = openreview.tools.PendingSignUps(client)
 
+        ## Collect the pending sign up edges of all the journals first, so the profiles and submissions are requested once
         for journal_request in tqdm(journal_requests):
 
             journal = openreview.journal.JournalRequest.get_journal(client, journal_request.id, setup=False)
             print('Check venue', journal.venue_id)
 
-            invite_assignment_invitation_id = journal.get_reviewer_invite_assignment_id()
-            grouped_edges = client.get_grouped_edges(invitation=invite_assignment_invitation_id, label='Pending Sign Up', groupby='tail')
-            print('Pending sign up edges found', len(grouped_edges))
-
-            for grouped_edge in grouped_edges:
-
-                tail = grouped_edge['id']['tail']
-                profiles=openreview.tools.get_profiles(client, [tail], with_publications=True, with_relations=True)
-
-                if profiles and profiles[0].active:
-
-                    user_profile=profiles[0]
-                    print('Profile found for', tail, user_profile.id)
+            pending_edges = pending_sign_ups.add(journal.get_reviewer_invite_assignment_id(), journal.under_review_venue_id, policy='NeurIPS', n_years=3, context=journal)
+            print('Pending sign up edges found', pending_edges)
 
-                    edges = grouped_edge['values']
-
-                    for edge in edges:
-
-                        edge = openreview.api.Edge.from_json(edge)
-                        submission=client.get_note(id=edge.head)
-
-                        if submission.content['venueid']['value'] == journal.under_review_venue_id:
-
-                            ## Check if there is already an accepted edge for that profile id
-                            accepted_edges = client.get_edges(invitation=invite_assignment_invitation_id, label='Accepted', head=submission.id, tail=user_profile.id)
-
-                            if not accepted_edges:
-                                ## Check if the user was invited again with a profile id
-                                invitation_edges = client.get_edges(invitation=invite_assignment_invitation_id, label='Invitation Sent', head=submission.id, tail=user_profile.id)
-                                if invitation_edges:
-                                    invitation_edge = invitation_edges[0]
-                                    print(f'User invited twice, remove double invitation edge {invitation_edge.id}')
-                                    invitation_edge.ddate = openreview.tools.datetime_millis(datetime.datetime.utcnow())
-                                    client.post_edge(invitation_edge)
-
-                                ## Check conflicts
-                                author_profiles = openreview.tools.get_profiles(client, submission.content['authorids']['value'], with_publications=True, with_relations=True)
-                                conflicts=openreview.tools.get_conflicts(author_profiles, user_profile, policy='NeurIPS', n_years=3)
-
-                                if conflicts:
-                                    print(f'Conflicts detected for {edge.head} and {user_profile.id}', conflicts)
-                                    mark_as_conflict(journal, edge, submission, user_profile)
-                                else:
-                                    print(f'Mark accepted for {edge.head} and {user_profile.id}')
-                                    mark_as_accepted(journal, edge, submission, user_profile)
-                                                                                                                                                
-                            else:
-                                print("user already accepted with another invitation edge", submission.id, user_profile.id)                                
-
-                        else:
-                            print(f'submission {submission.id} is not active: {submission.content["venueid"]["value"]}')
-
-                else:
-                    print(f'no profile active for {tail}')                                             
+        for invite_assignment_invitation_id, journal, edge, submission, user_profile, conflicts in pending_sign_ups.resolve():
+            if conflicts:
+                print(f'Conflicts detected for {edge.head} and {user_profile.id}', conflicts)
+                mark_as_conflict(journal, edge, submission, user_profile)
+            else:
+                print(f'Mark accepted for {edge.head} and {user_profile.id}')
+                mark_as_accepted(journal, edge, submission, user_profile)
         
         return True        
             
\ No newline at end of file
@@ -12,9 +12,11 @@ def process(client, invitation):
     if len(edges) >= journal.get_number_of_reviewers():
       return
 
+    messages = client.message_batch()
+
     if date_index == 0 or date_index == 1:
         print('send email to action editors')
-        client.post_message(
+        messages.add(
             recipients=[journal.get_action_editors_id(number=submission.number)],
             subject=f'''[{journal.short_name}] You are late in performing a task for assigned paper {submission.number}: {submission.content['title']['value']}''',
             message=f'''Hi {{{{fullname}}}},
@@ -43,7 +45,7 @@ The {journal.short_name} Editors-in-Chief
       ## send email to editors in chief
       print('send email to editors in chief')
       for profile in profiles:
-        client.post_message(
+        messages.add(
             recipients=[journal.get_editors_in_chief_id()],
             ignoreRecipients=[journal.get_authors_id(number=submission.number)],
             subject=f'''[{journal.short_name}] AE is late in performing a task for assigned paper {submission.number}: {submission.content['title']['value']}''',
@@ -58,4 +60,6 @@ Link: https://openreview.net/group?id={journal.get_action_editors_id()}#action-e
 OpenReview Team
 ''',
             replyTo=journal.contact_info
-        )
\ No newline at end of file
+        )
+
+    messages.send()
@@ -12,12 +12,14 @@ def process(client, invitation):
     if len(late_invitees) == 0:
       return
 
+    messages = client.message_batch()
+
     ## get preferred names
     profiles = openreview.tools.get_profiles(client, late_invitees)
 
     if date_index == 0 or date_index == 1:
         print('send email to action editors', late_invitees)
-        client.post_message(
+        messages.add(
             recipients=late_invitees,
             subject=f'''[{journal.short_name}] You are late in performing a task for assigned paper {submission.number}: {submission.content['title']['value']}''',
             message=f'''Hi {{{{fullname}}}},
@@ -43,7 +45,7 @@ The {journal.short_name} Editors-in-Chief
       print('send email to editors in chief')
       days_late = 'one week' if date_index == 1 else 'one month'
       for profile in profiles:
-        client.post_message(
+        messages.add(
             recipients=[journal.get_editors_in_chief_id()],
             ignoreRecipients=[journal.get_authors_id(number=submission.number)],
             subject=f'''[{journal.short_name}] AE is late in performing a task for assigned paper {submission.number}: {submission.content['title']['value']}''',
@@ -60,5 +62,4 @@ OpenReview Team
             replyTo=journal.contact_info
         )                    
 
-
-
+    messages.send()
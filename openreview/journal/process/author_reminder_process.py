@@ -13,6 +13,8 @@ def process(client, invitation):
     if len(late_invitees) == 0:
       return
 
+    messages = client.message_batch()
+
     if days_late_map:
         days_late = days_late_map.get(str(date_index), abs((now - duedate).days))
     else:
@@ -20,7 +22,7 @@ def process(client, invitation):
     
     ## send email to reviewers
     print('send email to authors', late_invitees)
-    client.post_message(
+    messages.add(
         recipients=late_invitees,
         subject=f'''[{journal.short_name}] You are late in performing a task for your paper {submission.number}: {submission.content['title']['value']}''',
         message=f'''Hi {{{{fullname}}}},
@@ -48,7 +50,7 @@ The {journal.short_name} Editors-in-Chief
         ## send email to action editors
         print('send email to action editors')
         for profile in profiles:
-            client.post_message(
+            messages.add(
                 recipients=[journal.get_action_editors_id(number=submission.number)],
                 subject=f'''[{journal.short_name}] Authors are late in performing a task for their paper {submission.number}: {submission.content['title']['value']}''',
                 message=f'''Hi {{{{fullname}}}},
@@ -73,7 +75,7 @@ The {journal.short_name} Editors-in-Chief
     if date_index > 2 or days_late == 'one month':
         profiles = openreview.tools.get_profiles(client, late_invitees)
         for profile in profiles:
-            client.post_message(
+            messages.add(
                 recipients=[journal.get_editors_in_chief_id()],
                 ignoreRecipients=[journal.get_authors_id(number=submission.number)],
                 subject=f'''[{journal.short_name}] Authors are late in performing a task for their paper {submission.number}: {submission.content['title']['value']}''',
@@ -91,4 +93,6 @@ OpenReview Team
                 replyTo=journal.contact_info
         )        
 
-    
\ No newline at end of file
+    
+
+    messages.send()
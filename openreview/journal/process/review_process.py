@@ -4,12 +4,14 @@ def process(client, edit, invitation):
 
     review_note=client.get_note(edit.note.id)
     submission = client.get_note(review_note.forum)
+    context = openreview.tools.ProcessContext(client, journal.venue_id)
+    context.prefetch_groups(f'{journal.venue_id}/{journal.submission_group_name}{submission.number}/')
 
     ## Notify readers
     journal.notify_readers(edit)
 
     ## Decrease pending reviews counter
-    signature_group = client.get_group(id=review_note.signatures[0])
+    signature_group = context.get_group(review_note.signatures[0])
     reviewer_profile = openreview.tools.get_profile(client, signature_group.members[0])
     edges = client.get_edges(invitation=journal.get_reviewer_pending_review_id(), tail=(reviewer_profile.id if reviewer_profile else signature_group.members[0]))
     if edges and edges[0].weight > 0:
@@ -53,7 +55,7 @@ def process(client, edit, invitation):
 
         ## Send email notifications to authors
         print('Send emails to authors')
-        author_group = client.get_group(journal.get_authors_id())
+        author_group = context.get_group(journal.get_authors_id())
         message=author_group.content['discussion_starts_email_template_script']['value'].format(
             short_name=journal.short_name,
             submission_id=submission.id,
@@ -78,7 +80,7 @@ def process(client, edit, invitation):
 
         ## Send email notifications to reviewers
         print('Send emails to reviewers')
-        reviewer_group = client.get_group(journal.get_reviewers_id())
+        reviewer_group = context.get_group(journal.get_reviewers_id())
         message=reviewer_group.content['discussion_starts_email_template_script']['value'].format(
             short_name=journal.short_name,
             submission_id=submission.id,
@@ -100,7 +102,7 @@ def process(client, edit, invitation):
 
         ## Send email notifications to the action editor
         print('Send emails to action editor')
-        ae_group = client.get_group(journal.get_action_editors_id())
+        ae_group = context.get_group(journal.get_action_editors_id())
         message=ae_group.content['discussion_starts_email_template_script']['value'].format(
             short_name=journal.short_name,
             submission_id=submission.id,
@@ -119,7 +121,7 @@ def process(client, edit, invitation):
             replyTo=journal.contact_info
         )
 
-        assigned_reviewers = client.get_group(id=journal.get_reviewers_id(number=submission.number)).members
+        assigned_reviewers = context.get_group(journal.get_reviewers_id(number=submission.number)).members
         if len(assigned_reviewers) > number_of_reviewers:
             print('Send another email to action editor')
             message=ae_group.content['discussion_too_many_reviewers_email_template_script']['value'].format(
@@ -13,6 +13,8 @@ def process(client, invitation):
     if len(late_invitees) == 0:
       return
 
+    messages = client.message_batch()
+
     if days_late_map:
         days_late = days_late_map.get(str(date_index), abs((now - duedate).days))
     else:
@@ -21,7 +23,7 @@ def process(client, invitation):
     ## send email to reviewers
     print('send email to reviewers', late_invitees)
     is_ack = invitation.id.endswith('Assignment/Acknowledgement')
-    client.post_message(
+    messages.add(
         recipients=late_invitees,
         subject=f'''[{journal.short_name}] You are late in performing a task for assigned paper {submission.number}: {submission.content['title']['value']}''',
         message=f'''Hi {{{{fullname}}}},
@@ -50,7 +52,7 @@ The {journal.short_name} Editors-in-Chief
         ## send email to action editors
         print('send email to action editors')
         for profile in profiles:
-            client.post_message(
+            messages.add(
                 recipients=[journal.get_action_editors_id(number=submission.number)],
                 subject=f'''[{journal.short_name}] Reviewer is late in performing a task for assigned paper {submission.number}: {submission.content['title']['value']}''',
                 message=f'''Hi {{{{fullname}}}},
@@ -75,7 +77,7 @@ The {journal.short_name} Editors-in-Chief
     if date_index > 2 or days_late == 'one month':
         profiles = openreview.tools.get_profiles(client, late_invitees)
         for profile in profiles:
-            client.post_message(
+            messages.add(
                 recipients=[journal.get_editors_in_chief_id()],
                 ignoreRecipients=[journal.get_authors_id(number=submission.number)],
                 subject=f'''[{journal.short_name}] Reviewer is late in performing a task for assigned paper {submission.number}: {submission.content['title']['value']}''',
@@ -93,4 +95,6 @@ OpenReview Team
                 replyTo=journal.contact_info
         )        
 
-    
\ No newline at end of file
+    
+
+    messages.send()
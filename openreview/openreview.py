@@ -18,7 +18,10 @@ import traceback
 
 
 class OpenReviewException(Exception):
-    pass
+    def __init__(self, *args, status_code=None):
+        super().__init__(*args)
+        ## HTTP status of the response that raised the exception, None if it wasn't raised for a response
+        self.status_code = status_code
 
 class LogRetry(Retry):
      
@@ -140,7 +143,7 @@ class Client(object):
                     'name': 'Error',
                     'message': response.reason
                 }
-            raise OpenReviewException(error)
+            raise OpenReviewException(error, status_code=response.status_code)
 
     ## PUBLIC FUNCTIONS
     def impersonate(self, group_id):
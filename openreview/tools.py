@@ -2,22 +2,27 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, division, print_function, unicode_literals
 import inspect
+import io
+import itertools
 
 import json
 import os
 
 import openreview
 import re
+import requests
 import datetime
 import csv
-from pylatexenc.latexencode import utf8tolatex, unicode_to_latex, UnicodeToLatexConversionRule, UnicodeToLatexEncoder, RULE_REGEX
-from Crypto.Hash import HMAC, SHA256
+import functools
+import hashlib
+import sqlite3
+import threading
+import time
 from multiprocessing import Pool, cpu_count
 from tqdm import tqdm
-import tld
 import urllib.parse as urlparse
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 def decision_to_venue(venue_id, decision_option):
     """
@@ -83,7 +88,7 @@ def concurrent_requests(request_func, params, desc='Gathering Responses'):
     :return: A list of results given for each func value execution
     :rtype: list
     """
-    max_workers = cpu_count() - 1
+    max_workers = max(cpu_count() - 1, 1)
     futures = []
     gathering_responses = tqdm(total=len(params), desc=desc)
     results = []
@@ -100,6 +105,250 @@ def concurrent_requests(request_func, params, desc='Gathering Responses'):
 
         return results
 
+class RequestStats(object):
+    """
+    Counts the requests made by a helper and measures their latency. It can be shared by several threads.
+
+    Example:
+
+    >>> stats = RequestStats()
+    >>> profiles = get_profiles(client, ids, with_publications=True, request_stats=stats)
+    >>> stats.summary()
+    {'requests': 3012, 'total_seconds': 512.3, 'mean_seconds': 0.17, 'max_seconds': 1.4}
+    """
+    def __init__(self):
+        self.requests = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self.requests += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def timed(self, request_func, *args, **kwargs):
+        """
+        Calls request_func with the passed arguments and records the time it took
+        """
+        start = time.perf_counter()
+        try:
+            return request_func(*args, **kwargs)
+        finally:
+            self.record(time.perf_counter() - start)
+
+    def summary(self):
+        """
+        :return: Dictionary with the number of requests, the total time, the mean time and the max time in seconds
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'total_seconds': self.total_seconds,
+                'mean_seconds': self.total_seconds / self.requests if self.requests else 0.0,
+                'max_seconds': self.max_seconds
+            }
+
+class ProfileCache(object):
+    """
+    Local cache of profiles and their publications stored in a SQLite database. Entries are keyed by scope and profile id, the profile tmdate
+    is stored with each entry and every username and confirmed email of a profile can be used to find it. The scope of the entries of a client
+    is its baseurl and user, see :meth:`get_scope`, so the profiles seen by a user are never returned to another user.
+
+    Pass it to :class:`openreview.api.OpenReviewClient` to make :meth:`openreview.api.OpenReviewClient.search_profiles` and :func:`tools.get_profiles`
+    only request the profiles and publications that are missing or older than ttl seconds. The publications of a profile are also requested
+    again when the profile returned by the server has a newer tmdate than the one they were stored with.
+
+    Example:
+
+    >>> cache = openreview.tools.ProfileCache('profiles.sqlite', ttl=6 * 3600)
+    >>> client = openreview.api.OpenReviewClient(baseurl='https://api2.openreview.net', username=username, password=password, profile_cache=cache)
+    >>> profiles = openreview.tools.get_profiles(client, reviewers, with_publications=True)
+    >>> cache.stats()
+    {'hits': 14950, 'misses': 50, 'stale': 12, 'profiles': 15000, 'publications': 15000}
+
+    :param path: Path of the SQLite database, it is created if it does not exist
+    :type path: str
+    :param ttl: Number of seconds an entry is fresh, stale entries are fetched again
+    :type ttl: int, optional
+    :param max_size: Max number of profiles and of publication lists kept in the cache, the entries fetched first are evicted first
+    :type max_size: int, optional
+    """
+    ## Incremented when the tables change, the entries of a database with another version are dropped
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path, ttl=24 * 3600, max_size=200000):
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            if self.connection.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                for table in ['profiles', 'aliases', 'publications']:
+                    self.connection.execute(f'DROP TABLE IF EXISTS {table}')
+                self.connection.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS profiles (scope TEXT, id TEXT, tmdate INTEGER, fetched REAL, profile TEXT, PRIMARY KEY (scope, id))')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS aliases (scope TEXT, alias TEXT, id TEXT, PRIMARY KEY (scope, alias))')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS publications (scope TEXT, id TEXT, tmdate INTEGER, fetched REAL, notes TEXT, PRIMARY KEY (scope, id))')
+            self.connection.execute('CREATE INDEX IF NOT EXISTS profiles_fetched ON profiles (fetched)')
+            self.connection.execute('CREATE INDEX IF NOT EXISTS publications_fetched ON publications (fetched)')
+
+    @staticmethod
+    def get_scope(client):
+        """
+        Returns the scope of the entries read and written with the client
+
+        :param client: Client used to request the profiles
+        :type client: OpenReviewClient
+
+        :return: Baseurl of the client and id of its user
+        :rtype: str
+        """
+        profile = getattr(client, 'profile', None)
+        return f'{client.baseurl}|{profile.id if profile else ""}'
+
+    def _count(self, found, fresh):
+        if fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if found:
+                self.stale += 1
+
+    def get_profiles(self, ids_or_emails, scope=''):
+        """
+        Returns the fresh profiles that match the passed ids or emails
+
+        :param ids_or_emails: List of profile ids, usernames or emails
+        :type ids_or_emails: list[str]
+        :param scope: Scope of the entries, see :meth:`get_scope`
+        :type scope: str, optional
+
+        :return: Dictionary of { id_or_email: Profile } with the keys found in the cache
+        :rtype: dict
+        """
+        min_fetched = time.time() - self.ttl
+        profiles = {}
+        with self._lock:
+            for key in ids_or_emails:
+                row = self.connection.execute('SELECT profiles.fetched, profiles.profile FROM aliases JOIN profiles ON aliases.scope = profiles.scope AND aliases.id = profiles.id WHERE aliases.scope = ? AND aliases.alias = ?', (scope, key)).fetchone()
+                fresh = row is not None and row[0] >= min_fetched
+                self._count(row is not None, fresh)
+                if fresh:
+                    profiles[key] = openreview.Profile.from_json(json.loads(row[1]))
+        return profiles
+
+    def put_profiles(self, profiles, scope=''):
+        """
+        Stores the passed profiles, replacing the entries with the same id. The publications stored for an older tmdate of a profile are removed.
+
+        :param profiles: List of profiles
+        :type profiles: list[Profile]
+        :param scope: Scope of the entries, see :meth:`get_scope`
+        :type scope: str, optional
+        """
+        fetched = time.time()
+        with self._lock, self.connection:
+            for profile in profiles:
+                data = dict(vars(profile))
+                if data.get('content') and 'publications' in data['content']:
+                    data['content'] = { key: value for key, value in data['content'].items() if key != 'publications' }
+                self.connection.execute('REPLACE INTO profiles (scope, id, tmdate, fetched, profile) VALUES (?, ?, ?, ?, ?)', (scope, profile.id, profile.tmdate, fetched, json.dumps(data)))
+                self.connection.execute('DELETE FROM publications WHERE scope = ? AND id = ? AND tmdate < ?', (scope, profile.id, profile.tmdate or 0))
+                aliases = [profile.id] + [name['username'] for name in (profile.content or {}).get('names', []) if name.get('username')] + (profile.content or {}).get('emailsConfirmed', [])
+                self.connection.executemany('REPLACE INTO aliases (scope, alias, id) VALUES (?, ?, ?)', [(scope, alias, profile.id) for alias in aliases])
+            self._evict()
+
+    def get_publications(self, profiles, scope=''):
+        """
+        Returns the fresh publications of the passed profiles, the publications stored for an older tmdate of a profile are stale
+
+        :param profiles: List of profiles
+        :type profiles: list[Profile]
+        :param scope: Scope of the entries, see :meth:`get_scope`
+        :type scope: str, optional
+
+        :return: Dictionary of { profile_id: publications } with the profiles found in the cache
+        :rtype: dict
+        """
+        min_fetched = time.time() - self.ttl
+        publications_by_id = {}
+        with self._lock:
+            for profile in profiles:
+                row = self.connection.execute('SELECT tmdate, fetched, notes FROM publications WHERE scope = ? AND id = ?', (scope, profile.id)).fetchone()
+                fresh = row is not None and row[1] >= min_fetched and (row[0] or 0) >= (profile.tmdate or 0)
+                self._count(row is not None, fresh)
+                if fresh:
+                    publications_by_id[profile.id] = [openreview.api.Note.from_json(n['note']) if n['version'] == 2 else openreview.Note.from_json(n['note']) for n in json.loads(row[2])]
+        return publications_by_id
+
+    def put_publications(self, profiles, publications_by_id, scope=''):
+        """
+        Stores the publications of each profile with the tmdate of the profile
+
+        :param profiles: List of profiles
+        :type profiles: list[Profile]
+        :param publications_by_id: Dictionary of { profile_id: publications }
+        :type publications_by_id: dict
+        :param scope: Scope of the entries, see :meth:`get_scope`
+        :type scope: str, optional
+        """
+        fetched = time.time()
+        with self._lock, self.connection:
+            for profile in profiles:
+                if profile.id not in publications_by_id:
+                    continue
+                notes = [{ 'version': 2 if isinstance(n, openreview.api.Note) else 1, 'note': vars(n) } for n in publications_by_id[profile.id]]
+                self.connection.execute('REPLACE INTO publications (scope, id, tmdate, fetched, notes) VALUES (?, ?, ?, ?, ?)', (scope, profile.id, profile.tmdate, fetched, json.dumps(notes)))
+            self._evict()
+
+    def _evict(self):
+        min_fetched = time.time() - self.ttl
+        self.connection.execute('DELETE FROM profiles WHERE fetched < ?', (min_fetched,))
+        self.connection.execute('DELETE FROM publications WHERE fetched < ?', (min_fetched,))
+        self.connection.execute('DELETE FROM profiles WHERE rowid IN (SELECT rowid FROM profiles ORDER BY fetched DESC LIMIT -1 OFFSET ?)', (self.max_size,))
+        self.connection.execute('DELETE FROM publications WHERE rowid IN (SELECT rowid FROM publications ORDER BY fetched DESC LIMIT -1 OFFSET ?)', (self.max_size,))
+        self.connection.execute('DELETE FROM aliases WHERE NOT EXISTS (SELECT 1 FROM profiles WHERE profiles.scope = aliases.scope AND profiles.id = aliases.id)')
+
+    def evict(self):
+        """
+        Removes the stale entries and the oldest entries over max_size
+        """
+        with self._lock, self.connection:
+            self._evict()
+
+    def clear(self):
+        """
+        Removes all the entries and resets the counters
+        """
+        with self._lock, self.connection:
+            self.connection.execute('DELETE FROM profiles')
+            self.connection.execute('DELETE FROM aliases')
+            self.connection.execute('DELETE FROM publications')
+            self.hits = 0
+            self.misses = 0
+            self.stale = 0
+
+    def stats(self):
+        """
+        :return: Dictionary with the number of hits, misses and stale entries found, and the number of profiles and publication lists stored
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale,
+                'profiles': self.connection.execute('SELECT COUNT(*) FROM profiles').fetchone()[0],
+                'publications': self.connection.execute('SELECT COUNT(*) FROM publications').fetchone()[0]
+            }
+
 def get_profile(client, value, with_publications=False):
     """
     Get a single profile (a note) by id, if available
@@ -138,10 +387,60 @@ def get_profile(client, value, with_publications=False):
     return profile
 
 
-def get_profiles(client, ids_or_emails, with_publications=False, with_relations=False, as_dict=False):
+def get_publications(client, profile_ids, batch_size=1000, request_stats=None):
+    """
+    Gets the publications of each profile from API v1 and API v2. Publications of API v1 are listed before the ones of API v2.
+
+    The profiles of both APIs are loaded by the same pool of threads. Each profile costs one request per API, a cursor
+    is only used to get the next page when a profile has at least batch_size publications. The publications of several
+    profiles can't be requested at once because the content filters of the API match a single value, see benchmarks/publications.py.
+
+    :param client: Client used to get the publications, the API v1 and API v2 clients are created with its token
+    :type client: Client or OpenReviewClient
+    :param profile_ids: List of profile ids
+    :type profile_ids: list[str]
+    :param batch_size: Number of publications requested per page
+    :type batch_size: int, optional
+    :param request_stats: If present, counts the requests made and their latency
+    :type request_stats: RequestStats, optional
+
+    :return: Dictionary of { profile_id: publications }
+    :rtype: dict
+    """
+    baseurl_v1, baseurl_v2 = get_base_urls(client)
+    client_v1 = openreview.Client(baseurl=baseurl_v1, token=client.token)
+    client_v2 = openreview.api.OpenReviewClient(baseurl=baseurl_v2, token=client.token)
+
+    def get_author_notes(params):
+        get_notes, profile_id = params
+        publications = []
+        query = {
+            'content': { 'authorids': profile_id },
+            'sort': 'id',
+            'limit': batch_size
+        }
+        while True:
+            page = request_stats.timed(get_notes, **query) if request_stats else get_notes(**query)
+            publications.extend(page)
+            if len(page) < batch_size:
+                return publications
+            query['after'] = page[-1].id
+
+    requests = [(client_v1.get_notes, profile_id) for profile_id in profile_ids] + [(client_v2.get_notes, profile_id) for profile_id in profile_ids]
+    results = concurrent_requests(get_author_notes, requests, desc='Loading publications')
+
+    publications_by_id = { profile_id: [] for profile_id in profile_ids }
+    for (get_notes, profile_id), publications in zip(requests, results):
+        publications_by_id[profile_id] = publications_by_id[profile_id] + publications
+    return publications_by_id
+
+def get_profiles(client, ids_or_emails, with_publications=False, with_relations=False, as_dict=False, request_stats=None):
     '''
     Helper function that repeatedly queries for profiles, given IDs and emails.
     Useful for getting more Profiles than the server will return by default (1000)
+
+    If request_stats is present, it counts the requests made to load the publications and their latency, see :class:`tools.RequestStats`.
+    If the client has a :class:`tools.ProfileCache`, only the profiles and publications that are missing or stale are requested.
     '''
     ids = []
     emails = []
@@ -194,29 +493,17 @@ def get_profiles(client, ids_or_emails, with_publications=False, with_relations=
     ## Get publications for all the profiles
     profiles = list(profile_by_id.values())
     if with_publications:
-        baseurl_v1 = 'http://localhost:3000'
-        baseurl_v2 = 'http://localhost:3001'
-
-        if 'https://devapi' in client.baseurl:
-            baseurl_v1 = 'https://devapi.openreview.net'
-            baseurl_v2 = 'https://devapi2.openreview.net'
-        if 'https://api' in client.baseurl:
-            baseurl_v1 = 'https://api.openreview.net'
-            baseurl_v2 = 'https://api2.openreview.net'
-
-        client_v1 = openreview.Client(baseurl=baseurl_v1, token=client.token)
-        client_v2 = openreview.api.OpenReviewClient(baseurl=baseurl_v2, token=client.token)
-
-        notes_v1 = concurrent_requests(lambda profile : client_v1.get_all_notes(content={'authorids': profile.id}), profiles, desc='Loading API v1 publications')
-        for idx, publications in enumerate(notes_v1):
-            profiles[idx].content['publications'] = publications
-
-        notes_v2 = concurrent_requests(lambda profile : client_v2.get_all_notes(content={'authorids': profile.id}), profiles, desc='Loading API v2 publications')
-        for idx, publications in enumerate(notes_v2):
-            if profiles[idx].content.get('publications'):
-                profiles[idx].content['publications'] = profiles[idx].content['publications'] +  publications
-            else:
-                profiles[idx].content['publications'] = publications
+        profile_cache = getattr(client, 'profile_cache', None)
+        scope = ProfileCache.get_scope(client) if profile_cache else None
+        publications_by_id = profile_cache.get_publications(profiles, scope=scope) if profile_cache else {}
+        missing_ids = [profile.id for profile in profiles if profile.id not in publications_by_id]
+        if missing_ids:
+            missing_publications_by_id = get_publications(client, missing_ids, request_stats=request_stats)
+            if profile_cache:
+                profile_cache.put_publications(profiles, missing_publications_by_id, scope=scope)
+            publications_by_id.update(missing_publications_by_id)
+        for profile in profiles:
+            profile.content['publications'] = publications_by_id[profile.id]
 
     if with_relations:
 
@@ -291,6 +578,228 @@ def get_invitation(client, id):
         print('Can not retrieve invitation', e)
     return invitation
 
+class ProcessContext(object):
+    """
+    Memoizes the domain group, groups and invitations requested during one invocation of a process function. The groups under a prefix, like all
+    the committee groups of a paper, are requested in one call with :meth:`prefetch_groups`. After that the groups under the prefix are read from
+    memory, including the groups that don't exist.
+
+    :param client: Client used by the process function
+    :type client: OpenReviewClient
+    :param domain: Id of the domain group, usually edit.domain
+    :type domain: str
+    """
+    def __init__(self, client, domain):
+        self.client = client
+        self.domain_id = domain
+        self.groups = {}
+        self.invitations = {}
+        self.prefixes = []
+
+    @property
+    def domain(self):
+        return self.get_group(self.domain_id)
+
+    def get_content_value(self, field_name, default_value=None):
+        """
+        Returns the value of a field of the domain content
+        """
+        return self.domain.get_content_value(field_name, default_value)
+
+    def is_prefetched(self, group_id):
+        return any(group_id.startswith(prefix) for prefix in self.prefixes)
+
+    def prefetch_groups(self, prefix):
+        """
+        Gets all the groups whose id starts with the prefix in one call
+
+        :param prefix: Group id prefix, like the id of a paper group followed by a slash
+        :type prefix: str
+        """
+        if self.is_prefetched(prefix):
+            return
+        for group in self.client.get_all_groups(prefix=prefix):
+            self.groups[group.id] = group
+        self.prefixes.append(prefix)
+
+    def get_group(self, group_id):
+        """
+        Returns the group or None if it does not exist
+
+        :param group_id: Group id
+        :type group_id: str
+
+        :rtype: Group
+        """
+        if group_id not in self.groups:
+            self.groups[group_id] = None if self.is_prefetched(group_id) else get_group(self.client, group_id)
+        return self.groups[group_id]
+
+    def get_groups(self, prefix):
+        """
+        Returns the groups whose id starts with the prefix, they are requested in one call the first time
+
+        :param prefix: Group id prefix
+        :type prefix: str
+
+        :rtype: list[Group]
+        """
+        self.prefetch_groups(prefix)
+        return [group for group_id, group in self.groups.items() if group and group_id.startswith(prefix)]
+
+    def get_invitation(self, invitation_id):
+        """
+        Returns the invitation or None if it does not exist or it is expired
+
+        :param invitation_id: Invitation id
+        :type invitation_id: str
+
+        :rtype: Invitation
+        """
+        if invitation_id not in self.invitations:
+            self.invitations[invitation_id] = get_invitation(self.client, invitation_id)
+        return self.invitations[invitation_id]
+
+def resolve_edit_template(template, content, depth=1):
+    """
+    Replaces the references to the edit content, ${N/content/name/value}, in the template of a meta invitation. N is the number of levels from the
+    value to the edit, so only the references to the edit of the meta invitation are replaced and the references of the templates of the children,
+    like ${2/note/readers}, are kept. A list value referenced as an item of a list is expanded into the items of the list.
+
+    :param template: Child template of the edit, invitation.edit['invitation'] or invitation.edit['group']
+    :type template: dict
+    :param content: Content of the edit
+    :type content: dict
+    :param depth: Number of levels from the template to the edit
+    :type depth: int, optional
+
+    :return: Expected child
+    :rtype: dict
+    """
+    reference = r'\$\{(\d+)/content/(\w+)/value\}'
+
+    def get_value(match, level):
+        if match and int(match.group(1)) == level and match.group(2) in content:
+            return content[match.group(2)]
+        return None
+
+    if isinstance(template, dict):
+        return { key: resolve_edit_template(value, content, depth + 1) for key, value in template.items() }
+    if isinstance(template, list):
+        resolved = []
+        for item in template:
+            item_content = get_value(re.fullmatch(reference, item), depth + 1) if isinstance(item, str) else None
+            if item_content and isinstance(item_content['value'], list):
+                resolved.extend(item_content['value'])
+            else:
+                resolved.append(resolve_edit_template(item, content, depth + 1))
+        return resolved
+    if isinstance(template, str):
+        value_content = get_value(re.fullmatch(reference, template), depth)
+        if value_content:
+            return value_content['value']
+        def replace_reference(match):
+            match_content = get_value(match, depth)
+            return str(match_content['value']) if match_content else match.group(0)
+        return re.sub(reference, replace_reference, template)
+    return template
+
+class EditTemplateDiff(object):
+    """
+    Compares the children that the edits of a meta invitation would create, computed locally from its edit template, with the current children,
+    so only the edits that create or change a child need to be posted. The current children, the invitations or groups edited with the meta
+    invitation, are requested once.
+
+    A child is unchanged when every field of the resolved template is equal in the child. The edits are merged into the child, so a field of the
+    child that the template doesn't set, like a cdate, duedate or expdate, is kept by the edit and is not a change.
+
+    :param client: Client used to get the children and post the edits
+    :type client: OpenReviewClient
+    :param invitation: Meta invitation, like the Official_Review invitation of a venue
+    :type invitation: Invitation
+    """
+    def __init__(self, client, invitation):
+        self.client = client
+        self.invitation = invitation
+        self.field = 'group' if 'group' in invitation.edit else 'invitation'
+        self.children = None
+
+    def get_children(self):
+        if self.children is None:
+            if self.field == 'group':
+                children = self.client.get_all_groups(invitation=self.invitation.id)
+            else:
+                children = self.client.get_all_invitations(invitation=self.invitation.id, expired=True)
+            self.children = { child.id: child for child in children }
+        return self.children
+
+    def get_changes(self, child, expected):
+        child_json = child.to_json()
+        return { key: (child_json.get(key), value) for key, value in expected.items() if child_json.get(key) != value }
+
+    def diff(self, contents):
+        """
+        Computes the expected child of each edit content and compares it with the current children
+
+        :param contents: Content of each edit
+        :type contents: list[dict]
+
+        :return: Dictionary with the 'create', 'update' and 'unchanged' entries. Each entry has the position of the content, the content, the child id,
+            the current child and the changed fields as (current value, expected value) tuples. Edits with an id that can't be resolved locally are updates.
+        :rtype: dict
+        """
+        children = self.get_children()
+        diff = { 'create': [], 'update': [], 'unchanged': [] }
+        for position, content in enumerate(contents):
+            expected = resolve_edit_template(self.invitation.edit[self.field], content)
+            child_id = expected['id'] if isinstance(expected['id'], str) and '${' not in expected['id'] else None
+            child = children.get(child_id)
+            entry = { 'position': position, 'content': content, 'id': child_id, 'child': child, 'changes': None }
+            if child_id and not child:
+                diff['create'].append(entry)
+            elif child:
+                entry['changes'] = self.get_changes(child, expected)
+                diff['update' if entry['changes'] else 'unchanged'].append(entry)
+            else:
+                diff['update'].append(entry)
+        return diff
+
+    def apply(self, contents, dry_run=False):
+        """
+        Posts the edits that create or change a child, the response of each edit is added to its entry
+
+        :param contents: Content of each edit
+        :type contents: list[dict]
+        :param dry_run: If True, the diff is returned without posting any edit
+        :type dry_run: bool, optional
+
+        :return: Diff of the edits, see :meth:`diff`
+        :rtype: dict
+        """
+        diff = self.diff(contents)
+        if dry_run:
+            return diff
+
+        domain = self.invitation.domain
+        def post_edit(entry):
+            if self.field == 'group':
+                entry['edit'] = self.client.post_group_edit(
+                    invitation=self.invitation.id,
+                    content=entry['content'],
+                    group=openreview.api.Group()
+                )
+            else:
+                entry['edit'] = self.client.post_invitation_edit(invitations=self.invitation.id,
+                    readers=[domain],
+                    writers=[domain],
+                    signatures=[domain],
+                    content=entry['content'],
+                    invitation=openreview.api.Invitation()
+                )
+
+        concurrent_requests(post_edit, diff['create'] + diff['update'], desc=f'post_{self.field}_edits')
+        return diff
+
 def create_profile(client, email, fullname, url='http://no_url', allow_duplicates=False):
 
     """
@@ -466,6 +975,9 @@ def generate_bibtex(note, venue_fullname, year, url_forum=None, paper_status='un
         else:
             authors = ' and '.join(note_author_list)
 
+    ## pylatexenc is slow to import, it is only loaded when a bibtex is generated
+    from pylatexenc.latexencode import utf8tolatex, UnicodeToLatexConversionRule, UnicodeToLatexEncoder, RULE_REGEX
+
     u = UnicodeToLatexEncoder(
         conversion_rules=[
             UnicodeToLatexConversionRule(
@@ -535,9 +1047,29 @@ def load_duplicate_domains():
     return duplicate_domains
 
 
+SUBDOMAINS_CACHE_SIZE = 200000
+
+@functools.lru_cache(maxsize=SUBDOMAINS_CACHE_SIZE)
+def _is_tld(suffix):
+    import tld
+    return tld.is_tld(suffix)
+
+@functools.lru_cache(maxsize=SUBDOMAINS_CACHE_SIZE)
+def _expand_domain(domain):
+    duplicate_domains: dict = load_duplicate_domains()
+    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
+    domains = ['.'.join(domain_components[index:len(domain_components)]) for index, path in enumerate(domain_components)]
+    valid_domains = set()
+    for d in domains:
+        if not _is_tld(d):
+            valid_domains.add(duplicate_domains.get(d, d))
+
+    return tuple(sorted(valid_domains))
+
 def subdomains(domain):
     """
     Given an email address, returns a list with the domains and subdomains.
+    The expansion of each domain is kept in a process-wide table of at most SUBDOMAINS_CACHE_SIZE domains, see :func:`tools.subdomains_cache_info`.
 
     :param domain: e-mail address or domain of the e-mail address
     :type domain: str
@@ -550,16 +1082,43 @@ def subdomains(domain):
     >>> subdomains('johnsmith@iesl.cs.umass.edu')
     [u'iesl.cs.umass.edu', u'cs.umass.edu', u'umass.edu']
     """
+    return list(_expand_domain(domain))
 
-    duplicate_domains: dict = load_duplicate_domains()
-    domain_components = [c for c in domain.split('.') if c and not c.isspace()]
-    domains = ['.'.join(domain_components[index:len(domain_components)]) for index, path in enumerate(domain_components)]
-    valid_domains = set()
-    for d in domains:
-        if not tld.is_tld(d):
-            valid_domains.add(duplicate_domains.get(d, d))
+def warm_subdomains(domains_or_emails):
+    """
+    Expands a list of domains ahead of time so the following calls to :func:`tools.subdomains` are served from the domain table.
 
-    return sorted(valid_domains)
+    :param domains_or_emails: List of domains or e-mail addresses, the domain of each e-mail address is expanded
+    :type domains_or_emails: list[str]
+
+    :return: Statistics of the domain table after warming it up, see :func:`tools.subdomains_cache_info`
+    :rtype: dict
+    """
+    for value in domains_or_emails:
+        _expand_domain(value.split('@')[-1])
+    return subdomains_cache_info()
+
+def subdomains_cache_info():
+    """
+    Returns the statistics of the domain table used by :func:`tools.subdomains`
+
+    :return: Dictionary with the number of hits and misses, the current size and the max size of the table
+    :rtype: dict
+    """
+    info = _expand_domain.cache_info()
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'max_size': info.maxsize
+    }
+
+def clear_subdomains_cache():
+    """
+    Empties the domain table used by :func:`tools.subdomains` and resets its statistics
+    """
+    _expand_domain.cache_clear()
+    _is_tld.cache_clear()
 
 def get_paperhash(first_author, title):
     """
@@ -651,7 +1210,7 @@ def concurrent_get(client, get_function, **params):
     :return: List of results
     :rtype: list
     """
-    max_workers = min(cpu_count() - 1, 6)
+    max_workers = max(min(cpu_count() - 1, 6), 1)
 
     if (params.get('limit') or float('inf')) <= client.limit:
         docs = get_function(**params)
@@ -830,6 +1389,166 @@ class efficient_iterget:
     next = __next__
 
 
+def parallel_get(get_function, desc='Gathering Responses', workers=None, page_size=1000, **params):
+    """
+    Returns all the objects that match the params, requesting partitions of the results concurrently. It is used by :meth:`openreview.api.OpenReviewClient.get_all_notes`,
+    :meth:`openreview.api.OpenReviewClient.get_all_edges` and :meth:`openreview.api.OpenReviewClient.get_all_invitations`.
+
+    The first request gets the first page sorted by id and the total count. The count is split in partitions of consecutive pages, the first page of each
+    partition is requested by offset and the rest of the partition is walked with the after cursor until the first id of the next partition.
+    If get_function doesn't accept an after cursor or the objects are sorted by another field, each page is requested by offset.
+    The objects are returned in the same order as requesting the pages one by one.
+
+    :param get_function: Getter that accepts limit, offset and with_count, for example :meth:`openreview.api.OpenReviewClient.get_notes`
+    :type get_function: function
+    :param desc: Description shown in the progress bar
+    :type desc: str, optional
+    :param workers: Max number of concurrent requests. If none is provided, it defaults to the number of CPUs minus one, up to 6
+    :type workers: int, optional
+    :param page_size: Number of objects requested per page
+    :type page_size: int, optional
+    :param params: Parameters passed to get_function. If limit or offset are present, only the objects in that range are returned
+    :type params: dict
+
+    :return: List of objects
+    :rtype: list
+    """
+    workers = workers or max(min(cpu_count() - 1, 6), 1)
+    limit = params.pop('limit', None)
+    offset = params.pop('offset', None) or 0
+    params.pop('after', None)
+    params.pop('with_count', None)
+
+    use_cursor = 'after' in inspect.signature(get_function).parameters and params.get('sort') in [None, 'id']
+    if use_cursor:
+        params['sort'] = 'id'
+
+    first_page = None
+    if offset:
+        _, count = get_function(**params, limit=1, with_count=True)
+    else:
+        first_page, count = get_function(**params, limit=page_size, with_count=True)
+
+    end = count if limit is None else min(offset + limit, count)
+    if end <= offset:
+        return []
+    if first_page is not None and end - offset <= page_size:
+        return first_page[:end - offset]
+
+    def get_page(page_offset, page_limit, after=None):
+        if page_offset == offset and after is None and first_page is not None:
+            return first_page[:page_limit]
+        if after is None:
+            return get_function(**params, offset=page_offset, limit=page_limit)
+        return get_function(**params, after=after, limit=page_limit)
+
+    page_offsets = list(range(offset, end, page_size))
+    gathering_responses = tqdm(total=end - offset, desc=desc)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        if not use_cursor:
+            def get_offset_page(page_offset):
+                page = get_page(page_offset, min(page_size, end - page_offset))
+                gathering_responses.update(len(page))
+                return page
+
+            pages = list(executor.map(get_offset_page, page_offsets))
+            gathering_responses.close()
+            return [obj for page in pages for obj in page]
+
+        partitions_count = min(len(page_offsets), workers)
+        starts = [page_offsets[(len(page_offsets) * index) // partitions_count] for index in range(partitions_count)]
+        ends = starts[1:] + [end]
+        first_pages = list(executor.map(lambda index: get_page(starts[index], min(page_size, ends[index] - starts[index])), range(partitions_count)))
+
+        def walk_partition(index):
+            size = ends[index] - starts[index]
+            boundary_id = first_pages[index + 1][0].id if index + 1 < partitions_count and first_pages[index + 1] else None
+            partition = []
+            page = first_pages[index]
+            page_limit = min(page_size, size)
+            while True:
+                added = 0
+                for obj in page:
+                    if obj.id == boundary_id or len(partition) == size:
+                        gathering_responses.update(added)
+                        return partition
+                    partition.append(obj)
+                    added += 1
+                gathering_responses.update(added)
+                if len(page) < page_limit or len(partition) == size:
+                    return partition
+                page_limit = min(page_size, size - len(partition))
+                page = get_page(None, page_limit, after=partition[-1].id)
+
+        partitions = list(executor.map(walk_partition, range(partitions_count)))
+
+    gathering_responses.close()
+
+    ## Objects added or removed while paginating can shift the first page of a partition, skip the ones already returned
+    objects = []
+    ids = set()
+    for partition in partitions:
+        for obj in partition:
+            if obj.id not in ids:
+                ids.add(obj.id)
+                objects.append(obj)
+    return objects
+
+
+def iter_all(get_function, prefetch=False, page_size=1000, **params):
+    """
+    Yields the objects that match the params page by page, keeping at most two pages in memory. It is used by :meth:`openreview.api.OpenReviewClient.iter_all_notes`,
+    :meth:`openreview.api.OpenReviewClient.iter_all_edges`, :meth:`openreview.api.OpenReviewClient.iter_all_groups` and :meth:`openreview.api.OpenReviewClient.iter_all_invitations`.
+
+    The pages are walked with the after cursor sorted by id. If get_function doesn't accept an after cursor or the objects are sorted by another field, the pages are requested by offset.
+
+    :param get_function: Getter that accepts limit and offset, for example :meth:`openreview.api.OpenReviewClient.get_notes`
+    :type get_function: function
+    :param prefetch: If true, the next page is requested in a background thread while the current page is processed
+    :type prefetch: bool, optional
+    :param page_size: Number of objects requested per page
+    :type page_size: int, optional
+    :param params: Parameters passed to get_function
+    :type params: dict
+
+    :return: Iterator over the objects
+    :rtype: generator
+    """
+    params.pop('limit', None)
+    params.pop('offset', None)
+    params.pop('after', None)
+    params.pop('with_count', None)
+
+    use_cursor = 'after' in inspect.signature(get_function).parameters and params.get('sort') in [None, 'id']
+    if use_cursor:
+        params['sort'] = 'id'
+
+    def get_page(offset, page):
+        if use_cursor and page:
+            return get_function(**params, after=page[-1].id, limit=page_size)
+        return get_function(**params, offset=offset, limit=page_size)
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        offset = 0
+        page = get_page(offset, None)
+        while page:
+            offset += len(page)
+            next_page = None
+            if len(page) == page_size:
+                next_page = executor.submit(get_page, offset, page) if executor else functools.partial(get_page, offset, page)
+            for obj in page:
+                yield obj
+            if next_page is None:
+                return
+            page = next_page.result() if executor else next_page()
+    finally:
+        if executor:
+            executor.shutdown(wait=False)
+
+
 def iterget_messages(client, to = None, subject = None, status = None):
     """
     Returns an iterator over Messages ignoring API limit.
@@ -1204,41 +1923,29 @@ def datetime_millis(dt):
 
     return dt
 
-def recruit_reviewer(client, user, first,
-    hash_seed,
-    recruit_reviewers_id,
-    recruit_message,
-    recruit_message_subj,
-    reviewers_invited_id,
-    contact_info='info@openreview.net',
-    verbose=True,
-    replyTo=None):
+def get_recruitment_message(user, first, hash_seed, recruit_reviewers_id, recruit_message, contact_info='info@openreview.net'):
     """
-    Recruit a reviewer. Sends an email to the reviewer with a link to accept or
-    reject the recruitment invitation.
+    Returns the recruitment message of a user, with the links to accept or reject the recruitment invitation. See :func:`recruit_reviewer`.
 
-    :param client: Client used to send the e-mail
-    :type client: Client
     :param user: User to whom the e-mail will be sent
     :type user: str
     :param first: First name of the person to whom e-mail will be sent
     :type first: str
     :param hash_seed: a random number for seeding the hash.
     :type hash_seed: int
+    :param recruit_reviewers_id: id of the recruitment invitation
+    :type recruit_reviewers_id: str
     :param recruit_message: a formattable string containing the following string variables: (name, accept_url, decline_url)
     :type recruit_message: str
-    :param recruit_message_subj: subject line for the recruitment email
-    :type recruit_message_subj: str
-    :param reviewers_invited_id: group ID for the "Reviewers Invited" group, often used to keep track of which reviewers have already been emailed. str
-    :type reviewers_invited_id: str
     :param contact_info: The information used to contact support for questions
     :type contact_info: str
-    :param verbose: Shows response of :meth:`openreview.Client.post_message` and shows the body of the message sent
-    :type verbose: bool, optional
-    :param baseurl: Use this baseUrl instead of client.baseurl to create recruitment links
-    :type baseurl: str, optional
+
+    :return: Personalized message
+    :rtype: str
     """
 
+    from Crypto.Hash import HMAC, SHA256
+
     # the HMAC.new() function only accepts bytestrings, not unicode.
     # In Python 3, all strings are treated as unicode by default, so we must call encode on
     # these unicode strings to convert them to bytestrings. This behavior is the same in
@@ -1248,7 +1955,7 @@ def recruit_reviewer(client, user, first,
 
     # build the URL to send in the message
     url = '{baseurl}/invitation?id={recruitment_inv}&user={user}&key={hashkey}'.format(
-        baseurl = baseurl if baseurl else client.baseurl,
+        baseurl = baseurl,
         recruitment_inv = recruit_reviewers_id,
         user = urlparse.quote(user),
         hashkey = hashkey
@@ -1262,6 +1969,44 @@ def recruit_reviewer(client, user, first,
     personalized_message = personalized_message.replace("{{contact_info}}", contact_info)
 
     personalized_message.format()
+    return personalized_message
+
+def recruit_reviewer(client, user, first,
+    hash_seed,
+    recruit_reviewers_id,
+    recruit_message,
+    recruit_message_subj,
+    reviewers_invited_id,
+    contact_info='info@openreview.net',
+    verbose=True,
+    replyTo=None):
+    """
+    Recruit a reviewer. Sends an email to the reviewer with a link to accept or
+    reject the recruitment invitation.
+
+    :param client: Client used to send the e-mail
+    :type client: Client
+    :param user: User to whom the e-mail will be sent
+    :type user: str
+    :param first: First name of the person to whom e-mail will be sent
+    :type first: str
+    :param hash_seed: a random number for seeding the hash.
+    :type hash_seed: int
+    :param recruit_message: a formattable string containing the following string variables: (name, accept_url, decline_url)
+    :type recruit_message: str
+    :param recruit_message_subj: subject line for the recruitment email
+    :type recruit_message_subj: str
+    :param reviewers_invited_id: group ID for the "Reviewers Invited" group, often used to keep track of which reviewers have already been emailed. str
+    :type reviewers_invited_id: str
+    :param contact_info: The information used to contact support for questions
+    :type contact_info: str
+    :param verbose: Shows response of :meth:`openreview.Client.post_message` and shows the body of the message sent
+    :type verbose: bool, optional
+    :param baseurl: Use this baseUrl instead of client.baseurl to create recruitment links
+    :type baseurl: str, optional
+    """
+
+    personalized_message = get_recruitment_message(user, first, hash_seed, recruit_reviewers_id, recruit_message, contact_info)
 
     try:
         client.add_members_to_group(reviewers_invited_id, [user])
@@ -1288,21 +2033,17 @@ def get_all_venues(client):
     return client.get_group("host").members
 
 def info_function_builder(policy_function):
+    common_domains = ['gmail.com', 'qq.com', '126.com', '163.com',
+                'outlook.com', 'hotmail.com', 'yahoo.com', 'foxmail.com', 'aol.com', 'msn.com', 'ymail.com', 'googlemail.com', 'live.com']
+    with_submission_venueid = 'submission_venueid' in inspect.getfullargspec(policy_function).args
     def inner(profile, n_years=None, submission_venueid=None):
-        common_domains = ['gmail.com', 'qq.com', '126.com', '163.com',
-                    'outlook.com', 'hotmail.com', 'yahoo.com', 'foxmail.com', 'aol.com', 'msn.com', 'ymail.com', 'googlemail.com', 'live.com']
-        argspec = inspect.getfullargspec(policy_function)
-        if 'submission_venueid' in argspec.args:
+        if with_submission_venueid:
             result = policy_function(profile, n_years, submission_venueid)
         else:
             result = policy_function(profile, n_years)
         domains = set()
-        subdomains_dict = {}
         for domain in result['domains']:
-            if domain not in subdomains_dict:
-                subdomains = openreview.tools.subdomains(domain)
-                subdomains_dict[domain] = subdomains
-            domains.update(subdomains_dict[domain])
+            domains.update(_expand_domain(domain))
 
         # Filter common domains
         for common_domain in common_domains:
@@ -1329,12 +2070,6 @@ def get_conflicts(author_profiles, user_profile, policy='default', n_years=None)
     :rtype: list[str]
     """
 
-    author_ids = set()
-    author_domains = set()
-    author_emails = set()
-    author_relations = set()
-    author_publications = set()
-
     if callable(policy):
         info_function = info_function_builder(policy)
     elif policy == 'NeurIPS':
@@ -1342,16 +2077,33 @@ def get_conflicts(author_profiles, user_profile, policy='default', n_years=None)
     else:
         info_function = info_function_builder(get_profile_info)
 
-    for profile in author_profiles:
-        author_info = info_function(profile, n_years)
+    return get_info_conflicts([info_function(profile, n_years) for profile in author_profiles], info_function(user_profile, n_years))
+
+def get_info_conflicts(authors_info, user_info):
+    """
+    Finds conflicts between the profile info of a user and the profile info of the authors, with the same rules as :func:`tools.get_conflicts`
+
+    :param authors_info: List of profile info dictionaries, as returned by a function built with :func:`tools.info_function_builder`
+    :type authors_info: list[dict]
+    :param user_info: Profile info dictionary of the user
+    :type user_info: dict
+
+    :return: List containing all the conflicts between the user and the authors
+    :rtype: list[str]
+    """
+    author_ids = set()
+    author_domains = set()
+    author_emails = set()
+    author_relations = set()
+    author_publications = set()
+
+    for author_info in authors_info:
         author_ids.add(author_info['id'])
         author_domains.update(author_info['domains'])
         author_emails.update(author_info['emails'])
         author_relations.update(author_info['relations'])
         author_publications.update(author_info['publications'])
 
-    user_info = info_function(user_profile, n_years)
-
     conflicts = set()
     conflicts.update(author_domains.intersection(user_info['domains']))
     conflicts.update(author_relations.intersection(user_info['emails'])) ## keep this one until all relations have a profile
@@ -1363,6 +2115,291 @@ def get_conflicts(author_profiles, user_profile, policy='default', n_years=None)
 
     return list(conflicts)
 
+class PendingSignUps(object):
+    """
+    Collects the 'Pending Sign Up' invite assignment Edges of many invitations and resolves them in bulk: the profiles of all the tails are
+    searched at once, the submissions and the profiles of their authors are requested in batches and the conflicts are computed in memory.
+    It is used by :meth:`openreview.venue.Venue.check_new_profiles` and :meth:`openreview.journal.Journal.check_new_profiles`.
+
+    Example:
+
+    >>> pending_sign_ups = openreview.tools.PendingSignUps(client)
+    >>> pending_sign_ups.add(invite_assignment_invitation_id, submission_venue_id, policy='NeurIPS', n_years=3)
+    >>> for invitation_id, context, edge, submission, user_profile, conflicts in pending_sign_ups.resolve():
+    ...     print(edge.head, user_profile.id, conflicts)
+
+    :param client: Client used to get the Edges, profiles and submissions
+    :type client: openreview.api.OpenReviewClient
+    :param batch_size: Max number of submissions requested at once
+    :type batch_size: int, optional
+    """
+    def __init__(self, client, batch_size=1000):
+        self.client = client
+        self.batch_size = batch_size
+        self.invitations = []
+
+    def add(self, invite_assignment_invitation_id, submission_venue_id, policy='default', n_years=None, context=None):
+        """
+        Gets the 'Pending Sign Up', 'Accepted' and 'Invitation Sent' Edges of an invite assignment invitation grouped by tail.
+
+        :param invite_assignment_invitation_id: Id of the invite assignment invitation
+        :type invite_assignment_invitation_id: str
+        :param submission_venue_id: venueid of the submissions that can still be assigned, the Edges of other submissions are skipped
+        :type submission_venue_id: str
+        :param policy: Conflict policy, see :func:`tools.get_conflicts`
+        :type policy: str or function, optional
+        :param n_years: Number of years considered by the conflict policy
+        :type n_years: int, optional
+        :param context: Object returned with each Edge of this invitation, for example the venue group
+        :type context: object, optional
+
+        :return: Number of tails with pending Edges
+        :rtype: int
+        """
+        grouped_edges = self.client.get_grouped_edges(invitation=invite_assignment_invitation_id, label='Pending Sign Up', groupby='tail')
+        edges_by_tail = { grouped_edge['id']['tail']: grouped_edge['values'] for grouped_edge in grouped_edges }
+
+        ## The accepted and the sent invitations are only needed to resolve the pending Edges
+        accepted_heads_by_tail = {}
+        invitation_sent_by_tail = {}
+        if edges_by_tail:
+            accepted_heads_by_tail = { grouped_edge['id']['tail']: set(value['head'] for value in grouped_edge['values']) for grouped_edge in self.client.get_grouped_edges(invitation=invite_assignment_invitation_id, label='Accepted', groupby='tail', select='head') }
+            invitation_sent_by_tail = { grouped_edge['id']['tail']: grouped_edge['values'] for grouped_edge in self.client.get_grouped_edges(invitation=invite_assignment_invitation_id, label='Invitation Sent', groupby='tail') }
+
+        self.invitations.append({
+            'id': invite_assignment_invitation_id,
+            'submission_venue_id': submission_venue_id,
+            'policy': policy,
+            'n_years': n_years,
+            'context': context,
+            'edges_by_tail': edges_by_tail,
+            'accepted_heads_by_tail': accepted_heads_by_tail,
+            'invitation_sent_by_tail': invitation_sent_by_tail
+        })
+        return len(grouped_edges)
+
+    def get_submissions(self, ids):
+        submissions = {}
+        for i in range(0, len(ids), self.batch_size):
+            for submission in self.client.get_notes_by_ids(ids[i:i+self.batch_size]):
+                submissions[submission.id] = submission
+        return submissions
+
+    def resolve(self):
+        """
+        Yields the pending Edges of the tails that have an active profile and whose submission is still active, in the order they were added.
+        An Edge is skipped when the profile already accepted the same submission with another Edge, and an 'Invitation Sent' Edge to the same
+        profile and submission is deleted because the user was invited twice.
+
+        :return: Iterator over tuples with the invitation id, the context, the Edge, the submission, the profile of the tail and the list of conflicts
+        :rtype: generator
+        """
+        tails = list(dict.fromkeys(tail for invitation in self.invitations for tail in invitation['edges_by_tail']))
+        if not tails:
+            return
+
+        ## Most tails are emails that didn't sign up yet, only the active profiles are loaded with their publications
+        profiles_by_tail = get_profiles(self.client, tails, as_dict=True)
+        active_ids = list(dict.fromkeys(profile.id for profile in profiles_by_tail.values() if profile and profile.active))
+        user_profiles = { profile.id: profile for profile in get_profiles(self.client, active_ids, with_publications=True, with_relations=True) } if active_ids else {}
+
+        for tail in tails:
+            if tail not in user_profiles and not (profiles_by_tail.get(tail) and profiles_by_tail[tail].active):
+                print(f'no profile active for {tail}')
+
+        pending = []
+        for invitation in self.invitations:
+            for tail, edges in invitation['edges_by_tail'].items():
+                profile = profiles_by_tail.get(tail)
+                if profile and profile.id in user_profiles:
+                    print('Profile found for', tail, profile.id)
+                    pending.extend((invitation, user_profiles[profile.id], openreview.api.Edge.from_json(edge)) for edge in edges)
+
+        submissions = self.get_submissions(list(dict.fromkeys(edge.head for _, _, edge in pending)))
+        active_pending = []
+        for invitation, user_profile, edge in pending:
+            submission = submissions.get(edge.head)
+            if submission and submission.content['venueid']['value'] == invitation['submission_venue_id']:
+                active_pending.append((invitation, user_profile, edge, submission))
+            elif submission:
+                print(f'submission {submission.id} is not active: {submission.content["venueid"]["value"]}')
+            else:
+                print(f'submission {edge.head} not found')
+
+        authorids = list(dict.fromkeys(authorid for _, _, _, submission in active_pending for authorid in submission.content['authorids']['value']))
+        author_profiles = get_profiles(self.client, authorids, with_publications=True, with_relations=True, as_dict=True) if authorids else {}
+
+        for invitation, user_profile, edge, submission in active_pending:
+
+            accepted_heads = invitation['accepted_heads_by_tail'].setdefault(user_profile.id, set())
+            if submission.id in accepted_heads:
+                print("user already accepted with another invitation edge", submission.id, user_profile.id)
+                continue
+
+            invitation_edges = [e for e in invitation['invitation_sent_by_tail'].get(user_profile.id, []) if e['head'] == submission.id and not e.get('ddate')]
+            if invitation_edges:
+                invitation_edge = openreview.api.Edge.from_json(dict(invitation_edges[0], invitation=invitation['id'], tail=user_profile.id, label='Invitation Sent'))
+                print(f'User invited twice, remove double invitation edge {invitation_edge.id}')
+                invitation_edge.ddate = datetime_millis(datetime.datetime.utcnow())
+                self.client.post_edge(invitation_edge)
+                invitation_edges[0]['ddate'] = invitation_edge.ddate
+
+            submission_author_profiles = list({ profile.id: profile for profile in [author_profiles.get(authorid) for authorid in submission.content['authorids']['value']] if profile }.values())
+            conflicts = get_conflicts(submission_author_profiles, user_profile, policy=invitation['policy'], n_years=invitation['n_years'])
+
+            ## The edge is now accepted or in conflict
+            if not conflicts:
+                accepted_heads.add(submission.id)
+            yield invitation['id'], invitation['context'], edge, submission, user_profile, conflicts
+
+class ConflictIndex(object):
+    """
+    Inverted index over the profile info of a committee. Every domain, email, relation, publication and profile id is mapped to the committee members
+    that contain it, so the members that conflict with a set of authors are found with one lookup per author token instead of intersecting the
+    author info with the info of every member.
+
+    A member conflicts with the authors when they share a domain, an email or a publication, when an author relation is one of the member emails
+    or when one of the author emails is a member relation. If match_ids is True, a relation between an author id and the member id is also a conflict.
+
+    :param profiles_info: List of profile info dictionaries, as returned by a function built with :func:`tools.info_function_builder`
+    :type profiles_info: list[dict], optional
+    :param match_ids: If True, the profile ids of the authors and the members are matched against their relations
+    :type match_ids: bool, optional
+    """
+    def __init__(self, profiles_info=None, match_ids=True):
+        self.match_ids = match_ids
+        self.profiles_info = []
+        self.position_by_id = {}
+        self.by_domain = {}
+        self.by_email = {}
+        self.by_relation = {}
+        self.by_publication = {}
+        self.by_id = {}
+
+        for profile_info in profiles_info or []:
+            self.add(profile_info)
+
+    def __len__(self):
+        return len(self.profiles_info)
+
+    def _index(self, index, tokens, position):
+        for token in tokens:
+            positions = index.get(token)
+            if positions is None:
+                index[token] = [position]
+            elif positions[-1] != position:
+                positions.append(position)
+
+    def add(self, profile_info):
+        """
+        Adds the info of a committee member to the index
+
+        :param profile_info: Profile info dictionary with the keys id, domains, emails, relations and publications
+        :type profile_info: dict
+        """
+        position = len(self.profiles_info)
+        self.profiles_info.append(profile_info)
+        self.position_by_id[profile_info['id']] = position
+        self._index(self.by_domain, profile_info['domains'], position)
+        self._index(self.by_email, profile_info['emails'], position)
+        self._index(self.by_relation, profile_info['relations'], position)
+        self._index(self.by_publication, profile_info['publications'], position)
+        self._index(self.by_id, [profile_info['id']], position)
+
+    def search(self, authors_info):
+        """
+        Returns the positions of the members that conflict with any of the authors
+
+        :param authors_info: List of profile info dictionaries of the authors
+        :type authors_info: list[dict]
+
+        :return: Set of positions in the order the members were added to the index
+        :rtype: set[int]
+        """
+        author_ids = set()
+        author_domains = set()
+        author_emails = set()
+        author_relations = set()
+        author_publications = set()
+        for author_info in authors_info:
+            author_ids.add(author_info['id'])
+            author_domains.update(author_info['domains'])
+            author_emails.update(author_info['emails'])
+            author_relations.update(author_info['relations'])
+            author_publications.update(author_info['publications'])
+
+        positions = set()
+
+        def lookup(index, tokens):
+            for token in tokens:
+                matches = index.get(token)
+                if matches:
+                    positions.update(matches)
+
+        lookup(self.by_domain, author_domains)
+        lookup(self.by_email, author_relations) ## keep this until all the relations are updated
+        lookup(self.by_relation, author_emails) ## keep this until all the relations are updated
+        lookup(self.by_email, author_emails)
+        lookup(self.by_publication, author_publications)
+        if self.match_ids:
+            lookup(self.by_id, author_relations)
+            lookup(self.by_relation, author_ids)
+
+        return positions
+
+    def find(self, authors_info):
+        """
+        Returns the info of the members that conflict with any of the authors
+
+        :param authors_info: List of profile info dictionaries of the authors
+        :type authors_info: list[dict]
+
+        :return: List of profile info dictionaries in the order they were added to the index
+        :rtype: list[dict]
+        """
+        return [self.profiles_info[position] for position in sorted(self.search(authors_info))]
+
+_worker_conflict_index = None
+
+def _init_conflict_worker(profiles_info, match_ids):
+    global _worker_conflict_index
+    _worker_conflict_index = ConflictIndex(profiles_info, match_ids=match_ids)
+
+def _search_conflicts_shard(authors_info_shard):
+    return [sorted(_worker_conflict_index.search(authors_info)) for authors_info in authors_info_shard]
+
+def search_conflicts(profiles_info, authors_info_list, match_ids=True, workers=None):
+    """
+    Finds the profiles that conflict with each group of authors, usually the authors of each submission.
+
+    If workers is greater than one, the groups of authors are split in contiguous shards that are processed by a pool of processes. The profile info
+    is sent to each process once, when the process starts, and every process builds its own :class:`tools.ConflictIndex`. The shards are merged
+    in order, so the result does not depend on the number of workers.
+
+    :param profiles_info: List of profile info dictionaries of the committee members
+    :type profiles_info: list[dict]
+    :param authors_info_list: List with the profile info dictionaries of each group of authors
+    :type authors_info_list: list[list[dict]]
+    :param match_ids: If True, the profile ids of the authors and the members are matched against their relations
+    :type match_ids: bool, optional
+    :param workers: Number of processes used to compute the conflicts, by default the conflicts are computed in the current process
+    :type workers: int, optional
+
+    :return: List with the sorted positions in profiles_info of the members that conflict with each group of authors
+    :rtype: list[list[int]]
+    """
+    if not workers or workers <= 1 or len(authors_info_list) < 2:
+        index = ConflictIndex(profiles_info, match_ids=match_ids)
+        return [sorted(index.search(authors_info)) for authors_info in tqdm(authors_info_list, desc='search_conflicts')]
+
+    shard_size = -(-len(authors_info_list) // (workers * 4))
+    shards = [authors_info_list[i:i+shard_size] for i in range(0, len(authors_info_list), shard_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_conflict_worker, initargs=(profiles_info, match_ids)) as executor:
+        for shard_results in tqdm(executor.map(_search_conflicts_shard, shards), total=len(shards), desc='search_conflicts'):
+            results.extend(shard_results)
+    return results
+
 def get_profile_info(profile, n_years=None):
     """
     Gets all the domains, emails, relations associated with a Profile
@@ -1602,14 +2639,342 @@ def filter_relations_by_year(relations, cut_off_year, only_relations=None):
 
     return filtered_relations
 
-def post_bulk_edges (client, edges, batch_size = 50000):
-    num_edges = len(edges)
-    result = []
-    for i in tqdm(range(0, num_edges, batch_size), total=(num_edges // batch_size + 1)):
-        end = min(i + batch_size, num_edges)
-        batch = client.post_edges(edges[i:end])
-        result += batch
-    return result
+class BulkEdgeUploader(object):
+    """
+    Posts Edges in batches with a bounded number of batches in flight. A batch that fails with a connection error, a timeout or a 5xx response
+    is retried with exponential backoff, and the batch size is halved when a batch takes longer than target_latency seconds and grown back when
+    batches are fast. If check_applied is true, the Edges with the head and tail of the first and last Edges of a batch are counted before it is
+    posted and again after a failed request, and the batch is not posted again if the failed request added them. If cleared is true the
+    invitation had no Edges before the upload and the Edges are only counted after a failed request.
+
+    If checkpoint is present, the number of Edges acknowledged in order is written to that file after each batch, and an upload interrupted
+    with the same checkpoint_key resumes after the last acknowledged Edge. The file is removed when the upload finishes.
+
+    Example:
+
+    >>> uploader = openreview.tools.BulkEdgeUploader(client, max_in_flight=4, check_applied=True, checkpoint='conflicts.checkpoint', checkpoint_key=invitation_id)
+    >>> if not uploader.resume_offset():
+    ...     client.delete_edges(invitation_id, wait_to_finish=True)
+    ...     uploader.cleared = True
+    >>> uploader.upload(edges)
+
+    :param client: Client used to post the Edges
+    :type client: Client
+    :param batch_size: Initial and max number of Edges per request
+    :type batch_size: int, optional
+    :param min_batch_size: Min number of Edges per request when the batch size is reduced
+    :type min_batch_size: int, optional
+    :param max_in_flight: Max number of batches posted concurrently
+    :type max_in_flight: int, optional
+    :param target_latency: Seconds a batch should take to be posted
+    :type target_latency: float, optional
+    :param retries: Number of times a failed batch is posted again
+    :type retries: int, optional
+    :param backoff: Seconds to wait before the first retry, doubled on each retry
+    :type backoff: float, optional
+    :param check_applied: If true, a failed batch is not posted again when the failed request added its Edges
+    :type check_applied: bool, optional
+    :param cleared: If true, the invitation had no Edges before the upload
+    :type cleared: bool, optional
+    :param checkpoint: Path of the checkpoint file
+    :type checkpoint: str, optional
+    :param checkpoint_key: Identifies the upload in the checkpoint file, a checkpoint with another key is ignored
+    :type checkpoint_key: str, optional
+    """
+    def __init__(self, client, batch_size=50000, min_batch_size=1000, max_in_flight=1, target_latency=30, retries=3, backoff=2, check_applied=False, cleared=False, checkpoint=None, checkpoint_key=None):
+        self.client = client
+        self.batch_size = batch_size
+        self.max_batch_size = batch_size
+        self.min_batch_size = min(min_batch_size, batch_size)
+        self.max_in_flight = max_in_flight
+        self.target_latency = target_latency
+        self.retries = retries
+        self.backoff = backoff
+        self.check_applied = check_applied
+        self.cleared = cleared
+        self.checkpoint = checkpoint
+        self.checkpoint_key = checkpoint_key
+        self.requests = 0
+        self.retried = 0
+        self.lock = threading.Lock()
+
+    def resume_offset(self):
+        """
+        :return: Number of Edges acknowledged by an interrupted upload with the same checkpoint_key, 0 if there is none
+        :rtype: int
+        """
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return 0
+        with open(self.checkpoint) as file_handle:
+            state = json.load(file_handle)
+        return state['acknowledged'] if state.get('key') == self.checkpoint_key else 0
+
+    def _write_checkpoint(self, acknowledged):
+        temporary_path = self.checkpoint + '.tmp'
+        with open(temporary_path, 'w') as file_handle:
+            json.dump({ 'key': self.checkpoint_key, 'acknowledged': acknowledged }, file_handle)
+        os.replace(temporary_path, self.checkpoint)
+
+    def _is_retryable(self, error):
+        ## A 4xx response fails the same way when the batch is posted again
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        return isinstance(error, openreview.OpenReviewException) and (error.status_code or 0) >= 500
+
+    def _count_edges(self, edges):
+        return [self.client.get_edges_count(invitation=edge.invitation, head=edge.head, tail=edge.tail, label=edge.label) for edge in edges]
+
+    def _post_batch(self, batch):
+        ## A failed post could still have been applied by the server and posting it again would duplicate the Edges
+        sample = [batch[0], batch[len(batch) - 1]] if self.check_applied and self.retries else []
+        counts = [0] * len(sample) if self.cleared else self._count_edges(sample)
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            try:
+                with self.lock:
+                    self.requests += 1
+                return self.client.post_edges(batch), time.perf_counter() - start
+            except Exception as e:
+                if attempt == self.retries or not self._is_retryable(e):
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+                applied = [new_count > count for new_count, count in zip(self._count_edges(sample), counts)]
+                if applied and all(applied):
+                    print(f'Batch of {len(batch)} edges was posted before error: {e}')
+                    return list(batch), time.perf_counter() - start
+                if any(applied):
+                    raise openreview.OpenReviewException(f'Batch of {len(batch)} edges was partially posted before error: {e}')
+                with self.lock:
+                    self.retried += 1
+                print(f'Retrying batch of {len(batch)} edges after error: {e}')
+
+    def _adapt_batch_size(self, latency):
+        if latency > self.target_latency:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        elif latency < self.target_latency / 4:
+            self.batch_size = min(self.max_batch_size, int(self.batch_size * 1.5))
+
+    def _batches(self, edges, offset, template):
+        if template is None and hasattr(edges, '__getitem__') and hasattr(edges, '__len__'):
+            while offset < len(edges):
+                batch = edges[offset:offset + self.batch_size]
+                yield offset, batch
+                offset += len(batch)
+            return
+
+        position = offset
+        batch = template[0:0] if template is not None else []
+        for edge in itertools.islice(iter(edges), offset, None):
+            if template is not None:
+                batch.append(*edge)
+            else:
+                batch.append(edge)
+            if len(batch) >= self.batch_size:
+                yield position, batch
+                position += len(batch)
+                batch = template[0:0] if template is not None else []
+        if len(batch):
+            yield position, batch
+
+    def upload(self, edges, template=None, return_edges=False):
+        """
+        Posts the Edges
+
+        :param edges: List of Edges, :class:`openreview.api.EdgeBatch` or iterable over Edges. If template is present, iterable over (head, tail, weight) or (head, tail, weight, label) tuples
+        :type edges: list[Edge] or iterable
+        :param template: Empty EdgeBatch with the invitation, readers, writers and signatures of the Edges
+        :type template: openreview.api.EdgeBatch, optional
+        :param return_edges: If true, the posted Edges are returned instead of the number of Edges posted
+        :type return_edges: bool, optional
+
+        :return: Number of Edges posted in this call, or the list of posted Edges
+        :rtype: int or list[Edge]
+        """
+        offset = self.resume_offset()
+        if offset:
+            print(f'Resuming upload after {offset} acknowledged edges')
+
+        total = len(edges) if template is None and hasattr(edges, '__len__') else None
+        progress = tqdm(total=total - offset if total is not None else None, desc='Posting edges')
+        acknowledged = offset
+        completed = {}
+        posted_by_start = {}
+        in_flight = {}
+
+        def complete(future):
+            nonlocal acknowledged
+            start, size = in_flight.pop(future)
+            posted, latency = future.result()
+            self._adapt_batch_size(latency)
+            progress.update(size)
+            completed[start] = size
+            if return_edges:
+                posted_by_start[start] = posted
+            while acknowledged in completed:
+                acknowledged += completed.pop(acknowledged)
+            if self.checkpoint:
+                self._write_checkpoint(acknowledged)
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            try:
+                for start, batch in self._batches(edges, offset, template):
+                    while len(in_flight) >= self.max_in_flight:
+                        done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                        for future in done:
+                            complete(future)
+                    in_flight[executor.submit(self._post_batch, batch)] = (start, len(batch))
+                while in_flight:
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        complete(future)
+            except Exception:
+                ## Wait for the batches in flight so the checkpoint includes every acknowledged batch
+                for future in list(in_flight):
+                    future.cancel()
+                for future in list(in_flight):
+                    if future.cancelled():
+                        in_flight.pop(future)
+                        continue
+                    try:
+                        complete(future)
+                    except Exception:
+                        pass
+                progress.close()
+                raise
+
+        progress.close()
+        if self.checkpoint and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+        if return_edges:
+            return [edge for start in sorted(posted_by_start) for edge in posted_by_start[start]]
+        return acknowledged - offset
+
+def post_bulk_edges (client, edges, batch_size = 50000, **kwargs):
+    """
+    Posts a list of Edges in batches, one batch at a time. See :class:`tools.BulkEdgeUploader` for the options to post batches concurrently,
+    retry them and resume an interrupted upload.
+
+    :param client: Client used to post the Edges
+    :type client: Client
+    :param edges: List of Edges or :class:`openreview.api.EdgeBatch`
+    :type edges: list[Edge]
+    :param batch_size: Number of Edges per request
+    :type batch_size: int, optional
+    :param kwargs: Options passed to :class:`tools.BulkEdgeUploader`
+    :type kwargs: dict
+
+    :return: List of posted Edges
+    :rtype: list[Edge]
+    """
+    return BulkEdgeUploader(client, batch_size=batch_size, **kwargs).upload(edges, return_edges=True)
+
+def post_bulk_edges_stream(client, edges, template=None, batch_size=50000, **kwargs):
+    """
+    Posts the Edges yielded by edges in batches of batch_size, keeping only the batches in flight in memory.
+
+    If template is present, edges yields (head, tail, weight) or (head, tail, weight, label) tuples that are appended to a copy of the template,
+    otherwise edges yields Edge objects.
+
+    :param client: Client used to post the Edges
+    :type client: Client
+    :param edges: Iterable over Edges or over tuples
+    :type edges: iterable
+    :param template: Empty EdgeBatch with the invitation, readers, writers and signatures of the Edges
+    :type template: openreview.api.EdgeBatch, optional
+    :param batch_size: Number of Edges posted per request
+    :type batch_size: int, optional
+    :param kwargs: Options passed to :class:`tools.BulkEdgeUploader`
+    :type kwargs: dict
+
+    :return: Number of Edges posted
+    :rtype: int
+    """
+    return BulkEdgeUploader(client, batch_size=batch_size, **kwargs).upload(edges, template=template)
+
+def iter_score_rows(score_file=None, scores_stream=None):
+    """
+    Yields the rows of a CSV of scores one by one, skipping the empty lines.
+
+    :param score_file: Path of the CSV file
+    :type score_file: str, optional
+    :param scores_stream: Content of the CSV file
+    :type scores_stream: bytes, optional
+
+    :return: Iterator over the rows, each row is a list of str
+    :rtype: generator
+    """
+    if scores_stream is not None:
+        yield from (row for row in csv.reader(io.TextIOWrapper(io.BytesIO(scores_stream), encoding='utf-8')) if row)
+        return
+    with open(score_file) as file_handle:
+        yield from (row for row in csv.reader(file_handle) if row)
+
+def hash_rows(rows):
+    """
+    Returns a hash of the rows, rows with the same values in the same order have the same hash.
+
+    :param rows: Iterable over lists or tuples of values that can be serialized as JSON
+    :type rows: iterable
+
+    :return: Hex SHA-1 digest of the rows
+    :rtype: str
+    """
+    digest = hashlib.sha1()
+    for row in rows:
+        digest.update(json.dumps(list(row), default=str).encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+def get_row_score(row):
+    """
+    Returns the score of a row of a CSV of scores rounded to 4 decimals, negative scores are 0
+
+    :param row: Row with the head, the tail and the score
+    :type row: list
+
+    :return: The score, or None if the row has no numeric score
+    :rtype: float
+    """
+    try:
+        return max(round(float(row[2]), 4), 0)
+    except (IndexError, TypeError, ValueError):
+        return None
+
+class ScoreRows(object):
+    """
+    Rows of a CSV of scores that can be read more than once, each iteration reads the rows from the start with :func:`tools.iter_score_rows`.
+
+    :param score_file: Path of the CSV file
+    :type score_file: str, optional
+    :param scores_stream: Content of the CSV file
+    :type scores_stream: bytes, optional
+    :param rows: List of [head, tail, score] rows
+    :type rows: list[list], optional
+    """
+    def __init__(self, score_file=None, scores_stream=None, rows=None):
+        self.score_file = score_file
+        self.scores_stream = scores_stream
+        self.rows = rows
+
+    def __iter__(self):
+        if self.rows is not None:
+            return (row for row in self.rows if row)
+        return iter_score_rows(score_file=self.score_file, scores_stream=self.scores_stream)
+
+    @property
+    def fingerprint(self):
+        """
+        Identifies the input, a file is identified by its path, size and modification time and the other inputs by the hash of their content
+
+        :rtype: str
+        """
+        if self.rows is not None:
+            return hash_rows(self)
+        if self.scores_stream is not None:
+            return hashlib.sha1(self.scores_stream).hexdigest()
+        stat = os.stat(self.score_file)
+        return f'{os.path.abspath(self.score_file)}:{stat.st_size}:{stat.st_mtime_ns}'
 
 def overwrite_pdf(client, note_id, file_path):
     """
@@ -1676,7 +3041,7 @@ def get_own_reviews(client):
     client_v2 = openreview.api.OpenReviewClient(baseurl=baseurl_v2, token=client.token)
 
     # Get all the reviews from v1
-    notes_v1 = client_v1.get_all_notes(tauthor=True)
+    notes_v1 = iterget_notes(client_v1, tauthor=True)
 
     submissions_and_official_reviews = []
 
@@ -1698,7 +3063,7 @@ def get_own_reviews(client):
     if profile_id == 'Guest':
         notes_v2 = []
     else:
-        notes_v2 = client_v2.get_all_notes(signature=profile_id, transitive_members=True)
+        notes_v2 = client_v2.iter_all_notes(signature=profile_id, transitive_members=True, prefetch=True)
 
     # TMLR was created before the invitation names were added to the
     # group content, so we need to hardcode it
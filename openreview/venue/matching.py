@@ -1,8 +1,9 @@
-import csv
 import datetime
 import os
+import re
 import openreview
 from openreview.api import Edge
+from openreview.api import EdgeBatch
 from openreview.api import Invitation
 from tqdm import tqdm
 import time
@@ -14,7 +15,7 @@ from functools import reduce
 
 class Matching(object):
 
-    def __init__(self, venue, match_group, alternate_matching_group=None, submission_content=None):
+    def __init__(self, venue, match_group, alternate_matching_group=None, submission_content=None, checkpoint_dir=None):
         self.venue = venue
         self.client = venue.client
         self.match_group = match_group
@@ -41,6 +42,8 @@ class Matching(object):
         self.sac_profile_info = None #expects a policy, for example: openreview.tools.get_sac_profile_info
         self.sac_n_years = None
         self.submission_content = submission_content
+        self.checkpoint_dir = checkpoint_dir #if present, bulk edge uploads write a checkpoint there and resume after an interruption
+        self.author_info_cache = {} #conflict info of the submission authors by conflict policy, see _get_authors_info
 
     def _get_submission_content_query(self):
         if not self.submission_content:
@@ -72,6 +75,21 @@ class Matching(object):
     def _get_edge_invitation_id(self, edge_name):
         return self.venue.get_invitation_id(edge_name, prefix=self.match_group.id)
 
+    def _post_edges(self, invitation_id, edges, template=None, replace=True, scores=None):
+        checkpoint = None
+        checkpoint_key = None
+        if self.checkpoint_dir:
+            checkpoint = os.path.join(self.checkpoint_dir, re.sub(r'[^\w.-]', '_', invitation_id) + '.checkpoint')
+            ## A checkpoint of an upload of other edges is ignored, edges streamed from scores are identified by the fingerprint of the scores
+            fingerprint = scores.fingerprint if scores is not None else tools.hash_rows((edge.head, edge.tail, edge.label, edge.weight) for edge in edges)
+            checkpoint_key = f'{invitation_id}:{fingerprint}'
+        uploader = tools.BulkEdgeUploader(self.client, max_in_flight=4, check_applied=True, checkpoint=checkpoint, checkpoint_key=checkpoint_key)
+        ## Keep the edges posted by an interrupted upload
+        if replace and not uploader.resume_offset():
+            self.client.delete_edges(invitation_id, wait_to_finish=True)
+            uploader.cleared = True
+        return uploader.upload(edges, template=template)
+
     def _get_edge_readers(self, tail):
         readers = [self.venue.venue_id]
         if self.should_read_by_area_chair:
@@ -307,24 +325,50 @@ class Matching(object):
         invitation = self.venue.invitation_builder.save_invitation(invitation, replacement=True)
         return invitation
 
-    def _build_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years):
+    def _build_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years, workers=None):
         if self.alternate_matching_group:
             return
-        return self._build_note_conflicts(submissions, user_profiles, get_profile_info, compute_conflicts_n_years)
+        return self._build_note_conflicts(submissions, user_profiles, get_profile_info, compute_conflicts_n_years, workers)
 
-    def _build_note_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years):
-        invitation = self._create_edge_invitation(self.venue.get_conflict_score_id(self.match_group.id))
-        invitation_id = invitation.id
-        # Get profile info from the match group
+    def _get_authors_info(self, submissions, get_profile_info, compute_conflicts_n_years):
+        """
+        Returns the conflict info of the authors of each submission. The info of the authors is kept in the Matching, so
+        the authors are only loaded once when the conflicts are computed several times, for example by :meth:`append_note_conflicts`.
+        """
         info_function = tools.info_function_builder(get_profile_info)
-        user_profiles_info = [info_function(p, compute_conflicts_n_years) for p in user_profiles]
-        # Get profile info from all the authors
-        all_authorids = []
+        author_info_by_id = self.author_info_cache.setdefault((get_profile_info, compute_conflicts_n_years), {})
+
+        # Get profile info from the authors that are not in the cache
+        missing_authorids = set()
         for submission in submissions:
+            missing_authorids.update(authorid for authorid in submission.content['authorids']['value'] if authorid not in author_info_by_id)
+
+        if missing_authorids:
+            author_profile_by_id = tools.get_profiles(self.client, list(missing_authorids), with_publications=True, with_relations=True, as_dict=True)
+            for authorid in missing_authorids:
+                author_profile = author_profile_by_id.get(authorid)
+                author_info_by_id[authorid] = info_function(author_profile, compute_conflicts_n_years) if author_profile else None
+
+        authors_info_list = []
+        for submission in submissions:
+            # Get author profiles
             authorids = submission.content['authorids']['value']
-            all_authorids = all_authorids + authorids
 
-        author_profile_by_id = tools.get_profiles(self.client, list(set(all_authorids)), with_publications=True, with_relations=True, as_dict=True)
+            # Extract domains from each authorprofile
+            authors_info = []
+            for authorid in authorids:
+                if author_info_by_id[authorid]:
+                    authors_info.append(author_info_by_id[authorid])
+                else:
+                    print(f'Profile not found: {authorid}')
+            authors_info_list.append(authors_info)
+        return authors_info_list
+
+    def _search_note_conflicts(self, user_profiles_info, authors_info_list, get_profile_info, compute_conflicts_n_years, workers=None):
+        """
+        Returns the positions of the users in conflict with the authors of each submission, for AC matching the conflicts of the assigned SACs and PCs are included.
+        """
+        info_function = tools.info_function_builder(get_profile_info)
 
         ## for AC conflicts, check SAC conflicts too
         sac_user_info_by_id = {}
@@ -343,84 +387,60 @@ class Matching(object):
                 pc_user_profiles = openreview.tools.get_profiles(self.client, self.client.get_group(self.venue.get_program_chairs_id()).members, with_publications=True, with_relations=True)   
                 pc_user_info_by_id = { p.id: info_function(p, compute_conflicts_n_years) for p in pc_user_profiles }
 
-        edges = []
-
-        for submission in tqdm(submissions, total=len(submissions), desc='_build_conflicts'):
-            # Get author profiles
-            authorids = submission.content['authorids']['value']
-
-            # Extract domains from each authorprofile
-            author_ids = set()
-            author_domains = set()
-            author_emails = set()
-            author_relations = set()
-            author_publications = set()
-            for authorid in authorids:
-                if author_profile_by_id.get(authorid):
-                    author_info = info_function(author_profile_by_id[authorid], compute_conflicts_n_years)
-                    author_ids.add(author_info['id'])
-                    author_domains.update(author_info['domains'])
-                    author_emails.update(author_info['emails'])
-                    author_relations.update(author_info['relations'])
-                    author_publications.update(author_info['publications'])
-                else:
-                    print(f'Profile not found: {authorid}')
+        # Compute conflicts for each user and all the paper authors
+        positions_by_submission = tools.search_conflicts(user_profiles_info, authors_info_list, workers=workers)
 
-            # Compute conflicts for each user and all the paper authors
-            for user_info in user_profiles_info:
-                conflicts = set()
-                conflicts.update(author_domains.intersection(user_info['domains']))
-                conflicts.update(author_relations.intersection(user_info['emails'])) ## keep this until all the relations are updated
-                conflicts.update(author_relations.intersection([user_info['id']]))
-                conflicts.update(author_emails.intersection(user_info['relations'])) ## keep this until all the relations are updated
-                conflicts.update(author_ids.intersection(user_info['relations']))
-                conflicts.update(author_emails.intersection(user_info['emails']))
-                conflicts.update(author_publications.intersection(user_info['publications']))
-
-                ## Transfer SAC conflicts
-                if len(conflicts) == 0 and self.is_area_chair:
-                    assigned_sacs = sacs_by_ac.get(user_info['id'], [])
-                    for sac in assigned_sacs:
-                        sac_info = sac_user_info_by_id.get(sac)
-                        if sac_info:
-                            conflicts.update(author_domains.intersection(sac_info['domains']))
-                            conflicts.update(author_relations.intersection(sac_info['emails'])) ## keep this until all the relations are updated
-                            conflicts.update(author_relations.intersection([sac_info['id']]))
-                            conflicts.update(author_emails.intersection(sac_info['relations'])) ## keep this until all the relations are updated
-                            conflicts.update(author_ids.intersection(sac_info['relations']))
-                            conflicts.update(author_emails.intersection(sac_info['emails']))
-                            conflicts.update(author_publications.intersection(sac_info['publications']))
-
-                ## Transfer PC conflicts
-                if len(conflicts) == 0 and self.is_area_chair and pcs_by_sac:
-                    assigned_pcs = [pcs_by_sac.get(sac) for sac in assigned_sacs]
-                    for pc in assigned_pcs:
-                        pc_info = pc_user_info_by_id.get(pc)
-                        if pc_info:
-                            conflicts.update(author_domains.intersection(pc_info['domains']))
-                            conflicts.update(author_relations.intersection(pc_info['emails'])) ## keep this until all the relations are updated
-                            conflicts.update(author_relations.intersection([pc_info['id']]))
-                            conflicts.update(author_emails.intersection(pc_info['relations'])) ## keep this until all the relations are updated
-                            conflicts.update(author_ids.intersection(pc_info['relations']))
-                            conflicts.update(author_emails.intersection(pc_info['emails']))
-                            conflicts.update(author_publications.intersection(pc_info['publications']))
+        ## Transfer SAC and PC conflicts to the assigned ACs
+        if self.is_area_chair:
+            position_by_id = { user_info['id']: position for position, user_info in enumerate(user_profiles_info) }
+            acs_by_sac = {}
+            acs_by_pc = {}
+            for ac, sacs in sacs_by_ac.items():
+                for sac in sacs:
+                    acs_by_sac.setdefault(sac, []).append(ac)
+                    if sac in pcs_by_sac:
+                        acs_by_pc.setdefault(pcs_by_sac[sac], []).append(ac)
+            sac_index = tools.ConflictIndex(sac_user_info_by_id.values())
+            pc_index = tools.ConflictIndex(pc_user_info_by_id.values() if pcs_by_sac else [])
+
+            for submission_index, authors_info in enumerate(authors_info_list):
+                transferred = set()
+                for sac_info in sac_index.find(authors_info):
+                    transferred.update(acs_by_sac.get(sac_info['id'], []))
+                for pc_info in pc_index.find(authors_info):
+                    transferred.update(acs_by_pc.get(pc_info['id'], []))
+                transferred_positions = [position_by_id[ac] for ac in transferred if ac in position_by_id]
+                if transferred_positions:
+                    positions_by_submission[submission_index] = sorted(set(positions_by_submission[submission_index]).union(transferred_positions))
+
+        return positions_by_submission
+
+    def _get_conflict_edges(self, invitation_id, submissions, user_profiles_info, positions_by_submission):
+        edges = EdgeBatch(
+            invitation=invitation_id,
+            readers=self._get_edge_readers(tail=EdgeBatch.TAIL),
+            writers=[self.venue.id],
+            signatures=[self.venue.id]
+        )
+        for submission, positions in zip(submissions, positions_by_submission):
+            for position in positions:
+                edges.append(submission.id, user_profiles_info[position]['id'], weight=-1, label='Conflict')
+        return edges
 
-                if conflicts:
-                    edges.append(Edge(
-                        invitation=invitation_id,
-                        head=submission.id,
-                        tail=user_info['id'],
-                        weight=-1,
-                        label='Conflict',
-                        readers=self._get_edge_readers(tail=user_info['id']),
-                        writers=[self.venue.id],
-                        signatures=[self.venue.id]
-                    ))
+    def _build_note_conflicts(self, submissions, user_profiles, get_profile_info, compute_conflicts_n_years, workers=None):
+        invitation = self._create_edge_invitation(self.venue.get_conflict_score_id(self.match_group.id))
+        invitation_id = invitation.id
+        # Get profile info from the match group
+        info_function = tools.info_function_builder(get_profile_info)
+        user_profiles_info = [info_function(p, compute_conflicts_n_years) for p in user_profiles]
+        # Get profile info from all the authors
+        authors_info_list = self._get_authors_info(submissions, get_profile_info, compute_conflicts_n_years)
 
-        ## Delete previous conflicts
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
+        positions_by_submission = self._search_note_conflicts(user_profiles_info, authors_info_list, get_profile_info, compute_conflicts_n_years, workers)
+        edges = self._get_conflict_edges(invitation_id, submissions, user_profiles_info, positions_by_submission)
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
+        ## Replace previous conflicts
+        self._post_edges(invitation_id, edges)
 
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id)
@@ -428,6 +448,54 @@ class Matching(object):
             raise openreview.OpenReviewException('Failed during bulk post of Conflict edges! Scores found: {0}, Edges posted: {1}'.format(len(edges), edges_posted))
         return invitation
 
+    def append_note_conflicts(self, profile_ids, compute_conflicts=True, compute_conflicts_n_years=None, workers=None):
+        """
+        Computes the conflicts of users added to the match group after the matching was set up and replaces their Conflict edges, the edges of the other users are not changed.
+
+        The authors of all the submissions are loaded once for all the users, and only the first time when the same Matching is used again.
+
+        :param profile_ids: Profile ids of the new users
+        :type profile_ids: list[str] or str
+        :param compute_conflicts: Conflict policy, True or 'NeurIPS'
+        :type compute_conflicts: bool or str, optional
+        :param compute_conflicts_n_years: Number of years of history and publications used to compute the conflicts
+        :type compute_conflicts_n_years: int, optional
+
+        :return: The Conflict invitation
+        :rtype: Invitation
+        """
+        if isinstance(profile_ids, str):
+            profile_ids = [profile_ids]
+        get_profile_info = openreview.tools.get_neurips_profile_info if compute_conflicts == 'NeurIPS' else openreview.tools.get_profile_info
+        info_function = tools.info_function_builder(get_profile_info)
+
+        user_profile_by_id = tools.get_profiles(self.client, profile_ids, with_publications=True, with_relations=True, as_dict=True)
+        missing_profiles = [profile_id for profile_id in profile_ids if not user_profile_by_id.get(profile_id) or '~' not in user_profile_by_id[profile_id].id]
+        if missing_profiles:
+            raise openreview.OpenReviewException(f'No profile exists: {", ".join(missing_profiles)}')
+        user_profiles = list({ profile.id: profile for profile in user_profile_by_id.values() }.values())
+        user_profiles_info = [info_function(p, compute_conflicts_n_years) for p in user_profiles]
+
+        invitation = tools.get_invitation(self.client, self.venue.get_conflict_score_id(self.match_group.id))
+        if not invitation:
+            raise openreview.OpenReviewException('Failed to retrieve conflict invitation')
+
+        submissions = self._get_submissions()
+        authors_info_list = self._get_authors_info(submissions, get_profile_info, compute_conflicts_n_years)
+        positions_by_submission = self._search_note_conflicts(user_profiles_info, authors_info_list, get_profile_info, compute_conflicts_n_years, workers)
+        edges = self._get_conflict_edges(invitation.id, submissions, user_profiles_info, positions_by_submission)
+
+        ## Replace the previous conflicts of the new users only
+        for user_info in user_profiles_info:
+            self.client.delete_edges(invitation.id, tail=user_info['id'], wait_to_finish=True)
+        tools.post_bulk_edges(self.client, edges)
+
+        # Perform sanity check
+        edges_posted = sum(self.client.get_edges_count(invitation=invitation.id, tail=user_info['id']) for user_info in user_profiles_info)
+        if edges_posted < len(edges):
+            raise openreview.OpenReviewException('Failed during bulk post of Conflict edges! Conflicts found: {0}, Edges posted: {1}'.format(len(edges), edges_posted))
+        return invitation
+
     def _build_profile_conflicts(self, head_profiles, user_profiles, compute_conflicts_n_years):
         
         invitation = self._create_edge_invitation(self.venue.get_conflict_score_id(self.match_group.id))
@@ -460,10 +528,8 @@ class Matching(object):
                         signatures=[self.venue.id]
                     ))
 
-        ## Delete previous conflicts
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
-
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
+        ## Replace previous conflicts
+        self._post_edges(invitation_id, edges)
 
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id)
@@ -517,59 +583,62 @@ class Matching(object):
                     edges.append(edge)
 
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
+        self._post_edges(invitation_id, edges, replace=False)
 
         return invitation
 
     def _build_scores_from_file(self, score_invitation_id, score_file, submissions):
         if self.alternate_matching_group:
             return self._build_profile_scores(score_invitation_id, score_file=score_file)
-        scores = []
-        with open(score_file) as file_handle:
-            scores = [row for row in csv.reader(file_handle)]
-        return self._build_note_scores(score_invitation_id, scores, submissions)
+        return self._build_note_scores(score_invitation_id, openreview.tools.ScoreRows(score_file=score_file), submissions)
 
     def _build_scores_from_stream(self, score_invitation_id, scores_stream, submissions):
-        scores = [input_line.split(',') for input_line in scores_stream.decode().strip().split('\n')]
+        scores = openreview.tools.ScoreRows(scores_stream=scores_stream)
         if self.alternate_matching_group:
             return self._build_profile_scores(score_invitation_id, scores=scores)
         return self._build_note_scores(score_invitation_id, scores, submissions)
 
+    def _get_score_edges_template(self, invitation_id):
+        return EdgeBatch(
+            invitation=invitation_id,
+            readers=self._get_edge_readers(tail=EdgeBatch.TAIL),
+            # nonreaders=[self.venue.get_authors_id(number=paper_number)],
+            writers=[self.venue.id],
+            signatures=[self.venue.id]
+        )
+
     def _build_profile_scores(self, score_invitation_id, score_file=None, scores=None):
 
         invitation = self._create_edge_invitation(score_invitation_id)
         invitation_id = invitation.id
-        edges = []
 
         # Validate and select scores
         if not scores and not score_file:
             raise openreview.OpenReviewException('No profile scores provided')
         if scores:
-            score_handle = scores
+            score_handle = scores if isinstance(scores, openreview.tools.ScoreRows) else openreview.tools.ScoreRows(rows=scores)
         elif score_file:
-            score_handle = csv.reader(open(score_file))
-
-        for row in tqdm(score_handle, desc='_build_scores'):
-
-            score = str(max(round(float(row[2]), 4), 0))
-            edges.append(Edge(
-                    invitation=invitation_id,
-                    head=row[0],
-                    tail=row[1],
-                    weight=float(score),
-                    readers=self._get_edge_readers(tail=row[1]),
-                    writers=[self.venue.id],
-                    signatures=[self.venue.id]
-                ))
+            score_handle = openreview.tools.ScoreRows(score_file=score_file)
+
+        invalid_rows = []
+        def score_edges():
+            for row in tqdm(score_handle, desc='_build_scores'):
+                score = openreview.tools.get_row_score(row)
+                if score is None:
+                    invalid_rows.append(row)
+                    continue
+                yield row[0], row[1], score
 
-        ## Delete previous scores
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
+        ## Replace previous scores, the new scores are posted while the rows are read
+        edges_count = self._post_edges(invitation_id, score_edges(), template=self._get_score_edges_template(invitation_id), scores=score_handle)
+
+        if invalid_rows:
+            print('invalid score rows', invalid_rows)
 
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, len(edges), edges_posted))
+        if edges_posted < edges_count:
+            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, edges_count, edges_posted))
         return invitation
 
     def _build_note_scores(self, score_invitation_id, scores, submissions):
@@ -578,39 +647,36 @@ class Matching(object):
         invitation_id = invitation.id
 
         submissions_per_id = {note.id: note.number for note in submissions}
+        if not isinstance(scores, openreview.tools.ScoreRows):
+            scores = openreview.tools.ScoreRows(rows=scores)
 
-        edges = []
         deleted_papers = set()
-        for score_line in tqdm(scores, desc='_build_scores'):
-            if score_line:
-                paper_note_id = score_line[0]
-                paper_number = submissions_per_id.get(paper_note_id)
-                if paper_number:
-                    profile_id = score_line[1]
-                    score = str(max(round(float(score_line[2]), 4), 0))
-                    edges.append(openreview.Edge(
-                        invitation=invitation_id,
-                        head=paper_note_id,
-                        tail=profile_id,
-                        weight=float(score),
-                        readers=self._get_edge_readers(tail=profile_id),
-                        # nonreaders=[self.venue.get_authors_id(number=paper_number)],
-                        writers=[self.venue.id],
-                        signatures=[self.venue.id]
-                    ))
-                else:
-                    deleted_papers.add(paper_note_id)
+        invalid_rows = []
+        def score_edges():
+            for score_line in tqdm(scores, desc='_build_scores'):
+                if score_line:
+                    paper_note_id = score_line[0]
+                    paper_number = submissions_per_id.get(paper_note_id)
+                    if paper_number:
+                        score = openreview.tools.get_row_score(score_line)
+                        if score is None:
+                            invalid_rows.append(score_line)
+                            continue
+                        yield paper_note_id, score_line[1], score
+                    else:
+                        deleted_papers.add(paper_note_id)
+
+        ## Replace previous scores, the new scores are posted while the rows are read
+        edges_count = self._post_edges(invitation_id, score_edges(), template=self._get_score_edges_template(invitation_id), scores=scores)
 
         print('deleted papers', deleted_papers)
+        if invalid_rows:
+            print('invalid score rows', invalid_rows)
 
-        ## Delete previous scores
-        self.client.delete_edges(invitation_id, wait_to_finish=True)
-
-        openreview.tools.post_bulk_edges(client=self.client, edges=edges)
         # Perform sanity check
         edges_posted = self.client.get_edges_count(invitation=invitation_id)
-        if edges_posted < len(edges):
-            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Input file:{1}, Scores found: {2}, Edges posted: {3}'.format(score_invitation_id, score_file, len(edges), edges_posted))
+        if edges_posted < edges_count:
+            raise openreview.OpenReviewException('Failed during bulk post of {0} edges! Scores found: {1}, Edges posted: {2}'.format(score_invitation_id, edges_count, edges_posted))
         return invitation
 
     def _compute_scores(self, score_invitation_id, submissions, model='specter+mfr'):
@@ -977,7 +1043,7 @@ class Matching(object):
 
         invitation = venue.invitation_builder.save_invitation(config_inv)
 
-    def setup(self, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None):
+    def setup(self, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, workers=None):
 
         venue = self.venue
         client = self.client
@@ -1039,7 +1105,7 @@ class Matching(object):
             )
 
         if compute_conflicts:
-            self._build_conflicts(submissions, user_profiles, openreview.tools.get_neurips_profile_info if compute_conflicts == 'NeurIPS' else openreview.tools.get_profile_info, compute_conflicts_n_years)
+            self._build_conflicts(submissions, user_profiles, openreview.tools.get_neurips_profile_info if compute_conflicts == 'NeurIPS' else openreview.tools.get_profile_info, compute_conflicts_n_years, workers)
 
         if venue.automatic_reviewer_assignment:
             invitation = self._create_edge_invitation(venue.get_assignment_id(self.match_group.id))
@@ -1193,10 +1259,11 @@ class Matching(object):
         sac_assignment_edges =  { g['id']['head']: g['values'] for g in client.get_grouped_edges(invitation=venue.get_assignment_id(self.senior_area_chairs_id, deployed=True),
             groupby='head', select=None)} if not venue.sac_paper_assignments else {}
         reviews = []
+        assignment_invitation_id = venue.get_assignment_id(self.match_group.id, deployed=True)
+
+        ## Only the JSON of the proposed assignments is kept, the deployed edges are built while they are posted
         proposed_assignment_edges =  { g['id']['head']: g['values'] for g in client.get_grouped_edges(invitation=venue.get_assignment_id(self.match_group.id),
             label=assignment_title, groupby='head', select=None)}
-        assignment_invitation_id = venue.get_assignment_id(self.match_group.id, deployed=True)
-        current_assignment_edges =  { g['id']['head']: g['values'] for g in client.get_grouped_edges(invitation=assignment_invitation_id, groupby='head', select=None)}
 
         if not self.is_senior_area_chair:
             reviews = client.get_notes(invitation=venue.get_invitation_id(review_name, number='.*'), limit=1)
@@ -1204,26 +1271,26 @@ class Matching(object):
         if overwrite:
             if reviews:
                 raise openreview.OpenReviewException('Can not overwrite assignments when there are reviews posted.')
+            current_assignment_tails = {}
+            for current_edge in client.iter_all_edges(invitation=assignment_invitation_id, prefetch=True):
+                current_assignment_tails.setdefault(current_edge.head, []).append(current_edge.tail)
             ## Remove the members from the groups based on the current assignments
             for paper in tqdm(papers, total=len(papers)):
-                if paper.id in current_assignment_edges:
+                if paper.id in current_assignment_tails:
                     paper_committee_id = venue.get_committee_id(name=reviewer_name, number=paper.number)
-                    current_edges=current_assignment_edges[paper.id]
-                    for current_edge in current_edges:
-                        client.remove_members_from_group(paper_committee_id, current_edge['tail'])
+                    for current_tail in current_assignment_tails[paper.id]:
+                        client.remove_members_from_group(paper_committee_id, current_tail)
                 else:
                     print('assignment not found', paper.id)
             ## Delete current assignment edges with a ddate in case we need to do rollback
             client.delete_edges(invitation=assignment_invitation_id, wait_to_finish=True, soft_delete=True)
 
         def process_paper_assignments(paper):
-            paper_assignment_edges = []
             if paper.id in proposed_assignment_edges:
                 paper_committee_id = venue.get_committee_id(name=reviewer_name, number=paper.number)
-                proposed_edges=proposed_assignment_edges[paper.id]
                 assigned_users = []
-                for proposed_edge in proposed_edges:
-                    assigned_user = proposed_edge['tail']
+                for assignment_edge in proposed_assignment_edges[paper.id]:
+                    assigned_user = assignment_edge['tail']
                     if self.is_area_chair and sac_assignment_edges:
                         sac_assignments = sac_assignment_edges.get(assigned_user, [])
                         for sac_assignment in sac_assignments:
@@ -1239,27 +1306,33 @@ class Matching(object):
                                     members = [assigned_sac]
                                 )
                             )
-                    paper_assignment_edges.append(Edge(
-                        invitation=assignment_invitation_id,
-                        head=paper.id,
-                        tail=assigned_user,
-                        readers=proposed_edge['readers'],
-                        nonreaders=proposed_edge.get('nonreaders'),
-                        writers=proposed_edge['writers'],
-                        signatures=proposed_edge['signatures'],
-                        weight=proposed_edge.get('weight')
-                    ))
                     assigned_users.append(assigned_user)
                 client.add_members_to_group(paper_committee_id, assigned_users)
-                return paper_assignment_edges
+                return [paper.id]
             else:
                 print('assignment not found', paper.id)
                 return []
 
-        assignment_edges = reduce(concat,tools.concurrent_requests(process_paper_assignments, papers))
+        assigned_papers = reduce(concat, tools.concurrent_requests(process_paper_assignments, papers), [])
+
+        def assignment_edges():
+            for head in assigned_papers:
+                for assignment_edge in proposed_assignment_edges[head]:
+                    yield Edge(
+                        invitation=assignment_invitation_id,
+                        head=head,
+                        tail=assignment_edge['tail'],
+                        readers=assignment_edge['readers'],
+                        nonreaders=assignment_edge.get('nonreaders'),
+                        writers=assignment_edge['writers'],
+                        signatures=assignment_edge['signatures'],
+                        weight=assignment_edge.get('weight')
+                    )
 
-        print('Posting assignment edges', len(assignment_edges))
-        openreview.tools.post_bulk_edges(client=client, edges=assignment_edges)
+        print('Posting assignment edges', sum(len(proposed_assignment_edges[head]) for head in assigned_papers))
+        ## The proposed assignments identify the checkpoint of the upload, they are only read if there is a checkpoint
+        proposed_rows = tools.ScoreRows(rows=((head, assignment_edge['tail'], assignment_edge.get('weight')) for head in assigned_papers for assignment_edge in proposed_assignment_edges[head]))
+        self._post_edges(assignment_invitation_id, assignment_edges(), replace=False, scores=proposed_rows)
 
         # Remove reviewers_proposed_assignment_title if deploying reviewer assignments
         if self.is_reviewer:
@@ -1300,7 +1373,7 @@ class Matching(object):
                 ))
 
         print('Posting assignments edges', len(assignment_edges))
-        openreview.tools.post_bulk_edges(client=client, edges=assignment_edges)
+        self._post_edges(assignment_invitation_id, assignment_edges, replace=False)
 
     def deploy(self, assignment_title, overwrite=False, enable_reviewer_reassignment=False):
 
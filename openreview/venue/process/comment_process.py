@@ -1,6 +1,7 @@
 def process(client, edit, invitation):
 
-    domain = client.get_group(edit.domain)
+    context = openreview.tools.ProcessContext(client, edit.domain)
+    domain = context.domain
     venue_id = domain.id
     short_name = domain.get_content_value('subtitle')
     contact = domain.get_content_value('contact')
@@ -13,6 +14,7 @@ def process(client, edit, invitation):
     submission = client.get_note(edit.note.forum)
     comment = client.get_note(edit.note.id)
     paper_group_id=f'{venue_id}/{submission_name}{submission.number}'
+    context.prefetch_groups(f'{paper_group_id}/')
 
     ### TODO: Fix this, we should notify the use when the review is updated
     if comment.tcdate != comment.tmdate:
@@ -25,6 +27,8 @@ def process(client, edit, invitation):
     pretty_signature = openreview.tools.pretty_id(signature)
     pretty_signature = 'An author' if pretty_signature == 'Authors' else pretty_signature
 
+    messages = client.message_batch()
+
     content = f'''
     
 Paper number: {submission.number}
@@ -37,7 +41,7 @@ To view the comment, click here: https://openreview.net/forum?id={submission.id}
 
     program_chairs_id = domain.get_content_value('program_chairs_id')
     if domain.get_content_value('comment_email_pcs') and (program_chairs_id in comment.readers or 'everyone' in comment.readers):
-        client.post_message(
+        messages.add(
             recipients=[program_chairs_id],
             ignoreRecipients = ignore_groups,
             subject=f'''[{short_name}] {pretty_signature} commented on a paper. Paper Number: {submission.number}, Paper Title: "{submission.content['title']['value']}"''',
@@ -46,10 +50,10 @@ To view the comment, click here: https://openreview.net/forum?id={submission.id}
 
     senior_area_chairs_name = domain.get_content_value('senior_area_chairs_name')
     paper_senior_area_chairs_id = f'{paper_group_id}/{senior_area_chairs_name}'
-    paper_senior_area_chairs_group = openreview.tools.get_group(client, paper_senior_area_chairs_id)
+    paper_senior_area_chairs_group = context.get_group(paper_senior_area_chairs_id)
     email_SAC = len(comment.readers)==3 and paper_senior_area_chairs_id in comment.readers and program_chairs_id in comment.readers
     if paper_senior_area_chairs_group and senior_area_chairs_name and email_SAC:
-        client.post_message(
+        messages.add(
             recipients=[paper_senior_area_chairs_id],
             ignoreRecipients = ignore_groups,
             subject=f'''[{short_name}] {pretty_signature} commented on a paper in your area. Paper Number: {submission.number}, Paper Title: "{submission.content['title']['value']}"''',
@@ -59,9 +63,9 @@ To view the comment, click here: https://openreview.net/forum?id={submission.id}
 
     area_chairs_name = domain.get_content_value('area_chairs_name')
     paper_area_chairs_id = f'{paper_group_id}/{area_chairs_name}'
-    paper_area_chairs_group = openreview.tools.get_group(client, paper_area_chairs_id)
+    paper_area_chairs_group = context.get_group(paper_area_chairs_id)
     if paper_area_chairs_group and area_chairs_name and (paper_area_chairs_id in comment.readers or 'everyone' in comment.readers):
-        client.post_message(
+        messages.add(
             recipients=[paper_area_chairs_id],
             ignoreRecipients=ignore_groups,
             subject=f'''[{short_name}] {pretty_signature} commented on a paper in your area. Paper Number: {submission.number}, Paper Title: "{submission.content['title']['value']}"''',
@@ -70,11 +74,11 @@ To view the comment, click here: https://openreview.net/forum?id={submission.id}
         )
 
     paper_reviewers_id = f'{paper_group_id}/{reviewers_name}'
-    paper_reviewers_group = openreview.tools.get_group(client, paper_reviewers_id)
+    paper_reviewers_group = context.get_group(paper_reviewers_id)
     paper_reviewers_submitted_id = f'{paper_reviewers_id}/{reviewers_submitted_name}'
-    paper_reviewers_submitted_group = openreview.tools.get_group(client, paper_reviewers_submitted_id)
+    paper_reviewers_submitted_group = context.get_group(paper_reviewers_submitted_id)
     if paper_reviewers_group and ('everyone' in comment.readers or paper_reviewers_id in comment.readers):
-        client.post_message(
+        messages.add(
             recipients=[paper_reviewers_id],
             ignoreRecipients=ignore_groups,
             subject=f'''[{short_name}] {pretty_signature} commented on a paper you are reviewing. Paper Number: {submission.number}, Paper Title: "{submission.content['title']['value']}"''',
@@ -82,7 +86,7 @@ To view the comment, click here: https://openreview.net/forum?id={submission.id}
             replyTo=contact
         )
     elif paper_reviewers_submitted_group and paper_reviewers_submitted_id in comment.readers:
-        client.post_message(
+        messages.add(
             recipients=[paper_reviewers_submitted_id],
             ignoreRecipients=ignore_groups,
             subject=f'''[{short_name}] {pretty_signature} commented on a paper you are reviewing. Paper Number: {submission.number}, Paper Title: "{submission.content['title']['value']}"''',
@@ -91,9 +95,9 @@ To view the comment, click here: https://openreview.net/forum?id={submission.id}
         )
     else:
         anon_reviewers = [reader for reader in comment.readers if reader.find(reviewers_anon_name) >=0]
-        anon_reviewers_group = client.get_groups(prefix=f'{paper_group_id}/{reviewers_anon_name}.*')
+        anon_reviewers_group = context.get_groups(f'{paper_group_id}/{reviewers_anon_name}')
         if anon_reviewers_group and anon_reviewers:
-            client.post_message(
+            messages.add(
                 recipients=anon_reviewers,
                 ignoreRecipients=ignore_groups,
                 subject=f'''[{short_name}] {pretty_signature} commented on a paper you are reviewing. Paper Number: {submission.number}, Paper Title: "{submission.content['title']['value']}"''',
@@ -102,7 +106,7 @@ To view the comment, click here: https://openreview.net/forum?id={submission.id}
             )
 
     #send email to author of comment
-    client.post_message(
+    messages.add(
         recipients=[edit.tauthor] if edit.tauthor != 'OpenReview.net' else [],
         subject=f'''[{short_name}] Your comment was received on Paper Number: {submission.number}, Paper Title: "{submission.content['title']['value']}"''',
         message=f'''Your comment was received on a submission to {short_name}.{content}''',
@@ -112,10 +116,12 @@ To view the comment, click here: https://openreview.net/forum?id={submission.id}
     #send email to paper authors
     paper_authors_id = f'{paper_group_id}/{authors_name}'
     if paper_authors_id in comment.readers or 'everyone' in comment.readers:
-        client.post_message(
+        messages.add(
             recipients=submission.content['authorids']['value'],
             ignoreRecipients=ignore_groups,
             subject=f'''[{short_name}] {pretty_signature} commented on your submission. Paper Number: {submission.number}, Paper Title: "{submission.content['title']['value']}"''',
             message=f'''{pretty_signature} commented on your submission.{content}''',
             replyTo=contact
         )
+
+    messages.send()
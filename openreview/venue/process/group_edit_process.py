@@ -1,4 +1,4 @@
-def process(client, invitation):
+def process(client, invitation, dry_run=False):
 
     domain = client.get_group(invitation.domain)
     venue_id = domain.id
@@ -22,18 +22,13 @@ def process(client, invitation):
             children_notes = [s for s in source_submissions if s.content.get('flagged_for_ethics_review', {}).get('value', False)]
             return children_notes
 
-    def post_group_edit(submission):
-
-        client.post_group_edit(
-            invitation=invitation.id,
-            content={
-                'noteId': { 'value': submission.id },
-                'noteNumber': { 'value': submission.number },
-            },
-            group=openreview.api.Group()
-        )
-    
     ## Release the submissions to specified readers if venueid is still submission
     submissions = get_children_notes()
     print(f'update {len(submissions)} submissions')
-    openreview.tools.concurrent_requests(post_group_edit, submissions, desc='post_group_edit')    
\ No newline at end of file
+    contents = [{
+        'noteId': { 'value': submission.id },
+        'noteNumber': { 'value': submission.number },
+    } for submission in submissions]
+    diff = openreview.tools.EditTemplateDiff(client, invitation).apply(contents, dry_run=dry_run)
+    print(f"child groups created: {len(diff['create'])}, updated: {len(diff['update'])}, skipped: {len(diff['unchanged'])}")
+    return diff    
\ No newline at end of file
@@ -1,4 +1,4 @@
-def process(client, invitation):
+def process(client, invitation, dry_run=False):
 
     domain = client.get_group(invitation.domain)
     venue_id = domain.id
@@ -51,15 +51,16 @@ def process(client, invitation):
         print('reply_to', reply_to)
         print('source_submissions_query', source_submissions_query)
         if source == 'accepted_submissions':
-            source_submissions = client.get_all_notes(content={ 'venueid': venue_id }, sort='number:asc')
+            source_submissions = client.get_all_notes(content={ 'venueid': venue_id }, sort='number:asc', details='replies')
             if not source_submissions and decision_name:
-                under_review_submissions = client.get_all_notes(content={ 'venueid': submission_venue_id }, sort='number:asc', details='directReplies')
+                under_review_submissions = client.get_all_notes(content={ 'venueid': submission_venue_id }, sort='number:asc', details='directReplies,replies')
                 source_submissions = [s for s in under_review_submissions if len([r for r in s.details['directReplies'] if f'{venue_id}/{submission_name}{s.number}/-/{decision_name}' in r['invitations'] and 'Accept' in r['content'][decision_field_name]['value']]) > 0]
-            expire_existing_invitations()
+            if not dry_run:
+                expire_existing_invitations()
         else:
-            source_submissions = client.get_all_notes(content={ 'venueid': submission_venue_id }, sort='number:asc', details='directReplies')
+            source_submissions = client.get_all_notes(content={ 'venueid': submission_venue_id }, sort='number:asc', details='directReplies,replies')
             if not source_submissions:
-                source_submissions = client.get_all_notes(content={ 'venueid': ','.join([venue_id, rejected_venue_id]) }, sort='number:asc', details='directReplies')
+                source_submissions = client.get_all_notes(content={ 'venueid': ','.join([venue_id, rejected_venue_id]) }, sort='number:asc', details='directReplies,replies')
 
             if source == 'public_submissions':
                 source_submissions = [s for s in source_submissions if s.readers == ['everyone']]
@@ -78,11 +79,14 @@ def process(client, invitation):
         else:
             children_notes = source_submissions
 
-        return children_notes
-    
+        return children_notes, source_submissions
+
     def update_note_readers(submission, paper_invitation):
         ## Update readers of current notes
-        notes = client.get_notes(invitation=paper_invitation.id)
+        if replies_by_invitation is None:
+            notes = client.get_notes(invitation=paper_invitation.id)
+        else:
+            notes = replies_by_invitation.get(paper_invitation.id, [])
         invitation_readers = paper_invitation.edit['note'].get('readers', [])
 
         ## if invitation has param in readers, we ignore the update
@@ -131,7 +135,7 @@ def process(client, invitation):
                     note = updated_note
                 )
 
-    def post_invitation(note):
+    def get_edit_content(note):
 
         content = {
             'noteId': {
@@ -168,16 +172,32 @@ def process(client, invitation):
                     final_readers.append(f'{venue_id}/{submission_name}{note.number}/{ethics_reviewers_name}')
             content['noteReaders'] = { 'value': final_readers }
 
-        paper_invitation_edit = client.post_invitation_edit(invitations=invitation.id,
-            readers=[venue_id],
-            writers=[venue_id],
-            signatures=[venue_id],
-            content=content,
-            invitation=openreview.api.Invitation()
-        )
-        paper_invitation = client.get_invitation(paper_invitation_edit['invitation']['id'])
-        update_note_readers(note, paper_invitation)
-
-    notes = get_children_notes()
+        return content
+
+    def update_child_readers(entry):
+        note = notes[entry['position']]
+        if 'edit' not in entry:
+            update_note_readers(note, entry['child'])
+        elif 'edit' in entry['edit']['invitation']:
+            update_note_readers(note, openreview.api.Invitation.from_json(entry['edit']['invitation']))
+        else:
+            update_note_readers(note, client.get_invitation(entry['edit']['invitation']['id']))
+
+    notes, source_submissions = get_children_notes()
+
+    ## group the replies of the forums by invitation, so the readers of the replies are updated without requesting them per child invitation
+    replies_by_invitation = None
+    if all(s.details and 'replies' in s.details for s in source_submissions):
+        replies_by_invitation = {}
+        for s in source_submissions:
+            for reply in s.details['replies']:
+                for reply_invitation in reply['invitations']:
+                    replies_by_invitation.setdefault(reply_invitation, []).append(openreview.api.Note.from_json(reply))
+
     print(f'create or update {len(notes)} child invitations')
-    openreview.tools.concurrent_requests(post_invitation, notes, desc=f'edit_invitation_process')
\ No newline at end of file
+    diff = openreview.tools.EditTemplateDiff(client, invitation).apply([get_edit_content(note) for note in notes], dry_run=dry_run)
+    print(f"child invitations created: {len(diff['create'])}, updated: {len(diff['update'])}, skipped: {len(diff['unchanged'])}")
+    if dry_run:
+        return diff
+
+    openreview.tools.concurrent_requests(update_child_readers, diff['create'] + diff['update'] + diff['unchanged'], desc=f'edit_invitation_process')
@@ -59,80 +59,78 @@ class Recruitment(object):
 
         invitees = [e.lower() if '@' in e else e for e in invitees if len(e) > 0]
 
+        invitee_name_by_email = {}
+        for index, email in enumerate(invitees):
+            if invitee_names and index < len(invitee_names):
+                invitee_name_by_email.setdefault(email, invitee_names[index])
+
+        invited_roles = [f'{venue_id}/{role}/Invited' for role in committee_roles]
+        member_roles = [f'{venue_id}/{role}' for role in committee_roles]
+        group_members = self._get_members([committee_id, committee_invited_id, committee_declined_id] + invited_roles + member_roles)
+        members_by_group = { group_id: set(members) for group_id, members in group_members.items() }
+
+        invited_committee = group_members[committee_invited_id] if remind else []
+        profiles, profile_errors = self._get_profiles(invited_committee + invitees)
+
+        def add_error(error_string, user):
+            if error_string not in recruitment_status['errors']:
+                recruitment_status['errors'][error_string] = []
+            recruitment_status['errors'][error_string].append(user)
+
+        def get_identifiers(user):
+            profile = profiles.get(user)
+            if not profile:
+                return { user }
+            return { user } | { name['username'] for name in profile.content.get('names', []) if 'username' in name } | set(profile.content.get('emails', []))
+
         if remind:
-            committee_invited_group = self.client.get_group(committee_invited_id)
-            invited_committee = committee_invited_group.members
             print("Sending reminders for recruitment invitations")
+            reminders = {}
             for invited_user in tqdm(invited_committee, desc='remind recruitment'):
-                memberships = [g.id for g in self.client.get_groups(member=invited_user, prefix=committee_id)] if tools.get_group(self.client, invited_user) else []
-                if committee_id not in memberships and committee_declined_id not in memberships:
-                    name = 'invitee'
-                    if invited_user.startswith('~') :
-                        name = None
-                    elif (invited_user in invitees) and invitee_names:
-                        name = invitee_names[invitees.index(invited_user)]
-                    try:
-                        tools.recruit_reviewer(self.client, invited_user, name,
-                            hash_seed,
-                            invitation_id,
-                            message,
-                            'Reminder: ' + title,
-                            committee_invited_id,
-                            contact_info,
-                            verbose = False)
-                        recruitment_status['reminded'].append(invited_user)
-                    except Exception as e:
-                        self.client.remove_members_from_group(committee_invited_id, invited_user)
-                        if repr(e) not in recruitment_status['errors']:
-                            recruitment_status['errors'][repr(e)] = []
-                        recruitment_status['errors'][repr(e)].append(invited_user)
+                identifiers = get_identifiers(invited_user)
+                if identifiers & members_by_group[committee_id] or identifiers & members_by_group[committee_declined_id]:
+                    continue
+                name = 'invitee'
+                if invited_user.startswith('~'):
+                    name = None
+                elif invited_user in invitee_name_by_email:
+                    name = invitee_name_by_email[invited_user]
+                reminders[invited_user] = tools.get_recruitment_message(invited_user, name, hash_seed, invitation_id, message, contact_info)
+
+            failed = self._send_messages('Reminder: ' + title, reminders, committee_invited_id)
+            for invited_user in reminders:
+                if invited_user not in failed:
+                    recruitment_status['reminded'].append(invited_user)
+            if failed:
+                self.client.remove_members_from_group(committee_invited_id, list(failed))
+                for invited_user, error in failed.items():
+                    add_error(repr(error), invited_user)
 
         print('sending recruitment invitations')
+        recruits = {}
         for index, email in enumerate(tqdm(invitees, desc='send_invitations')):
-            profile_emails = []
-            profile = None
             is_profile_id = email.startswith('~')
-            invalid_profile_id = False
-            no_profile_found = False
-            if is_profile_id:
-                try:
-                    profile = tools.get_profile(self.client, email)
-                except openreview.OpenReviewException as e:
-                    error_string = repr(e)
-                    if 'ValidationError' in error_string:
-                        invalid_profile_id = True
-                    else:
-                        if error_string not in recruitment_status['errors']:
-                            recruitment_status['errors'][error_string] = []
-                        recruitment_status['errors'][error_string].append(email)
-                        continue
-                if not profile:
-                    no_profile_found = True
-                profile_emails = profile.content['emails'] if profile else []
-
-            memberships = [g.id for g in self.client.get_groups(member=email, prefix=venue_id)] if tools.get_group(self.client, email) else []
-            invited_roles = [f'{venue_id}/{role}/Invited' for role in committee_roles]
-            member_roles = [f'{venue_id}/{role}' for role in committee_roles]
-
-            invited_group_ids=list(set(invited_roles) & set(memberships))
-            member_group_ids=list(set(member_roles) & set(memberships))
-
-            if profile and not profile_emails:
-                if 'profiles_without_email' not in recruitment_status['errors']:
-                    recruitment_status['errors']['profiles_without_email'] = []
-                recruitment_status['errors']['profiles_without_email'].append(email)
-            elif invalid_profile_id:
-                if 'invalid_profile_ids' not in recruitment_status['errors']:
-                    recruitment_status['errors']['invalid_profile_ids'] = []
-                recruitment_status['errors']['invalid_profile_ids'].append(email)
-            elif no_profile_found:
-                if 'profile_not_found' not in recruitment_status['errors']:
-                    recruitment_status['errors']['profile_not_found'] = []
-                recruitment_status['errors']['profile_not_found'].append(email)
+            if email in profile_errors:
+                error_string = repr(profile_errors[email])
+                if 'ValidationError' in error_string:
+                    add_error('invalid_profile_ids', email)
+                else:
+                    add_error(error_string, email)
+                continue
+            profile = profiles.get(email)
+
+            identifiers = get_identifiers(email)
+            invited_group_ids = [group_id for group_id in invited_roles if identifiers & members_by_group[group_id]]
+            member_group_ids = [group_id for group_id in member_roles if identifiers & members_by_group[group_id]]
+
+            if profile and not profile.content.get('emails'):
+                add_error('profiles_without_email', email)
+            elif is_profile_id and not profile:
+                add_error('profile_not_found', email)
             elif invited_group_ids:
-                invited_group_id=invited_group_ids[0]
+                invited_group_id = invited_group_ids[0]
                 if invited_group_id not in recruitment_status['already_invited']:
-                    recruitment_status['already_invited'][invited_group_id] = [] 
+                    recruitment_status['already_invited'][invited_group_id] = []
                 recruitment_status['already_invited'][invited_group_id].append(email)
             elif member_group_ids:
                 member_group_id = member_group_ids[0]
@@ -143,29 +141,99 @@ class Recruitment(object):
                 name = invitee_names[index] if (invitee_names and index < len(invitee_names)) else None
                 if not name and not is_profile_id:
                     name = 'invitee'
-                try:
-                    tools.recruit_reviewer(self.client, email, name,
-                        hash_seed,
-                        invitation_id,
-                        message,
-                        title,
-                        committee_invited_id,
-                        contact_info,
-                        verbose=False)
-                    recruitment_status['invited'].append(email)
-                except Exception as e:
-                    error_string = repr(e)
-                    if 'NotFoundError' in error_string:
-                        error_string = 'InvalidGroup'
-                    else:
-                        try:
-                            self.client.remove_members_from_group(committee_invited_id, email)
-                        except Exception as e:
-                            new_error_string = repr(e)
-                            if new_error_string not in recruitment_status['errors']:
-                                recruitment_status['errors'][new_error_string] = []
-                            recruitment_status['errors'][new_error_string].append(email)
-                    if error_string not in recruitment_status['errors']:
-                        recruitment_status['errors'][error_string] = []
-                    recruitment_status['errors'][error_string].append(email)
-        return recruitment_status
\ No newline at end of file
+                recruits[email] = tools.get_recruitment_message(email, name, hash_seed, invitation_id, message, contact_info)
+                ## a repeated invitee is already invited by the time it is seen again
+                members_by_group[committee_invited_id].update(identifiers)
+
+        failed = {}
+        if recruits:
+            try:
+                self.client.add_members_to_group(committee_invited_id, list(recruits))
+            except Exception:
+                ## add the invitees one by one to find the ones that can't be added
+                for email in recruits:
+                    try:
+                        self.client.add_members_to_group(committee_invited_id, email)
+                    except Exception as e:
+                        failed[email] = e
+        failed.update(self._send_messages(title, { email: recruit_message for email, recruit_message in recruits.items() if email not in failed }, committee_invited_id))
+
+        to_remove = [email for email, error in failed.items() if 'NotFoundError' not in repr(error)]
+        removal_errors = {}
+        if to_remove:
+            try:
+                self.client.remove_members_from_group(committee_invited_id, to_remove)
+            except Exception:
+                for email in to_remove:
+                    try:
+                        self.client.remove_members_from_group(committee_invited_id, email)
+                    except Exception as e:
+                        removal_errors[email] = e
+
+        for email in recruits:
+            if email not in failed:
+                recruitment_status['invited'].append(email)
+                continue
+            if email in removal_errors:
+                add_error(repr(removal_errors[email]), email)
+            error_string = repr(failed[email])
+            add_error('InvalidGroup' if 'NotFoundError' in error_string else error_string, email)
+        return recruitment_status
+
+    def _get_members(self, group_ids):
+        """
+        Returns the members of each group, a group that doesn't exist has no members.
+        """
+        members_by_group = {}
+        for group_id in group_ids:
+            if group_id not in members_by_group:
+                group = tools.get_group(self.client, group_id)
+                members_by_group[group_id] = group.members if group else []
+        return members_by_group
+
+    def _get_profiles(self, ids_or_emails, batch_size=1000):
+        """
+        Searches the profiles of the profile ids and emails in batches. Returns a dict of the profile of each id or email that has one
+        and a dict of the error raised while searching each profile id.
+        """
+        profile_ids = list(dict.fromkeys(value for value in ids_or_emails if value.startswith('~')))
+        emails = list(dict.fromkeys(value for value in ids_or_emails if not value.startswith('~')))
+        profiles = {}
+        errors = {}
+
+        for i in range(0, len(profile_ids), batch_size):
+            batch = profile_ids[i:i + batch_size]
+            try:
+                profiles_by_username = {}
+                for profile in self.client.search_profiles(ids=batch):
+                    for name in profile.content.get('names', []):
+                        if 'username' in name:
+                            profiles_by_username[name['username']] = profile
+                    profiles_by_username[profile.id] = profile
+                for profile_id in batch:
+                    if profile_id in profiles_by_username:
+                        profiles[profile_id] = profiles_by_username[profile_id]
+            except openreview.OpenReviewException:
+                ## an invalid id fails the whole batch, get the profiles one by one to know which ids are invalid
+                for profile_id in batch:
+                    try:
+                        profile = tools.get_profile(self.client, profile_id)
+                        if profile:
+                            profiles[profile_id] = profile
+                    except openreview.OpenReviewException as e:
+                        errors[profile_id] = e
+
+        if emails:
+            profiles.update(self.client.search_profiles(confirmedEmails=emails))
+
+        return profiles, errors
+
+    def _send_messages(self, subject, messages, invited_id):
+        """
+        Posts the personalized message of each user concurrently. Returns a dict of the error raised by each user whose message failed.
+        """
+        batch = openreview.api.MessageBatch(self.client)
+        for user, user_message in messages.items():
+            batch.add(subject, [user], user_message, parentGroup=invited_id)
+        batch.send(raise_errors=False)
+        return { user: error for failed_message, error in batch.errors for user in failed_message['recipients'] }
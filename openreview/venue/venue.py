@@ -392,6 +392,27 @@ class Venue(object):
             invitation = f'{self.venue_id}/{self.submission_stage.name}{note.number}/-/{invitation_name}'
             self.invitation_builder.expire_invitation(invitation)
 
+    def diff_invitation_children(self, invitation):
+        """
+        Runs the process of a meta invitation in dry run mode. Returns the child invitations or groups that its edits would create or update, see
+        :meth:`tools.EditTemplateDiff.diff`, without posting any edit.
+
+        :param invitation: Meta invitation or its id. It can be a local copy with new dates to preview the changes before saving it.
+        :type invitation: str or Invitation
+
+        :return: Diff of the children, None if the invitation is not active
+        :rtype: dict
+        """
+        if isinstance(invitation, str):
+            invitation = self.client.get_invitation(invitation)
+        script = 'process/group_edit_process.py' if 'group' in invitation.edit else 'process/invitation_edit_process.py'
+        funcs = {
+            'openreview': openreview,
+            'datetime': datetime
+        }
+        exec(self.invitation_builder.get_process_content(script), funcs)
+        return funcs['process'](self.client, invitation, dry_run=True)
+
     def setup(self, program_chair_ids=[], publication_chairs_ids=[]):
     
         self.invitation_builder.set_meta_invitation()
@@ -812,20 +833,27 @@ Total Errors: {len(errors)}
 
         tools.concurrent_requests(send_notification, paper_notes)
 
-    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None):
+    def setup_committee_matching(self, committee_id=None, compute_affinity_scores=False, compute_conflicts=False, compute_conflicts_n_years=None, alternate_matching_group=None, submission_track=None, workers=None, checkpoint_dir=None):
         if committee_id is None:
             committee_id=self.get_reviewers_id()
         if self.use_senior_area_chairs and committee_id == self.get_senior_area_chairs_id() and not alternate_matching_group and not self.sac_paper_assignments:
             alternate_matching_group = self.get_area_chairs_id()
-        venue_matching = matching.Matching(self, self.client.get_group(committee_id), alternate_matching_group, { 'track': submission_track } if submission_track else None)
+        venue_matching = matching.Matching(self, self.client.get_group(committee_id), alternate_matching_group, { 'track': submission_track } if submission_track else None, checkpoint_dir=checkpoint_dir)
 
-        return venue_matching.setup(compute_affinity_scores, compute_conflicts, compute_conflicts_n_years)
+        return venue_matching.setup(compute_affinity_scores, compute_conflicts, compute_conflicts_n_years, workers)
 
-    def set_assignments(self, assignment_title, committee_id, enable_reviewer_reassignment=False, overwrite=False):
+    def set_matching_conflicts(self, profile_ids, committee_id=None, compute_conflicts=True, compute_conflicts_n_years=None, submission_track=None, workers=None):
+        # Computes the conflicts of users added to the committee after the matching was set up
+        if committee_id is None:
+            committee_id=self.get_reviewers_id()
+        venue_matching = matching.Matching(self, self.client.get_group(committee_id), submission_content={ 'track': submission_track } if submission_track else None)
+        return venue_matching.append_note_conflicts(profile_ids, compute_conflicts, compute_conflicts_n_years, workers)
+
+    def set_assignments(self, assignment_title, committee_id, enable_reviewer_reassignment=False, overwrite=False, checkpoint_dir=None):
 
         match_group = self.client.get_group(committee_id)
         assignment_invitation = self.client.get_invitation(self.get_assignment_id(match_group.id))
-        conference_matching = matching.Matching(self, match_group, submission_content=assignment_invitation.edit.get('head', {}).get('param', {}).get('withContent'))
+        conference_matching = matching.Matching(self, match_group, submission_content=assignment_invitation.edit.get('head', {}).get('param', {}).get('withContent'), checkpoint_dir=checkpoint_dir)
         return conference_matching.deploy(assignment_title, overwrite, enable_reviewer_reassignment)
 
     def setup_assignment_recruitment(self, committee_id, hash_seed, due_date, assignment_title=None, invitation_labels={}, email_template=None):
@@ -1068,7 +1096,10 @@ OpenReview Team'''
                 response = client.post_message(subject, edge.signatures, message)            
         
         active_venues = client.get_group('active_venues').members
+        pending_sign_ups = openreview.tools.PendingSignUps(client)
+        invite_assignment_invitations = {}
 
+        ## Collect the pending sign up edges of all the venues first, so the profiles and submissions are requested once
         for venue_id in active_venues:
 
             venue_group = client.get_group(venue_id)
@@ -1078,66 +1109,23 @@ OpenReview Team'''
                 print(f'Check active venue {venue_group.id}')
 
                 edge_invitations = client.get_all_invitations(prefix=venue_id, type='edge')
-                invite_assignment_invitations = [inv.id for inv in edge_invitations if inv.id.endswith('Invite_Assignment')]
-
-                for invite_assignment_invitation_id in invite_assignment_invitations:
-                    
-                    ## check if it is expired?
-                    invite_assignment_invitation = openreview.tools.get_invitation(client, invite_assignment_invitation_id)
-
-                    if invite_assignment_invitation:
-                        grouped_edges = client.get_grouped_edges(invitation=invite_assignment_invitation.id, label='Pending Sign Up', groupby='tail')
-                        print('Pending sign up edges found', len(grouped_edges))
-
-                        for grouped_edge in grouped_edges:
-
-                            tail = grouped_edge['id']['tail']
-                            profiles=openreview.tools.get_profiles(client, [tail], with_publications=True, with_relations=True)
-
-                            if profiles and profiles[0].active:
 
-                                user_profile=profiles[0]
-                                print('Profile found for', tail, user_profile.id)
+                for invite_assignment_invitation in [inv for inv in edge_invitations if inv.id.endswith('Invite_Assignment')]:
 
-                                edges = grouped_edge['values']
+                    invite_assignment_invitations[invite_assignment_invitation.id] = invite_assignment_invitation
+                    pending_edges = pending_sign_ups.add(invite_assignment_invitation.id,
+                        venue_group.content.get('submission_venue_id', {}).get('value'),
+                        policy=venue_group.content.get('reviewers_conflict_policy', {}).get('value'),
+                        n_years=venue_group.content.get('reviewers_conflict_n_years', {}).get('value'),
+                        context=venue_group)
+                    print('Pending sign up edges found', pending_edges)
 
-                                for edge in edges:
-
-                                    edge = openreview.api.Edge.from_json(edge)
-                                    submission=client.get_note(id=edge.head)
-
-                                    if submission.content['venueid']['value'] == venue_group.content.get('submission_venue_id', {}).get('value'):
-
-                                        ## Check if there is already an accepted edge for that profile id
-                                        accepted_edges = client.get_edges(invitation=invite_assignment_invitation.id, label='Accepted', head=submission.id, tail=user_profile.id)
-
-                                        if not accepted_edges:
-                                            ## Check if the user was invited again with a profile id
-                                            invitation_edges = client.get_edges(invitation=invite_assignment_invitation.id, label='Invitation Sent', head=submission.id, tail=user_profile.id)
-                                            if invitation_edges:
-                                                invitation_edge = invitation_edges[0]
-                                                print(f'User invited twice, remove double invitation edge {invitation_edge.id}')
-                                                invitation_edge.ddate = openreview.tools.datetime_millis(datetime.datetime.utcnow())
-                                                client.post_edge(invitation_edge)
-
-                                            ## Check conflicts
-                                            author_profiles = openreview.tools.get_profiles(client, submission.content['authorids']['value'], with_publications=True, with_relations=True)
-                                            conflicts=openreview.tools.get_conflicts(author_profiles, user_profile, policy=venue_group.content.get('reviewers_conflict_policy', {}).get('value'), n_years=venue_group.content.get('reviewers_conflict_n_years', {}).get('value'))
-
-                                            if conflicts:
-                                                print(f'Conflicts detected for {edge.head} and {user_profile.id}', conflicts)
-                                                mark_as_conflict(venue_group, edge, submission, user_profile)
-                                            else:
-                                                print(f'Mark accepted for {edge.head} and {user_profile.id}')
-                                                mark_as_accepted(venue_group, edge, submission, user_profile, invite_assignment_invitation)
-                                                                                                                                                            
-                                        else:
-                                            print("user already accepted with another invitation edge", submission.id, user_profile.id)                                
-
-                                    else:
-                                        print(f'submission {submission.id} is not active: {submission.content["venueid"]["value"]}')
+        for invite_assignment_invitation_id, venue_group, edge, submission, user_profile, conflicts in pending_sign_ups.resolve():
+            if conflicts:
+                print(f'Conflicts detected for {edge.head} and {user_profile.id}', conflicts)
+                mark_as_conflict(venue_group, edge, submission, user_profile)
+            else:
+                print(f'Mark accepted for {edge.head} and {user_profile.id}')
+                mark_as_accepted(venue_group, edge, submission, user_profile, invite_assignment_invitations[invite_assignment_invitation_id])
 
-                            else:
-                                print(f'no profile active for {tail}')                                             
-        
         return True
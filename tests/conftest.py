@@ -155,10 +155,43 @@ class Helpers:
 
         Helpers.await_queue()        
 
+class FakeServers:
+    """
+    Fake API v2 and API v1 servers on the baseurls of the test servers, see openreview.fake_server. The clients created while the
+    fake_servers fixture is active, including the ones created by openreview.tools, send their requests to them.
+    """
+
+    def __init__(self):
+        from openreview.fake_server import FakeOpenReviewServer
+        self.server = FakeOpenReviewServer(baseurl='http://localhost:3001')
+        self.server_v1 = FakeOpenReviewServer(baseurl='http://localhost:3000')
+
+    def client(self, user='~Super_User1'):
+        return self.server.client(user=user)
+
+    @staticmethod
+    def profile(profile_id, emails, domain=None, active=True):
+        content = {
+            'names': [{ 'username': profile_id }],
+            'emails': emails,
+            'emailsConfirmed': emails,
+            'preferredEmail': emails[0] if emails else None
+        }
+        domain = domain or (emails[0].split('@')[1] if emails else None)
+        if domain:
+            content['history'] = [{ 'position': 'PhD Student', 'start': 2020, 'end': None, 'institution': { 'domain': domain } }]
+        return { 'id': profile_id, 'active': active, 'content': content }
+
 @pytest.fixture(scope="class")
 def helpers():
     return Helpers
 
+@pytest.fixture
+def fake_servers():
+    fake_servers = FakeServers()
+    with fake_servers.server_v1.intercept(), fake_servers.server.intercept():
+        yield fake_servers
+
 @pytest.fixture(scope="session")
 def client():
     yield openreview.Client(baseurl = 'http://localhost:3000', username='openreview.net', password=Helpers.strong_password)
@@ -116,3 +116,29 @@ class TestEdges:
     
     
         
+
+    def test_edge_batch(self):
+        edges = openreview.api.EdgeBatch(
+            invitation='Venue/Reviewers/-/Conflict',
+            readers=['Venue', 'Venue/Area_Chairs', openreview.api.EdgeBatch.TAIL],
+            writers=['Venue'],
+            signatures=['Venue']
+        )
+        edges.append('paper1', '~Reviewer_One1', weight=-1)
+        edges.append('paper1', '~Reviewer_Two1', weight=0.5, label='Conflict')
+        edges.append('paper2', '~Reviewer_One1')
+
+        assert len(edges) == 3
+        assert edges.to_json() == [
+            openreview.api.Edge(invitation='Venue/Reviewers/-/Conflict', head='paper1', tail='~Reviewer_One1', weight=-1, readers=['Venue', 'Venue/Area_Chairs', '~Reviewer_One1'], writers=['Venue'], signatures=['Venue']).to_json(),
+            openreview.api.Edge(invitation='Venue/Reviewers/-/Conflict', head='paper1', tail='~Reviewer_Two1', weight=0.5, label='Conflict', readers=['Venue', 'Venue/Area_Chairs', '~Reviewer_Two1'], writers=['Venue'], signatures=['Venue']).to_json(),
+            openreview.api.Edge(invitation='Venue/Reviewers/-/Conflict', head='paper2', tail='~Reviewer_One1', readers=['Venue', 'Venue/Area_Chairs', '~Reviewer_One1'], writers=['Venue'], signatures=['Venue']).to_json()
+        ]
+        assert edges[1:].to_json() == edges.to_json()[1:]
+        assert edges[-1].head == 'paper2'
+        assert edges[-1].weight is None
+        assert [edge.tail for edge in edges] == ['~Reviewer_One1', '~Reviewer_Two1', '~Reviewer_One1']
+
+        edge = edges[0]
+        assert not hasattr(edge, '__dict__')
+        assert 'head = \'paper1\'' in repr(edge)
@@ -0,0 +1,127 @@
+import time
+
+import pytest
+import requests
+
+import openreview
+from openreview.fake_server import FakeOpenReviewServer
+
+class TestFakeServer():
+
+    @pytest.fixture
+    def server(self):
+        server = FakeOpenReviewServer()
+        server.add_notes([{ 'id': f'paper{i:05d}', 'number': i, 'invitations': ['Venue/-/Submission'], 'content': { 'venueid': { 'value': 'Venue/Submission' } } } for i in range(1, 2501)])
+        server.add_notes([{ 'id': 'review1', 'forum': 'paper00001', 'replyto': 'paper00001', 'invitations': ['Venue/Submission1/-/Official_Review'], 'content': {} }])
+        server.add_profiles([
+            { 'id': '~Reviewer_One1', 'content': { 'names': [{ 'username': '~Reviewer_One1' }, { 'username': '~Reviewer_Uno1' }], 'emails': ['one@mail.com'] } },
+            { 'id': '~Reviewer_Two1', 'content': { 'emails': ['two@mail.com'], 'emailsConfirmed': [] } }
+        ])
+        server.add_groups([
+            { 'id': 'Venue/Reviewers', 'members': ['~Reviewer_One1', '~Reviewer_Two1'] },
+            { 'id': 'Venue/Submission1/Reviewers', 'members': ['~Reviewer_One1'] },
+            { 'id': 'Venue/Submission2/Reviewers', 'members': [] }
+        ])
+        server.add_invitations([
+            { 'id': 'Venue/-/Submission', 'edit': { 'note': {} } },
+            { 'id': 'Venue/Reviewers/-/Affinity_Score', 'edge': {} },
+            { 'id': 'Venue/Submission1/-/Official_Review', 'invitations': ['Venue/-/Official_Review'], 'edit': { 'note': {} }, 'expdate': 1000 }
+        ])
+        return server
+
+    def test_notes(self, server):
+        client = server.client()
+
+        notes = client.get_all_notes(invitation='Venue/-/Submission')
+        assert [note.number for note in notes] == list(range(1, 2501))
+        assert server.request_counts['GET /notes'] == 3
+
+        notes = client.get_all_notes(content={ 'venueid': 'Venue/Submission' }, sort='number:desc')
+        assert [note.number for note in notes] == list(range(2500, 0, -1))
+
+        notes, count = client.get_notes(invitation='Venue/-/Submission', sort='id', after='paper02490', with_count=True)
+        assert [note.number for note in notes] == list(range(2491, 2501))
+        assert count == 2500
+
+        submission = client.get_notes(id='paper00001', details='replies,directReplies')[0]
+        assert [reply['id'] for reply in submission.details['replies']] == ['review1']
+        assert [reply['id'] for reply in submission.details['directReplies']] == ['review1']
+
+        with pytest.raises(openreview.OpenReviewException, match='NotFoundError'):
+            client.get_note('paper99999')
+
+        edit = client.post_note_edit(invitation='Venue/-/Submission', signatures=['Venue'], note=openreview.api.Note(id='paper00001', content={ 'title': { 'value': 'Title' } }))
+        assert edit['note']['content'] == { 'venueid': { 'value': 'Venue/Submission' }, 'title': { 'value': 'Title' } }
+
+    def test_edges(self, server):
+        client = server.client()
+        invitation = 'Venue/Reviewers/-/Affinity_Score'
+
+        batch = openreview.api.EdgeBatch(invitation=invitation, readers=['Venue'], writers=['Venue'], signatures=['Venue'])
+        for i in range(1, 1201):
+            batch.append(f'paper{i:05d}', '~Reviewer_One1' if i % 2 else '~Reviewer_Two1', weight=i / 1200)
+        posted = client.post_edges(batch)
+        assert len(posted) == 1200 and all(edge.id for edge in posted)
+
+        assert client.get_edges_count(invitation=invitation) == 1200
+        assert client.get_edges_count(invitation=invitation, tail='~Reviewer_One1') == 600
+        assert len(client.get_all_edges(invitation=invitation)) == 1200
+
+        grouped = client.get_grouped_edges(invitation=invitation, groupby='tail', select='head,weight')
+        assert [group['id']['tail'] for group in grouped] == ['~Reviewer_One1', '~Reviewer_Two1']
+        assert grouped[0]['count'] == 600
+        assert grouped[0]['values'][0] == { 'head': 'paper00001', 'weight': 1 / 1200 }
+
+        client.delete_edges(invitation=invitation, tail='~Reviewer_Two1', soft_delete=True)
+        assert client.get_edges_count(invitation=invitation) == 600
+        assert len(client.get_edges(invitation=invitation, tail='~Reviewer_Two1', trash=True)) == 600
+
+    def test_groups_profiles_invitations(self, server):
+        client = server.client()
+
+        server.reset_counts()
+        assert [group.id for group in client.get_all_groups(prefix='Venue/Submission')] == ['Venue/Submission1/Reviewers', 'Venue/Submission2/Reviewers']
+        assert server.request_counts == { 'GET /groups': 1 }
+        assert [group.id for group in client.get_groups(member='~Reviewer_Two1')] == ['Venue/Reviewers']
+        assert openreview.tools.get_group(client, 'Venue/Area_Chairs') is None
+
+        assert [profile.id for profile in client.search_profiles(ids=['~Reviewer_Uno1', '~Reviewer_Two1'])] == ['~Reviewer_One1', '~Reviewer_Two1']
+        assert list(client.search_profiles(confirmedEmails=['one@mail.com', 'two@mail.com'])) == ['one@mail.com']
+        assert client.get_profile('two@mail.com').id == '~Reviewer_Two1'
+
+        assert [invitation.id for invitation in client.get_all_invitations(prefix='Venue/')] == ['Venue/-/Submission', 'Venue/Reviewers/-/Affinity_Score']
+        assert [invitation.id for invitation in client.get_all_invitations(invitation='Venue/-/Official_Review', expired=True)] == ['Venue/Submission1/-/Official_Review']
+        assert [invitation.id for invitation in client.get_invitations(type='edges')] == ['Venue/Reviewers/-/Affinity_Score']
+
+    def test_latency(self, server):
+        server.latency = lambda method, path: 0.05 if path == '/notes' else 0
+        client = server.client()
+
+        start = time.perf_counter()
+        client.get_groups(id='Venue/Reviewers')
+        assert time.perf_counter() - start < 0.05
+
+        start = time.perf_counter()
+        client.get_all_notes(invitation='Venue/-/Submission', workers=3)
+        assert time.perf_counter() - start >= 0.05
+        assert server.total_requests == 4
+
+        server.reset_counts()
+        assert server.total_requests == 0
+
+    def test_intercept(self, server):
+        server.baseurl = 'http://localhost:3001'
+        server.add_notes([{ 'id': 'publication1', 'invitations': ['DBLP.org/-/Record'], 'content': { 'authorids': { 'value': ['~Reviewer_One1', '~Reviewer_Two1'] } } }])
+        server_v1 = FakeOpenReviewServer(baseurl='http://localhost:3000')
+        server_v1.add_notes([{ 'id': 'publication2', 'invitation': 'dblp.org/-/record', 'content': { 'authorids': ['~Reviewer_One1'] } }])
+
+        with server_v1.intercept(), server.intercept():
+            publications = openreview.tools.get_publications(server.client(), ['~Reviewer_One1', '~Reviewer_Two1'])
+
+        assert { profile_id: [note.id for note in notes] for profile_id, notes in publications.items() } == {
+            '~Reviewer_One1': ['publication2', 'publication1'],
+            '~Reviewer_Two1': ['publication1']
+        }
+        assert server.request_counts['GET /notes'] == 2
+        assert server_v1.request_counts['GET /notes'] == 2
+        assert requests.Session.get_adapter.__name__ == 'get_adapter'
@@ -1761,6 +1761,7 @@ Please note that responding to this email will direct your reply to joelle@mails
         late_reviewers = journal.get_late_invitees('TMLR/Paper1/Reviewers/-/~Carlos_Mondragon1/Assignment/Acknowledgement')
         assert late_reviewers
         assert '~Carlos_Mondragon1' in late_reviewers
+        assert sorted(journal.get_all_late_invitees()['TMLR/Paper1/Reviewers/-/~Carlos_Mondragon1/Assignment/Acknowledgement']) == sorted(late_reviewers)
 
         carlos_anon_groups=carlos_client.get_groups(prefix=f'{venue_id}/Paper1/Reviewer_.*', signatory='~Carlos_Mondragon1')
         assert len(carlos_anon_groups) == 1
@@ -1780,6 +1781,7 @@ Please note that responding to this email will direct your reply to joelle@mails
 
         late_reviewers = journal.get_late_invitees('TMLR/Paper1/Reviewers/-/~Carlos_Mondragon1/Assignment/Acknowledgement')
         assert not late_reviewers
+        assert not journal.get_all_late_invitees().get('TMLR/Paper1/Reviewers/-/~Carlos_Mondragon1/Assignment/Acknowledgement')
 
         messages = journal.client.get_messages(to = 'joelle@mailseven.com', subject = '[TMLR] Assignment Acknowledgement posted on submission 1: Paper title UPDATED')
         assert len(messages) == 1
@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestLazyImports():
+
+    def run(self, code):
+        output = subprocess.run([sys.executable, '-c', f'import sys, json\nsys.path.insert(0, {ROOT!r})\n{code}'], capture_output=True, text=True, check=True).stdout
+        return json.loads(output)
+
+    def test_import_openreview(self):
+        from benchmarks.import_time import LAZY_MODULES
+
+        modules = self.run('import openreview\nprint(json.dumps(sorted(sys.modules)))')
+        assert [module for module in LAZY_MODULES if module in modules] == []
+
+    def test_public_names(self):
+        names = self.run('''import openreview
+print(json.dumps({
+    'Client': openreview.Client.__module__,
+    'OpenReviewClient': openreview.api.OpenReviewClient.__module__,
+    'Venue': openreview.venue.Venue.__module__,
+    'Journal': openreview.journal.Journal.__module__,
+    'ARR': openreview.arr.ARR.__module__,
+    'Conference': openreview.Conference.__module__,
+    'SubmissionStage': openreview.SubmissionStage.__module__,
+    'helpers': openreview.helpers.__name__,
+    'agora': openreview.agora.__name__,
+    'VenueRequest': openreview.VenueRequest.__module__,
+    'ProfileManagement': openreview.ProfileManagement.__module__,
+    'stages': openreview.stages.SubmissionStage is openreview.SubmissionStage
+}))''')
+        assert names == {
+            'Client': 'openreview.openreview',
+            'OpenReviewClient': 'openreview.api.client',
+            'Venue': 'openreview.venue.venue',
+            'Journal': 'openreview.journal.journal',
+            'ARR': 'openreview.arr.arr',
+            'Conference': 'openreview.conference.builder',
+            'SubmissionStage': 'openreview.stages.venue_stages',
+            'helpers': 'openreview.conference.helpers',
+            'agora': 'openreview.agora.agora',
+            'VenueRequest': 'openreview.venue_request.venue_request',
+            'ProfileManagement': 'openreview.profile.management',
+            'stages': True
+        }
+
+    def test_access_order(self):
+        ## The subpackage is imported by the first name used, openreview.agora is the inner module in any order
+        names = self.run('''import openreview
+print(json.dumps({
+    'Agora': openreview.Agora.__module__,
+    'agora': openreview.agora.__name__,
+    'VenueRequest': openreview.VenueRequest.__module__,
+    'venue_request': openreview.venue_request.__name__,
+    'VenueStages': openreview.VenueStages.__module__
+}))''')
+        assert names == {
+            'Agora': 'openreview.agora.agora',
+            'agora': 'openreview.agora.agora',
+            'VenueRequest': 'openreview.venue_request.venue_request',
+            'venue_request': 'openreview.venue_request.venue_request',
+            'VenueStages': 'openreview.venue_request.venue_request'
+        }
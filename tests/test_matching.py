@@ -80,6 +80,21 @@ class TestMatching():
         conference.create_bid_stages()
         return conference
 
+    def test_subject_area_scores(self):
+        from openreview.conference.matching import _jaccard_similarity, _subject_area_scores
+
+        papers = [['Machine Learning', 'Optimization'], ['Robotics'], ['Theory', 'Optimization', 'Theory'], []]
+        users = [['Optimization'], ['Robotics', 'Vision', 'Machine Learning'], ['Theory', 'Optimization'], ['Vision']]
+
+        scores = list(_subject_area_scores(papers, users))
+        assert [(p, u) for p, u, _ in scores] == [(p, u) for p in range(len(papers)) for u in range(len(users))]
+        for paper_position, user_position, score in scores:
+            expected = _jaccard_similarity(papers[paper_position], users[user_position]) if papers[paper_position] else 0
+            assert score == pytest.approx(expected)
+
+        assert list(_subject_area_scores(papers, users, threshold=0)) == [(p, u, score) for p, u, score in scores if score > 0]
+        assert list(_subject_area_scores(papers, users, threshold=0.5)) == [(2, 2, 1.0)]
+
     def test_setup_matching(self, conference, pc_client, test_client, helpers):
 
         ## Set committee
@@ -0,0 +1,307 @@
+import openreview
+import pytest
+
+from openreview.venue import Venue
+
+class TestOfflineWorkflows():
+    """
+    Workflows that run against the fake servers of the fake_servers fixture, so they don't need the API and don't depend on the other tests.
+    """
+
+    def test_append_note_conflicts(self, fake_servers):
+
+        venue_id = 'Fake.cc/2025/Conference'
+        conflict_id = f'{venue_id}/Reviewers/-/Conflict'
+        server = fake_servers.server
+        profile = fake_servers.profile
+
+        server.add_profiles([profile('~Reviewer_A1', ['reviewer_a1@umass.edu']), profile('~Reviewer_B1', ['reviewer_b1@mit.edu']), profile('~Author_X1', ['author_x1@umass.edu']), profile('~Author_Y1', ['author_y1@mit.edu'])])
+        server.add_notes([{ 'id': f'submission{number}', 'number': number, 'invitations': [f'{venue_id}/-/Submission'], 'content': { 'authorids': { 'value': [authorid] }, 'venueid': { 'value': f'{venue_id}/Submission' } } } for number, authorid in [(1, '~Author_X1'), (2, '~Author_Y1')]])
+        server.add_groups([{ 'id': f'{venue_id}/Reviewers', 'members': ['~Reviewer_A1', '~Reviewer_B1'] }])
+        server.add_invitations([{ 'id': conflict_id, 'edge': {} }])
+        server.add_edges([
+            { 'invitation': conflict_id, 'head': 'submission2', 'tail': '~Reviewer_B1', 'weight': -1, 'label': 'Conflict' },
+            { 'invitation': conflict_id, 'head': 'submission2', 'tail': '~Reviewer_A1', 'weight': -1, 'label': 'Conflict' }
+        ])
+
+        venue = Venue(fake_servers.client(), venue_id, 'openreview.net/Support')
+        venue.submission_stage = openreview.stages.SubmissionStage()
+        matching = openreview.venue.matching.Matching(venue, venue.client.get_group(f'{venue_id}/Reviewers'))
+
+        matching.append_note_conflicts(['~Reviewer_A1'])
+        edges = venue.client.get_edges(invitation=conflict_id)
+        assert sorted((edge.head, edge.tail) for edge in edges) == [('submission1', '~Reviewer_A1'), ('submission2', '~Reviewer_B1')]
+
+        ## The authors are only loaded once by the same Matching
+        server.reset_counts()
+        matching.append_note_conflicts('~Reviewer_B1')
+        assert server.request_counts['POST /profiles/search'] == 1
+        edges = venue.client.get_edges(invitation=conflict_id)
+        assert sorted((edge.head, edge.tail) for edge in edges) == [('submission1', '~Reviewer_A1'), ('submission2', '~Reviewer_B1')]
+
+        with pytest.raises(openreview.OpenReviewException, match='No profile exists: ~Reviewer_C1'):
+            matching.append_note_conflicts(['~Reviewer_C1'])
+
+    def test_invite_committee(self, fake_servers):
+
+        venue_id = 'Fake.cc/2025/Conference'
+        server = fake_servers.server
+        profile = fake_servers.profile
+
+        server.add_profiles([profile('~Reviewer_A1', ['a@mit.edu']), profile('~Reviewer_B1', ['b@mit.edu']), profile('~Reviewer_C1', [])])
+        server.add_groups([{ 'id': venue_id, 'members': [] }, { 'id': f'{venue_id}/Reviewers', 'members': ['b@mit.edu'] }])
+
+        venue = Venue(fake_servers.client(), venue_id, 'openreview.net/Support')
+        server.reset_counts()
+        status = venue.recruit_reviewers(title='[FC] Invitation to serve as reviewer',
+            message='Dear {{fullname}}, please respond {{invitation_url}}',
+            invitees=['~Reviewer_A1', '~Reviewer_B1', '~Reviewer_C1', 'new@mail.com', 'new@mail.com', '~Reviewer_Z1'],
+            invitee_names=[None, None, None, 'New Reviewer'],
+            reviewers_name='Reviewers')
+
+        assert status['invited'] == ['~Reviewer_A1', 'new@mail.com']
+        assert status['already_invited'] == { f'{venue_id}/Reviewers/Invited': ['new@mail.com'] }
+        assert status['already_member'] == { f'{venue_id}/Reviewers': ['~Reviewer_B1'] }
+        assert status['errors'] == { 'profiles_without_email': ['~Reviewer_C1'], 'profile_not_found': ['~Reviewer_Z1'] }
+        assert sorted(venue.client.get_group(f'{venue_id}/Reviewers/Invited').members) == ['new@mail.com', '~Reviewer_A1']
+        ## The Invited and Declined groups are created with an edit each and the invitees are added to Invited with one more edit
+        assert server.request_counts['POST /groups/edits'] == 3
+        assert server.request_counts['POST /profiles/search'] == 2
+        assert sorted(message['groups'][0] for message in server.messages) == ['new@mail.com', '~Reviewer_A1']
+        assert 'Dear New Reviewer, please respond https://openreview.net/invitation?id=Fake.cc/2025/Conference/Reviewers/-/Recruitment&user=new%40mail.com&key=' in [message for message in server.messages if message['groups'] == ['new@mail.com']][0]['message']
+
+        ## Only the invited users that didn't accept or decline are reminded
+        server.add_groups([{ 'id': f'{venue_id}/Reviewers', 'members': ['b@mit.edu', 'a@mit.edu'] }])
+        status = venue.recruit_reviewers(title='[FC] Invitation to serve as reviewer',
+            message='Dear {{fullname}}, please respond {{invitation_url}}',
+            invitees=[],
+            reviewers_name='Reviewers',
+            remind=True)
+        assert status['reminded'] == ['new@mail.com']
+        assert server.messages[-1]['subject'] == 'Reminder: [FC] Invitation to serve as reviewer'
+
+    def test_check_new_profiles(self, fake_servers, capsys):
+
+        venue_id = 'Fake.cc/2025/Conference'
+        invite_assignment_id = f'{venue_id}/Reviewers/-/Invite_Assignment'
+        server = fake_servers.server
+        profile = fake_servers.profile
+
+        server.add_profiles([profile('~New_Reviewer1', ['new@mit.edu']), profile('~Conflict_Reviewer1', ['conflict@umass.edu']), profile('~Author_A1', ['author_a@umass.edu']), profile('~Author_B1', ['author_b@cmu.edu'])])
+        server.add_groups([
+            { 'id': 'active_venues', 'members': [venue_id] },
+            { 'id': venue_id, 'domain': venue_id, 'members': [], 'content': { 'subtitle': { 'value': 'FC 2025' }, 'submission_venue_id': { 'value': f'{venue_id}/Submission' } } }
+        ])
+        server.add_invitations([{ 'id': invite_assignment_id, 'edge': {}, 'content': { 'assignment_invitation_id': { 'value': f'{venue_id}/Reviewers/-/Assignment' }, 'match_group': { 'value': f'{venue_id}/Reviewers' } } }])
+        server.add_notes([{ 'id': f'submission{number}', 'number': number, 'invitations': [f'{venue_id}/-/Submission'], 'content': { 'title': { 'value': f'Paper {number}' }, 'authorids': { 'value': [authorid] }, 'venueid': { 'value': venueid } } } for number, authorid, venueid in [(1, '~Author_A1', f'{venue_id}/Submission'), (2, '~Author_B1', f'{venue_id}/Submission'), (3, '~Author_B1', f'{venue_id}/Withdrawn_Submission')]])
+        server.add_edges([{ 'id': f'edge{index}', 'invitation': invite_assignment_id, 'head': head, 'tail': tail, 'label': label, 'signatures': ['~Super_User1'] } for index, (head, tail, label) in enumerate([
+            ('submission2', 'new@mit.edu', 'Pending Sign Up'),
+            ('submission3', 'new@mit.edu', 'Pending Sign Up'),
+            ('submission2', '~New_Reviewer1', 'Invitation Sent'),
+            ('submission1', 'conflict@umass.edu', 'Pending Sign Up'),
+            ('submission1', 'nobody@mail.com', 'Pending Sign Up'),
+            ('submission1', 'new@mit.edu', 'Pending Sign Up'),
+            ('submission1', '~New_Reviewer1', 'Accepted'),
+            ('deleted', 'new@mit.edu', 'Pending Sign Up')
+        ])])
+
+        client = fake_servers.client()
+        server.reset_counts()
+        openreview.venue.Venue.check_new_profiles(client)
+        assert 'submission deleted not found' in capsys.readouterr().out
+        ## The pending, accepted and sent invitation edges are requested once for the invitation and the assignment edges once for the accepted edge
+        assert server.request_counts['GET /edges'] == 4
+
+        edges = client.get_all_edges(invitation=invite_assignment_id)
+        assert sorted((edge.head, edge.tail, edge.label) for edge in edges) == [
+            ('deleted', 'new@mit.edu', 'Pending Sign Up'),
+            ('submission1', 'new@mit.edu', 'Pending Sign Up'),
+            ('submission1', 'nobody@mail.com', 'Pending Sign Up'),
+            ('submission1', '~Conflict_Reviewer1', 'Conflict Detected'),
+            ('submission1', '~New_Reviewer1', 'Accepted'),
+            ('submission2', '~New_Reviewer1', 'Accepted'),
+            ('submission3', 'new@mit.edu', 'Pending Sign Up')
+        ]
+        assignment_edges = client.get_all_edges(invitation=f'{venue_id}/Reviewers/-/Assignment')
+        assert [(edge.head, edge.tail) for edge in assignment_edges] == [('submission2', '~New_Reviewer1')]
+        assert sorted(message['subject'] for message in server.messages) == [
+            '[FC 2025] Conflict detected between reviewer Conflict Reviewer and paper 1',
+            '[FC 2025] Conflict detected for paper 1',
+            '[FC 2025] Reviewer Assignment confirmed for paper 2',
+            '[FC 2025] Reviewer New Reviewer signed up and is assigned to paper 2'
+        ]
+
+        ## The submissions are requested once, not once per edge
+        assert server.request_counts['POST /notes/search'] == 1
+
+    def test_setup_shared_data(self, fake_servers):
+        import datetime
+        import os
+
+        previous_cycle_id = 'aclweb.org/ACL/ARR/2024/April'
+        venue_id = 'aclweb.org/ACL/ARR/2024/June'
+        server = fake_servers.server
+        roles = ['Senior_Area_Chairs', 'Area_Chairs', 'Reviewers']
+
+        server.add_groups([{ 'id': venue_id, 'domain': venue_id, 'members': [], 'content': {
+            'reviewers_id': { 'value': f'{venue_id}/Reviewers' },
+            'area_chairs_id': { 'value': f'{venue_id}/Area_Chairs' },
+            'senior_area_chairs_id': { 'value': f'{venue_id}/Senior_Area_Chairs' },
+            'ethics_chairs_id': { 'value': f'{venue_id}/Ethics_Chairs' },
+            'ethics_reviewers_name': { 'value': 'Ethics_Reviewers' }
+        } }])
+        server.add_groups([{ 'id': f'{cycle_id}/{role}', 'members': [] } for cycle_id in [previous_cycle_id, venue_id] for role in roles + ['Ethics_Chairs', 'Ethics_Reviewers']])
+        server.add_invitations([{ 'id': f'{cycle_id}/{role}/-/{name}', 'edit': { 'note': { 'forum': f'{cycle_id}/{role}/{name}_Forum', 'replyto': f'{cycle_id}/{role}/{name}_Forum' } } }
+            for cycle_id in [previous_cycle_id, venue_id] for role in roles for name in ['Registration', 'License_Agreement', 'Max_Load_And_Unavailability_Request']])
+
+        ## Two reviewers with the same answers, one of them already registered in the next cycle
+        agreement = { 'agreement': { 'value': 'I agree for this cycle and all future cycles' }, 'attribution': { 'value': '' } }
+        registration = { 'expertise': { 'value': 'Yes' } }
+        server.add_notes([{ 'invitations': [f'{previous_cycle_id}/Reviewers/-/{name}'], 'signatures': [signature], 'content': content, 'cdate': 1700000000000 }
+            for signature in ['~Reviewer_A1', '~Reviewer_B1'] for name, content in [('Registration', registration), ('License_Agreement', agreement)]])
+        server.add_notes([{ 'invitations': [f'{venue_id}/Reviewers/-/Registration'], 'signatures': ['~Reviewer_A1'], 'content': registration }])
+
+        with open(os.path.join(os.path.dirname(openreview.__file__), 'arr', 'management', 'setup_shared_data.py')) as f:
+            process_globals = { 'openreview': openreview, 'datetime': datetime }
+            exec(f.read(), process_globals)
+
+        invitation = openreview.api.Invitation(id=f'{venue_id}/-/Share_Data', domain=venue_id, cdate=0, content={ 'previous_cycle': { 'value': previous_cycle_id } })
+        process_globals['process'](fake_servers.client(), invitation)
+
+        client = fake_servers.client()
+        assert sorted(note.signatures[0] for note in client.get_all_notes(invitation=f'{venue_id}/Reviewers/-/Registration')) == ['~Reviewer_A1', '~Reviewer_B1']
+        assert sorted(note.signatures[0] for note in client.get_all_notes(invitation=f'{venue_id}/Reviewers/-/License_Agreement')) == ['~Reviewer_A1', '~Reviewer_B1']
+
+    def test_journal_conflict_index(self, fake_servers, tmp_path):
+
+        venue_id = 'Fake.cc/Journal'
+        server = fake_servers.server
+        profile = fake_servers.profile
+
+        server.add_profiles([profile('~Editor_A1', ['editor_a1@umass.edu']), profile('~Editor_B1', ['editor_b1@mit.edu'])])
+        server.add_groups([{ 'id': f'{venue_id}/Action_Editors', 'members': ['~Editor_A1', '~Editor_B1'] }])
+
+        def get_conflict_index():
+            journal = openreview.journal.Journal(fake_servers.client(), venue_id, '1234', contact_info='editors@journal.cc', full_name='Fake Journal', short_name='FJ', settings={ 'conflict_index_dir': str(tmp_path) })
+            return journal.assignment.get_conflict_index(journal.get_action_editors_id(), journal.get_action_editors())
+
+        conflict_index = get_conflict_index()
+        assert sorted(conflict_index.refreshed) == ['~Editor_A1', '~Editor_B1']
+
+        ## Another run reuses the stored info and only requests the members whose profile changed
+        server.add_profiles([profile('~Editor_B1', ['editor_b1@umass.edu'])])
+        conflict_index = get_conflict_index()
+        assert conflict_index.refreshed == ['~Editor_B1']
+
+        server.add_profiles([profile('~Author_X1', ['author_x1@umass.edu'])])
+        author_profiles = openreview.tools.get_profiles(fake_servers.client(), ['~Author_X1'], with_publications=True, with_relations=True)
+        assert [member_id for member_id, conflicts in conflict_index.find_conflicts(author_profiles) if conflicts] == ['~Editor_A1', '~Editor_B1']
+
+    def test_profile_cache(self, fake_servers, tmp_path):
+
+        server = fake_servers.server
+        profile = fake_servers.profile
+
+        server.add_profiles([profile('~Reviewer_A1', ['reviewer_a1@umass.edu']), profile('~Reviewer_B1', ['reviewer_b1@umass.edu'])])
+        cache = openreview.tools.ProfileCache(str(tmp_path / 'profiles.sqlite'))
+
+        def get_profiles(user):
+            client = fake_servers.client(user=user)
+            client.profile_cache = cache
+            return openreview.tools.get_profiles(client, ['~Reviewer_A1'], with_publications=True)
+
+        server.reset_counts()
+        get_profiles('~Super_User1')
+        get_profiles('~Super_User1')
+        assert server.request_counts['POST /profiles/search'] == 1
+
+        ## The profiles seen by a user are not returned to another user
+        get_profiles('~Program_Chair1')
+        assert server.request_counts['POST /profiles/search'] == 2
+
+        ## The cached and the fetched profiles are returned in the order of the requested ids
+        client = fake_servers.client()
+        client.profile_cache = cache
+        assert [p.id for p in client.search_profiles(ids=['~Reviewer_B1', '~Reviewer_A1'])] == ['~Reviewer_B1', '~Reviewer_A1']
+        assert server.request_counts['POST /profiles/search'] == 3
+
+    def test_edit_template_diff_groups(self, fake_servers):
+
+        venue_id = 'Fake.cc/2025/Conference'
+        server = fake_servers.server
+        server.add_groups([{ 'id': venue_id, 'members': [] }] + [{ 'id': f'{venue_id}/Submission{number}/Authors', 'members': [] } for number in [1, 2]])
+
+        invitation = openreview.api.Invitation(id=f'{venue_id}/-/Ethics_Reviewers', domain=venue_id, edit={
+            'content': { 'noteNumber': {} },
+            'group': {
+                'id': f'{venue_id}/Submission${{2/content/noteNumber/value}}/Ethics_Reviewers',
+                'readers': [venue_id],
+                'signatures': [venue_id]
+            }
+        })
+        contents = [{ 'noteNumber': { 'value': number } } for number in [1, 2]]
+
+        client = fake_servers.client()
+        diff = openreview.tools.EditTemplateDiff(client, invitation).apply(contents, dry_run=True)
+        assert [entry['id'] for entry in diff['create']] == [f'{venue_id}/Submission1/Ethics_Reviewers', f'{venue_id}/Submission2/Ethics_Reviewers']
+
+        ## The diff only requests the groups edited with the meta invitation
+        server.add_invitations([invitation])
+        openreview.tools.EditTemplateDiff(client, invitation).apply(contents)
+        assert server.groups[f'{venue_id}/Submission1/Ethics_Reviewers']['invitations'] == [invitation.id]
+        server.reset_counts()
+        children_diff = openreview.tools.EditTemplateDiff(client, invitation)
+        diff = children_diff.apply(contents, dry_run=True)
+        assert sorted(children_diff.get_children()) == [f'{venue_id}/Submission1/Ethics_Reviewers', f'{venue_id}/Submission2/Ethics_Reviewers']
+        assert len(diff['unchanged']) == 2
+        assert server.request_counts == { 'GET /groups': 1 }
+
+    def test_build_note_scores(self, fake_servers):
+
+        venue_id = 'Fake.cc/2025/Conference'
+        server = fake_servers.server
+        server.add_notes([{ 'id': f'submission{number}', 'number': number, 'invitations': [f'{venue_id}/-/Submission'], 'content': { 'venueid': { 'value': f'{venue_id}/Submission' } } } for number in [1, 2]])
+        server.add_groups([{ 'id': venue_id, 'members': [] }, { 'id': f'{venue_id}/Reviewers', 'members': ['~Reviewer_A1', '~Reviewer_B1'] }])
+
+        venue = Venue(fake_servers.client(), venue_id, 'openreview.net/Support')
+        venue.submission_stage = openreview.stages.SubmissionStage()
+        matching = openreview.venue.matching.Matching(venue, venue.client.get_group(f'{venue_id}/Reviewers'))
+        score_id = f'{venue_id}/Reviewers/-/Affinity_Score'
+        server.add_edges([{ 'invitation': score_id, 'head': 'submission1', 'tail': '~Reviewer_C1', 'weight': 0.1 }])
+
+        ## A header row, the rows of deleted papers and the rows of a paper without a numeric score are skipped
+        scores = b'submission,user,score\nsubmission1,~Reviewer_A1,0.5\nsubmission1,~Reviewer_B1,n/a\nsubmission2,~Reviewer_B1,0.25\ndeleted,~Reviewer_A1\n'
+        matching._build_scores_from_stream(score_id, scores, venue.client.get_all_notes(invitation=f'{venue_id}/-/Submission'))
+        edges = venue.client.get_edges(invitation=score_id)
+        assert sorted((edge.head, edge.tail, edge.weight) for edge in edges) == [('submission1', '~Reviewer_A1', 0.5), ('submission2', '~Reviewer_B1', 0.25)]
+
+    def test_deploy_assignments(self, fake_servers):
+
+        venue_id = 'Fake.cc/2025/Conference'
+        proposed_id = f'{venue_id}/Reviewers/-/Proposed_Assignment'
+        assignment_id = f'{venue_id}/Reviewers/-/Assignment'
+        server = fake_servers.server
+        server.add_notes([{ 'id': f'submission{number}', 'number': number, 'invitations': [f'{venue_id}/-/Submission'], 'content': { 'venueid': { 'value': f'{venue_id}/Submission' } } } for number in [1, 2, 3]])
+        server.add_groups([{ 'id': venue_id, 'members': [] }, { 'id': f'{venue_id}/Reviewers', 'members': ['~Reviewer_A1', '~Reviewer_B1'] }] + [{ 'id': f'{venue_id}/Submission{number}/Reviewers', 'members': [] } for number in [1, 2, 3]])
+        server.add_edges([{ 'invitation': proposed_id, 'head': head, 'tail': tail, 'label': label, 'weight': 1, 'readers': [venue_id, tail], 'writers': [venue_id], 'signatures': [venue_id] } for head, tail, label in [
+            ('submission1', '~Reviewer_A1', 'matching'),
+            ('submission1', '~Reviewer_B1', 'matching'),
+            ('submission2', '~Reviewer_B1', 'matching'),
+            ('submission2', '~Reviewer_A1', 'other'),
+            ('deleted', '~Reviewer_A1', 'matching')
+        ]])
+
+        venue = Venue(fake_servers.client(), venue_id, 'openreview.net/Support')
+        venue.submission_stage = openreview.stages.SubmissionStage()
+        matching = openreview.venue.matching.Matching(venue, venue.client.get_group(f'{venue_id}/Reviewers'))
+        server.reset_counts()
+        matching.deploy_assignments('matching', overwrite=False)
+        ## The senior area chair assignments and the proposed assignments are requested once and the deployed edges are posted in one batch
+        assert server.request_counts['GET /edges'] == 2
+        assert server.request_counts['POST /edges/bulk'] == 1
+
+        edges = venue.client.get_edges(invitation=assignment_id)
+        assert sorted((edge.head, edge.tail, edge.readers) for edge in edges) == [('submission1', '~Reviewer_A1', [venue_id, '~Reviewer_A1']), ('submission1', '~Reviewer_B1', [venue_id, '~Reviewer_B1']), ('submission2', '~Reviewer_B1', [venue_id, '~Reviewer_B1'])]
+        assert server.groups[f'{venue_id}/Submission1/Reviewers']['members'] == ['~Reviewer_A1', '~Reviewer_B1']
+        assert server.groups[f'{venue_id}/Submission2/Reviewers']['members'] == ['~Reviewer_B1']
+        assert server.groups[f'{venue_id}/Submission3/Reviewers']['members'] == []
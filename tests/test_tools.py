@@ -5,6 +5,9 @@ import random
 import types
 import sys
 import os
+import threading
+import time
+import requests
 
 from openreview import OpenReviewException
 from openreview.tools import concurrent_requests
@@ -302,6 +305,18 @@ class TestTools():
         assert openreview.tools.subdomains('cs.umass.edu') == ['cs.umass.edu', 'umass.edu']
         assert openreview.tools.subdomains('   ') == []
 
+        openreview.tools.clear_subdomains_cache()
+        stats = openreview.tools.warm_subdomains(['user@cs.umass.edu', 'robots.ox.ac.uk', 'cs.umass.edu'])
+        assert stats['misses'] == 2
+        assert stats['hits'] == 1
+        assert stats['size'] == 2
+
+        domains = openreview.tools.subdomains('cs.umass.edu')
+        assert domains == ['cs.umass.edu', 'umass.edu']
+        domains.append('mutated.edu')
+        assert openreview.tools.subdomains('cs.umass.edu') == ['cs.umass.edu', 'umass.edu']
+        assert openreview.tools.subdomains_cache_info()['hits'] == 3
+
     def test_replace_members_with_ids(self, client, test_client):
         test_client.post_profile(openreview.Profile(
             referent='~SomeFirstName_User1',
@@ -639,6 +654,447 @@ class TestTools():
         assert len(conflicts) == 1
         assert 'umass.edu' in conflicts
 
+    def test_parallel_get(self):
+
+        objects = [openreview.api.Edge(id=f'edge{i:05d}', head='head', tail=f'tail{i}', invitation='Venue/-/Affinity_Score') for i in range(2537)]
+        requests = []
+
+        def get_with_cursor(invitation=None, sort=None, limit=None, offset=None, after=None, with_count=False):
+            requests.append({ 'offset': offset, 'after': after })
+            assert sort == 'id'
+            start = [o.id for o in objects].index(after) + 1 if after else (offset or 0)
+            page = objects[start:start + limit]
+            if with_count and offset is None:
+                return page, len(objects)
+            return page
+
+        def get_with_offset(invitation=None, limit=None, offset=None, with_count=False):
+            page = objects[(offset or 0):(offset or 0) + limit]
+            if with_count and offset is None:
+                return page, len(objects)
+            return page
+
+        assert openreview.tools.parallel_get(get_with_cursor, invitation='Venue/-/Affinity_Score', page_size=100, workers=4) == objects
+        assert len([r for r in requests if r['after'] is None]) == 4
+        assert len(requests) == 26
+
+        assert openreview.tools.parallel_get(get_with_cursor, page_size=100, workers=4, offset=150, limit=1000) == objects[150:1150]
+        assert openreview.tools.parallel_get(get_with_cursor, page_size=100, workers=4, offset=3000) == []
+        assert openreview.tools.parallel_get(get_with_cursor, page_size=5000, workers=4) == objects
+        assert openreview.tools.parallel_get(get_with_offset, page_size=100, workers=3) == objects
+        assert openreview.tools.parallel_get(get_with_offset, page_size=100, workers=3, offset=10, limit=95) == objects[10:105]
+
+    def test_iter_all(self):
+
+        objects = [openreview.api.Note(id=f'note{i:04d}', content={}) for i in range(250)]
+        requests = []
+
+        def get_with_cursor(invitation=None, sort=None, limit=None, offset=None, after=None, with_count=False):
+            requests.append(after)
+            start = [o.id for o in objects].index(after) + 1 if after else (offset or 0)
+            return objects[start:start + limit]
+
+        def get_with_offset(invitation=None, limit=None, offset=None, with_count=False):
+            return objects[offset:offset + limit]
+
+        iterator = openreview.tools.iter_all(get_with_cursor, page_size=100, invitation='Venue/-/Submission')
+        assert next(iterator).id == 'note0000'
+        assert requests == [None]
+        assert list(iterator) == objects[1:]
+        assert requests == [None, 'note0099', 'note0199']
+
+        assert list(openreview.tools.iter_all(get_with_cursor, prefetch=True, page_size=100)) == objects
+        assert list(openreview.tools.iter_all(get_with_cursor, prefetch=True, page_size=50)) == objects
+        assert list(openreview.tools.iter_all(get_with_offset, prefetch=True, page_size=100)) == objects
+        assert list(openreview.tools.iter_all(get_with_offset, page_size=1000)) == objects
+
+    def test_post_bulk_edges_stream(self, tmp_path, fake_servers):
+
+        score_file = tmp_path / 'scores.csv'
+        score_file.write_text('paper1,~Reviewer_One1,0.5\n\npaper2,~Reviewer_One1,0.25\npaper3,~Reviewer_Two1,1.0\n')
+        rows = list(openreview.tools.iter_score_rows(score_file=str(score_file)))
+        assert rows == [['paper1', '~Reviewer_One1', '0.5'], ['paper2', '~Reviewer_One1', '0.25'], ['paper3', '~Reviewer_Two1', '1.0']]
+        assert list(openreview.tools.iter_score_rows(scores_stream=score_file.read_bytes())) == rows
+
+        ## The rows can be read again and a change of the input changes the fingerprint
+        scores = openreview.tools.ScoreRows(score_file=str(score_file))
+        assert list(scores) == rows
+        assert list(scores) == rows
+        fingerprint = scores.fingerprint
+        assert openreview.tools.ScoreRows(scores_stream=score_file.read_bytes()).fingerprint == openreview.tools.ScoreRows(scores_stream=score_file.read_bytes()).fingerprint
+        assert openreview.tools.ScoreRows(rows=rows).fingerprint == openreview.tools.hash_rows(rows)
+        score_file.write_text('paper1,~Reviewer_One1,0.5\npaper2,~Reviewer_One1,0.25\n')
+        assert scores.fingerprint != fingerprint
+        score_file.write_text('paper1,~Reviewer_One1,0.5\n\npaper2,~Reviewer_One1,0.25\npaper3,~Reviewer_Two1,1.0\n')
+
+        ## The rows without a numeric score are skipped by the score builders
+        assert [openreview.tools.get_row_score(row) for row in [['paper1', '~Reviewer_One1', '0.123456'], ['paper1', '~Reviewer_One1', -1], ['submission', 'user', 'score'], ['paper2', '~Reviewer_One1']]] == [0.1235, 0, None, None]
+
+        server = fake_servers.server
+        client = fake_servers.client()
+        template = openreview.api.EdgeBatch(invitation='Venue/Reviewers/-/Affinity_Score', readers=['Venue', openreview.api.EdgeBatch.TAIL], writers=['Venue'], signatures=['Venue'])
+        assert openreview.tools.post_bulk_edges_stream(client, ((row[0], row[1], float(row[2])) for row in rows), template=template, batch_size=2) == 3
+        assert server.request_counts == { 'POST /edges/bulk': 2 }
+        assert [(edge['head'], edge['tail'], edge['readers'], edge['weight']) for edge in server.edges.values()] == [('paper1', '~Reviewer_One1', ['Venue', '~Reviewer_One1'], 0.5), ('paper2', '~Reviewer_One1', ['Venue', '~Reviewer_One1'], 0.25), ('paper3', '~Reviewer_Two1', ['Venue', '~Reviewer_Two1'], 1.0)]
+        assert len(template) == 0
+
+        server.reset_counts()
+        edges = (openreview.api.Edge(invitation='Venue/Reviewers/-/Bid', head=row[0], tail=row[1], label='High', readers=['Venue'], writers=['Venue'], signatures=['Venue']) for row in rows)
+        assert openreview.tools.post_bulk_edges_stream(client, edges, batch_size=5) == 3
+        assert server.request_counts == { 'POST /edges/bulk': 1 }
+        assert len(server.edges) == 6
+
+    def test_bulk_edge_uploader(self, tmp_path, fake_servers):
+
+        server = fake_servers.server
+        client = fake_servers.client()
+
+        def get_edges(invitation_id):
+            return [openreview.api.Edge(invitation=invitation_id, head='paper1', tail=f'~User_{i}', readers=['Venue'], writers=['Venue'], signatures=['Venue']) for i in range(1000)]
+
+        def get_posted_tails(invitation_id):
+            return [edge['tail'] for edge in server.edges.values() if edge['invitation'] == invitation_id]
+
+        ## The latency function measures the number of requests in flight
+        lock = threading.Lock()
+        in_flight = { 'current': 0, 'max': 0 }
+        def latency(method, path):
+            with lock:
+                in_flight['current'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            time.sleep(0.01)
+            with lock:
+                in_flight['current'] -= 1
+            return 0
+        server.latency = latency
+
+        edges = get_edges('Venue/-/Conflict')
+        server.fail_requests('POST /edges/bulk', calls=[2])
+        uploader = openreview.tools.BulkEdgeUploader(client, batch_size=100, max_in_flight=3, backoff=0)
+        assert [edge.tail for edge in uploader.upload(edges, return_edges=True)] == [edge.tail for edge in edges]
+        assert sorted(get_posted_tails('Venue/-/Conflict')) == sorted(edge.tail for edge in edges)
+        assert in_flight['max'] <= 3
+        assert uploader.retried == 1
+        assert uploader.requests == 11
+        assert server.request_counts == { 'POST /edges/bulk': 11 }
+
+        ## post_bulk_edges posts one batch at a time
+        server.reset_counts()
+        server.fail_requests('POST /edges/bulk', calls=[])
+        in_flight['max'] = 0
+        edges = get_edges('Venue/-/Custom_Max_Papers')
+        assert len(openreview.tools.post_bulk_edges(client, edges, batch_size=100)) == 1000
+        assert in_flight['max'] == 1
+        assert server.request_counts == { 'POST /edges/bulk': 10 }
+        server.latency = 0
+
+        ## A 4xx response is not retried
+        server.reset_counts()
+        server.fail_requests('POST /edges/bulk', status=400, calls=[1])
+        uploader = openreview.tools.BulkEdgeUploader(client, batch_size=100, backoff=0)
+        with pytest.raises(openreview.OpenReviewException):
+            uploader.upload(get_edges('Venue/-/Aggregate_Score'))
+        assert uploader.requests == 1
+        assert uploader.retried == 0
+        assert server.request_counts == { 'POST /edges/bulk': 1 }
+
+        ## A batch applied by a request that failed is not posted again, the first and last edges of every batch are counted before it is posted
+        server.reset_counts()
+        server.fail_requests('POST /edges/bulk', status=504, calls=[2], applied=True)
+        edges = get_edges('Venue/-/Affinity_Score')
+        uploader = openreview.tools.BulkEdgeUploader(client, batch_size=100, max_in_flight=2, backoff=0, check_applied=True)
+        assert uploader.upload(edges) == 1000
+        assert sorted(get_posted_tails('Venue/-/Affinity_Score')) == sorted(edge.tail for edge in edges)
+        assert uploader.requests == 10
+        assert uploader.retried == 0
+        assert server.request_counts == { 'POST /edges/bulk': 10, 'GET /edges/count': 22 }
+
+        ## The edges of a cleared invitation are only counted after a failed request
+        server.reset_counts()
+        server.fail_requests('POST /edges/bulk', calls=[2])
+        edges = get_edges('Venue/-/TPMS_Score')
+        uploader = openreview.tools.BulkEdgeUploader(client, batch_size=100, backoff=0, check_applied=True, cleared=True)
+        assert uploader.upload(edges) == 1000
+        assert get_posted_tails('Venue/-/TPMS_Score') == [edge.tail for edge in edges]
+        assert uploader.retried == 1
+        assert server.request_counts == { 'POST /edges/bulk': 11, 'GET /edges/count': 2 }
+
+        ## Slow batches reduce the batch size
+        server.reset_counts()
+        server.fail_requests('POST /edges/bulk', calls=[])
+        server.latency = 0.05
+        uploader = openreview.tools.BulkEdgeUploader(client, batch_size=200, min_batch_size=50, target_latency=0.01)
+        assert uploader.upload(get_edges('Venue/-/Bid')) == 1000
+        assert uploader.batch_size == 50
+        assert server.request_counts == { 'POST /edges/bulk': uploader.requests }
+        server.latency = 0
+
+        ## An interrupted upload resumes after the acknowledged edges
+        server.reset_counts()
+        server.fail_requests('POST /edges/bulk', calls=[4, 5])
+        checkpoint = str(tmp_path / 'conflicts.checkpoint')
+        edges = get_edges('Venue/-/Proposed_Assignment')
+        uploader = openreview.tools.BulkEdgeUploader(client, batch_size=100, retries=1, backoff=0, checkpoint=checkpoint, checkpoint_key='Venue/-/Proposed_Assignment')
+        with pytest.raises(openreview.OpenReviewException):
+            uploader.upload(iter(edges))
+        assert uploader.resume_offset() == 300
+        assert openreview.tools.BulkEdgeUploader(client, checkpoint=checkpoint, checkpoint_key='Venue/-/Affinity_Score').resume_offset() == 0
+
+        server.fail_requests('POST /edges/bulk', calls=[])
+        assert uploader.upload(iter(edges)) == 700
+        assert get_posted_tails('Venue/-/Proposed_Assignment') == [edge.tail for edge in edges]
+        assert not os.path.exists(checkpoint)
+        assert server.request_counts == { 'POST /edges/bulk': 12 }
+
+    def test_message_batch(self, fake_servers):
+
+        server = fake_servers.server
+        client = fake_servers.client()
+        with openreview.api.MessageBatch(client, max_workers=2) as messages:
+            messages.add(subject='Reminder', recipients=['~User_One1'], message='You are late', replyTo='pc@mail.com')
+            messages.add(subject='Reminder', recipients=['~User_Two1', '~User_One1'], message='You are late', replyTo='pc@mail.com')
+            messages.add(subject='Reminder', recipients=['~User_Three1'], message='You are late', ignoreRecipients=['~User_Three1'])
+            messages.add(subject='Comment', recipients=['Venue/Submission1/Authors'], message='New comment')
+            assert len(messages) == 3
+        assert sorted((message['subject'], message['groups'], message['ignoreGroups']) for message in server.messages) == [('Comment', ['Venue/Submission1/Authors'], None), ('Reminder', ['~User_One1', '~User_Two1'], None), ('Reminder', ['~User_Three1'], ['~User_Three1'])]
+        assert server.request_counts == { 'POST /messages': 3 }
+        assert len(messages) == 0
+        assert len(messages.responses) == 3
+
+        server.reset_counts()
+        server.messages.clear()
+        server.fail_requests('POST /messages', match=lambda body: 'fail' in body['subject'])
+        messages = openreview.api.MessageBatch(client)
+        messages.add(subject='Reminder', recipients=['~User_One1'], message='You are late')
+        messages.add(subject='Reminder that will fail', recipients=['~User_Two1'], message='You are late')
+        with pytest.raises(openreview.OpenReviewException, match='1 of 2 messages failed'):
+            messages.send()
+        assert [(message['subject'], message['groups']) for message in server.messages] == [('Reminder', ['~User_One1'])]
+        assert server.request_counts == { 'POST /messages': 2 }
+        assert messages.errors[0][0]['recipients'] == ['~User_Two1']
+
+    def test_process_context(self, fake_servers):
+
+        server = fake_servers.server
+        server.add_groups([{ 'id': group_id, 'content': { 'submission_name': { 'value': 'Submission' } } } for group_id in ['Venue', 'Venue/Submission1/Reviewers', 'Venue/Submission1/Reviewer_ABC', 'Venue/Submission1/Reviewer_XYZ', 'Venue/Submission10/Reviewers']])
+        server.add_invitations([{ 'id': 'Venue/-/Submission' }])
+
+        context = openreview.tools.ProcessContext(fake_servers.client(), 'Venue')
+        assert context.get_content_value('submission_name') == 'Submission'
+        assert context.domain.id == 'Venue'
+        context.prefetch_groups('Venue/Submission1/')
+        assert context.get_group('Venue/Submission1/Reviewers').id == 'Venue/Submission1/Reviewers'
+        assert context.get_group('Venue/Submission1/Area_Chairs') is None
+        assert [group.id for group in context.get_groups('Venue/Submission1/Reviewer_')] == ['Venue/Submission1/Reviewer_ABC', 'Venue/Submission1/Reviewer_XYZ']
+        assert context.get_group('Venue/Program_Committee') is None
+        assert context.get_group('Venue/Program_Committee') is None
+        assert context.get_invitation('Venue/-/Submission').id == 'Venue/-/Submission'
+        assert context.get_invitation('Venue/-/Submission').id == 'Venue/-/Submission'
+        ## The domain, the prefetched groups and the group that was not found are requested once
+        assert server.request_counts == { 'GET /groups': 3, 'GET /invitations': 1 }
+
+    def test_edit_template_diff(self, fake_servers):
+
+        invitation = openreview.api.Invitation(id='Venue/-/Official_Review', domain='Venue', edit={
+            'content': { 'noteNumber': {}, 'noteId': {}, 'noteReaders': {} },
+            'invitation': {
+                'id': 'Venue/Submission${2/content/noteNumber/value}/-/Official_Review',
+                'invitees': ['Venue', 'Venue/Submission${3/content/noteNumber/value}/Reviewers'],
+                'duedate': 2000,
+                'edit': {
+                    'readers': ['${2/note/readers}'],
+                    'note': {
+                        'forum': '${4/content/noteId/value}',
+                        'readers': ['${5/content/noteReaders/value}'],
+                        'signatures': ['${3/signatures}']
+                    }
+                }
+            }
+        })
+
+        def get_content(number):
+            return { 'noteNumber': { 'value': number }, 'noteId': { 'value': f'id{number}' }, 'noteReaders': { 'value': ['Venue', f'Venue/Submission{number}/Reviewers'] } }
+
+        expected = openreview.tools.resolve_edit_template(invitation.edit['invitation'], get_content(1))
+        assert expected == {
+            'id': 'Venue/Submission1/-/Official_Review',
+            'invitees': ['Venue', 'Venue/Submission1/Reviewers'],
+            'duedate': 2000,
+            'edit': {
+                'readers': ['${2/note/readers}'],
+                'note': { 'forum': 'id1', 'readers': ['Venue', 'Venue/Submission1/Reviewers'], 'signatures': ['${3/signatures}'] }
+            }
+        }
+
+        server = fake_servers.server
+        server.add_invitations([invitation])
+        children = [dict(openreview.tools.resolve_edit_template(invitation.edit['invitation'], get_content(number)), invitations=[invitation.id]) for number in [1, 2]]
+        children[1]['duedate'] = 1000
+        ## Edits are merged into the child, a date that the template doesn't set is kept and is not a change
+        children[0]['expdate'] = 3000
+        server.add_invitations(children)
+
+        children_diff = openreview.tools.EditTemplateDiff(fake_servers.client(), invitation)
+        diff = children_diff.apply([get_content(number) for number in [1, 2, 3]], dry_run=True)
+        assert [entry['id'] for entry in diff['unchanged']] == ['Venue/Submission1/-/Official_Review']
+        assert [entry['id'] for entry in diff['update']] == ['Venue/Submission2/-/Official_Review']
+        assert diff['update'][0]['changes'] == { 'duedate': (1000, 2000) }
+        assert [entry['position'] for entry in diff['create']] == [2]
+        assert server.request_counts == { 'GET /invitations': 1 }
+
+        diff = children_diff.apply([get_content(number) for number in [1, 2, 3]])
+        assert server.request_counts == { 'GET /invitations': 1, 'POST /invitations/edits': 2 }
+        assert diff['create'][0]['edit']['invitation']['id'] == 'Venue/Submission3/-/Official_Review'
+        assert server.invitations['Venue/Submission2/-/Official_Review']['duedate'] == 2000
+        assert server.invitations['Venue/Submission3/-/Official_Review']['invitees'] == ['Venue', 'Venue/Submission3/Reviewers']
+
+    def test_profile_cache(self, tmp_path):
+
+        cache = openreview.tools.ProfileCache(str(tmp_path / 'profiles.sqlite'), ttl=3600, max_size=2)
+        profile = openreview.Profile(id='~Cached_User1', tmdate=1600000000000, content={
+            'names': [{ 'fullname': 'Cached User', 'username': '~Cached_User1' }, { 'fullname': 'C User', 'username': '~C_User1' }],
+            'emails': ['cached@mail.com'],
+            'emailsConfirmed': ['cached@mail.com'],
+            'publications': [openreview.api.Note(id='paper1')]
+        })
+        cache.put_profiles([profile])
+
+        profiles = cache.get_profiles(['~Cached_User1', '~C_User1', 'cached@mail.com', '~Missing_User1'])
+        assert set(profiles.keys()) == { '~Cached_User1', '~C_User1', 'cached@mail.com' }
+        assert profiles['~C_User1'].id == '~Cached_User1'
+        assert profiles['~C_User1'].tmdate == 1600000000000
+        assert 'publications' not in profiles['~C_User1'].content
+        assert cache.stats() == { 'hits': 3, 'misses': 1, 'stale': 0, 'profiles': 1, 'publications': 0 }
+
+        cache.put_publications([profile], { '~Cached_User1': [openreview.api.Note(id='paper1', pdate=1600000000000), openreview.Note(id='paper2', invitation='Venue/-/Submission', readers=['everyone'], writers=['Venue'], signatures=['Venue'], content={ 'title': 'Paper 2' })] })
+        publications = cache.get_publications([profile])['~Cached_User1']
+        assert isinstance(publications[0], openreview.api.Note)
+        assert publications[0].pdate == 1600000000000
+        assert isinstance(publications[1], openreview.Note)
+        assert publications[1].invitation == 'Venue/-/Submission'
+
+        ## The entries of another scope are not returned
+        assert cache.get_profiles(['~Cached_User1'], scope='https://api2.openreview.net|~Other_User1') == {}
+        assert cache.get_publications([profile], scope='https://api2.openreview.net|~Other_User1') == {}
+
+        ## The publications are stale when the server returns a newer profile
+        updated_profile = openreview.Profile(id='~Cached_User1', tmdate=1700000000000, content={ 'names': [{ 'fullname': 'Cached User', 'username': '~Cached_User1' }], 'emails': [], 'emailsConfirmed': [] })
+        assert cache.get_publications([updated_profile]) == {}
+        cache.put_profiles([updated_profile])
+        assert cache.get_profiles(['~Cached_User1'])['~Cached_User1'].tmdate == 1700000000000
+        assert cache.get_publications([profile]) == {}
+        cache.hits = cache.misses = cache.stale = 0
+
+        ## Stale entries are not returned
+        cache.ttl = -1
+        assert cache.get_profiles(['~Cached_User1']) == {}
+        assert cache.stats()['stale'] == 1
+
+        ## Stale entries and the oldest entries over max_size are evicted
+        cache.evict()
+        assert cache.stats()['profiles'] == 0
+        assert cache.stats()['publications'] == 0
+        cache.ttl = 3600
+        cache.put_profiles([openreview.Profile(id=f'~User_Number{i}', content={ 'names': [] }) for i in range(5)])
+        assert cache.stats()['profiles'] == 2
+
+        ## The cache is persistent
+        cache = openreview.tools.ProfileCache(str(tmp_path / 'profiles.sqlite'))
+        assert cache.stats() == { 'hits': 0, 'misses': 0, 'stale': 0, 'profiles': 2, 'publications': 0 }
+
+        cache.clear()
+        assert cache.stats()['profiles'] == 0
+
+    def test_conflict_index(self):
+
+        def build_profile(id, emails, domain, relations=[], publications=[]):
+            return openreview.Profile(
+                id = id,
+                content = {
+                    'emails': emails,
+                    'history': [{ 'institution': { 'domain': domain } }],
+                    'relations': [{ 'username': relation, 'relation': 'Coauthor' } for relation in relations],
+                    'publications': [openreview.api.Note(id=publication, pdate=1600000000000) for publication in publications]
+                }
+            )
+
+        users = [
+            build_profile('~User_One1', ['one@umass.edu'], 'umass.edu'),
+            build_profile('~User_Two1', ['two@mit.edu'], 'mit.edu', relations=['~Author_One1']),
+            build_profile('~User_Three1', ['three@cmu.edu'], 'cmu.edu', publications=['paper1']),
+            build_profile('~User_Four1', ['four@gmail.com'], 'ox.ac.uk'),
+            build_profile('~User_Five1', ['five@stanford.edu'], 'stanford.edu')
+        ]
+        authors = [
+            build_profile('~Author_One1', ['author_one@cs.umass.edu'], 'cs.umass.edu', publications=['paper1']),
+            build_profile('~Author_Two1', ['author_two@gmail.com'], 'google.com', relations=['~User_Five1'])
+        ]
+
+        info_function = openreview.tools.info_function_builder(openreview.tools.get_profile_info)
+        users_info = [info_function(p) for p in users]
+        authors_info = [info_function(p) for p in authors]
+
+        index = openreview.tools.ConflictIndex(users_info)
+        assert len(index) == 5
+        conflicted = [info['id'] for info in index.find(authors_info)]
+        assert conflicted == ['~User_One1', '~User_Two1', '~User_Three1', '~User_Five1']
+        assert conflicted == [user.id for user in users if openreview.tools.get_conflicts(authors, user)]
+
+        index = openreview.tools.ConflictIndex(users_info, match_ids=False)
+        assert [info['id'] for info in index.find(authors_info)] == ['~User_One1', '~User_Three1']
+
+        assert openreview.tools.ConflictIndex(users_info).find([]) == []
+
+        authors_info_list = [authors_info, authors_info[:1], authors_info[1:], [], authors_info[::-1]]
+        positions = openreview.tools.search_conflicts(users_info, authors_info_list)
+        assert positions == [[0, 1, 2, 4], [0, 1, 2], [4], [], [0, 1, 2, 4]]
+        assert openreview.tools.search_conflicts(users_info, authors_info_list, workers=2) == positions
+        assert openreview.tools.search_conflicts(users_info, authors_info_list, workers=3) == positions
+        assert openreview.tools.search_conflicts(users_info, authors_info_list, match_ids=False, workers=2) == [[0, 2], [0, 2], [], [], [0, 2]]
+
+    def test_committee_conflict_index(self, tmp_path, monkeypatch):
+
+        from openreview.journal.assignment import CommitteeConflictIndex
+
+        def build_profile(id, email, domain, tmdate, publications=[]):
+            return openreview.Profile(id=id, tmdate=tmdate, content={
+                'emails': [email],
+                'history': [{ 'institution': { 'domain': domain } }],
+                'publications': [openreview.api.Note(id=publication, pdate=int(time.time() * 1000)) for publication in publications]
+            })
+
+        profiles = {
+            '~Reviewer_One1': build_profile('~Reviewer_One1', 'one@umass.edu', 'umass.edu', 1),
+            '~Reviewer_Two1': build_profile('~Reviewer_Two1', 'two@mit.edu', 'mit.edu', 1, publications=['paper1']),
+            '~Reviewer_Three1': build_profile('~Reviewer_Three1', 'three@cmu.edu', 'cmu.edu', 1)
+        }
+        requests = []
+        def get_profiles(client, ids, with_publications=False, with_relations=False):
+            if with_publications:
+                requests.append(sorted(ids))
+            return [profiles[id] for id in ids]
+        monkeypatch.setattr(openreview.tools, 'get_profiles', get_profiles)
+
+        authors = [build_profile('~Author_One1', 'author@cs.umass.edu', 'cs.umass.edu', 1, publications=['paper1'])]
+        path = str(tmp_path / 'reviewers.sqlite')
+        conflict_index = CommitteeConflictIndex(None, path=path)
+        conflict_index.refresh(['~Reviewer_One1', '~Reviewer_Two1'])
+        assert requests == [['~Reviewer_One1', '~Reviewer_Two1']]
+        conflicts = conflict_index.find_conflicts(authors)
+        assert conflicts == [(id, openreview.tools.get_conflicts(authors, profiles[id], policy='NeurIPS', n_years=3)) for id in ['~Reviewer_One1', '~Reviewer_Two1']]
+
+        ## Only new members and changed profiles are requested again, also after a restart
+        profiles['~Reviewer_One1'] = build_profile('~Reviewer_One1', 'one@stanford.edu', 'stanford.edu', 2)
+        conflict_index = CommitteeConflictIndex(None, path=path)
+        conflict_index.refresh(['~Reviewer_One1', '~Reviewer_Two1', '~Reviewer_Three1'])
+        assert requests[1] == ['~Reviewer_One1', '~Reviewer_Three1']
+        assert [id for id, conflicts in conflict_index.find_conflicts(authors)] == ['~Reviewer_Two1']
+
+        ## Removed members are not in the index
+        conflict_index.refresh(['~Reviewer_One1', '~Reviewer_Three1'])
+        assert requests[2:] == []
+        assert conflict_index.find_conflicts(authors) == []
+
     def test_group(self, client):
 
         assert openreview.tools.get_group(client, '~Super_User1')
@@ -668,6 +1124,20 @@ class TestTools():
         assert profiles['~Test_Name1'] is None
 
 
+    def test_get_profiles_with_publications(self, client, test_client):
+        baseurl_v1, baseurl_v2 = openreview.tools.get_base_urls(client)
+        client_v2 = openreview.api.OpenReviewClient(baseurl=baseurl_v2, token=client.token)
+        expected = client.get_all_notes(content={'authorids': '~SomeFirstName_User1'}) + client_v2.get_all_notes(content={'authorids': '~SomeFirstName_User1'})
+
+        stats = openreview.tools.RequestStats()
+        profiles = openreview.tools.get_profiles(client, ['~SomeFirstName_User1'], with_publications=True, request_stats=stats)
+        assert len(profiles) == 1
+        assert [p.id for p in profiles[0].content['publications']] == [p.id for p in expected]
+
+        summary = stats.summary()
+        assert summary['requests'] == 2
+        assert summary['total_seconds'] >= summary['max_seconds'] > 0
+
     def test_filter_by_publications(self, client, test_client):
         
         publications = [